@@ -0,0 +1,270 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import harvest_haven as hh
+
+# --- Benchmark Suite ---
+# Times the simulation core over grid sizes and fill ratios and writes the
+# results as JSON:
+#   {"meta": {...}, "results": {name: {"ops_per_sec", "peak_kib", "alloc_blocks"}}}
+# ops_per_sec is the best of several rounds, peak_kib the tracemalloc peak of
+# one extra traced round and alloc_blocks the memory blocks it left allocated.
+# Results are compared against --baseline (bench_baseline.json when it
+# exists); any benchmark slower than (1 - threshold) x its baseline is
+# reported and the script exits with status 1. --save-baseline stores the
+# run as the new baseline. Asking for a --threshold with no baseline to
+# compare against is an error (status 2), so a gate can't pass vacuously.
+ENGINES = ['object', 'array', 'scheduled']
+SIZES = [5, 100, 1000]
+FILLS = [0.1, 0.5, 1.0]
+BASELINE = 'bench_baseline.json'
+
+# --- Startup ---
+# Cold start, each timed in a fresh interpreter: importing the core, loading
+# the JSON save and a one-day headless game. None of them should pull in the
+# optional subsystems listed in HEAVY_MODULES. --startup times them against
+# --startup-budget (milliseconds for the slowest) and exits with status 1
+# when over budget or when a heavy module was loaded.
+STARTUP = {
+    'import': 'import harvest_haven',
+    'load_save': 'import harvest_haven as hh; hh.load_game("harvest_haven_save.json")',
+    'one_day': 'from harvest_haven_batch import run_game; run_game(0, days=1)',
+}
+HEAVY_MODULES = ['tkinter', 'numpy', 'multiprocessing', 'asyncio', 'argparse']
+STARTUP_BUDGET = 100.0
+STARTUP_PROBE = '''import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(m for m in {heavy!r} if m in sys.modules))
+'''
+
+
+def make_farm(engine, size):
+    from harvest_haven_batch import make_farm
+    return make_farm(size, engine)
+
+
+def filled_farm(engine, size, fill, seed=0):
+    rng = random.Random(seed)
+    farm = make_farm(engine, size)
+    crop_types = list(hh.CROP_TYPES)
+    for x in range(size):
+        for y in range(size):
+            if rng.random() < fill:
+                farm.plant(x, y, crop_types[(x + y) % len(crop_types)])
+    return farm
+
+
+def random_cells(size, count, seed=1):
+    rng = random.Random(seed)
+    return [(rng.randrange(size), rng.randrange(size)) for _ in range(count)]
+
+
+def benchmarks(sizes, fills, engines):
+    # Yields (name, setup, run, ops): setup() builds fresh state outside the
+    # timed section, run(state) performs `ops` operations
+    for engine in engines:
+        if engine != 'object':
+            try:
+                make_farm(engine, 1)
+            except ImportError:
+                continue
+        for size in sizes:
+            for fill in fills:
+                yield (f'advance_day/{engine}/{size}/{fill}',
+                       lambda e=engine, s=size, f=fill: filled_farm(e, s, f),
+                       lambda farm: [farm.advance_day(rain=day % 2 == 0) for day in range(5)], 5)
+            ops = min(size * size, 10000)
+            cells = random_cells(size, ops)
+            yield (f'plant/{engine}/{size}',
+                   lambda e=engine, s=size: make_farm(e, s),
+                   lambda farm, c=cells: [farm.plant(x, y, 'Wheat') for x, y in c], ops)
+            yield (f'water/{engine}/{size}',
+                   lambda e=engine, s=size: filled_farm(e, s, 1.0),
+                   lambda farm, c=cells: [farm.water(x, y) for x, y in c], ops)
+            yield (f'harvest/{engine}/{size}',
+                   lambda e=engine, s=size: _ripe_farm(e, s),
+                   lambda farm, c=cells: [farm.harvest(x, y) for x, y in c], ops)
+            yield (f'to_dict/{engine}/{size}',
+                   lambda e=engine, s=size: filled_farm(e, s, 0.5),
+                   lambda farm: farm.to_dict(), 1)
+            yield (f'from_dict/{engine}/{size}',
+                   lambda e=engine, s=size: (type(make_farm(e, 1)), filled_farm(e, s, 0.5).to_dict()),
+                   lambda state: state[0].from_dict(state[1]), 1)
+            for ext in ('json', 'hhsv'):
+                yield (f'save_game/{ext}/{engine}/{size}',
+                       lambda e=engine, s=size, x=ext: (hh.Player(), filled_farm(e, s, 0.5), _temp_path(x)),
+                       lambda state: _quiet(hh.save_game, *state), 1)
+                yield (f'load_game/{ext}/{engine}/{size}',
+                       lambda e=engine, s=size, x=ext: _saved(e, s, x),
+                       lambda state: _quiet(hh.load_game, *state), 1)
+
+
+def _ripe_farm(engine, size):
+    farm = filled_farm(engine, size, 1.0)
+    for x in range(size):
+        for y in range(size):
+            farm.water(x, y)
+            farm.water(x, y)
+            farm.fertilize(x, y)
+    for _ in range(5):
+        farm.advance_day()
+    return farm
+
+
+def _temp_path(ext):
+    return os.path.join(tempfile.gettempdir(), f'bench_harvest_haven.{ext}')
+
+
+def _saved(engine, size, ext):
+    farm = filled_farm(engine, size, 0.5)
+    path = _temp_path(ext)
+    _quiet(hh.save_game, hh.Player(), farm, path)
+    return path, type(farm)
+
+
+def _quiet(func, *args):
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        return func(*args)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def measure(setup, run, ops, min_time=0.2, max_rounds=5):
+    best = None
+    rounds = 0
+    spent = 0.0
+    while rounds < max_rounds and (rounds == 0 or spent < min_time):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        elapsed = time.perf_counter() - start
+        spent += elapsed
+        rounds += 1
+        best = elapsed if best is None else min(best, elapsed)
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    return {
+        'ops_per_sec': round(ops / best, 2) if best else None,
+        'peak_kib': round(peak / 1024, 1),
+        'alloc_blocks': blocks,
+    }
+
+
+def startup_time(code, runs=5):
+    # Best of `runs` fresh interpreters: (seconds, heavy modules loaded)
+    best, heavy = None, []
+    here = os.path.dirname(os.path.abspath(__file__))
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', STARTUP_PROBE.format(code=code, heavy=HEAVY_MODULES)],
+                             cwd=here, capture_output=True, text=True, check=True).stdout
+        elapsed, loaded = out.strip().splitlines()[-1].partition(' ')[::2]
+        best = float(elapsed) if best is None else min(best, float(elapsed))
+        heavy = loaded.split(',') if loaded else []
+    return best, heavy
+
+
+def check_startup(budget_ms=STARTUP_BUDGET, runs=5):
+    failures = 0
+    for name, code in STARTUP.items():
+        seconds, heavy = startup_time(code, runs)
+        status = 'ok' if seconds * 1000 <= budget_ms and not heavy else 'OVER BUDGET'
+        print(f'startup/{name:12} {seconds * 1000:8.1f} ms  (budget {budget_ms:g} ms) {status}'
+              + (f'  loaded {", ".join(heavy)}' if heavy else ''))
+        failures += status != 'ok'
+    return 1 if failures else 0
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get('ops_per_sec') or not result['ops_per_sec']:
+            continue
+        ratio = result['ops_per_sec'] / base['ops_per_sec']
+        if ratio < 1 - threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Harvest Haven simulation core.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--fills', type=float, nargs='+', default=FILLS)
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES)
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', default=BASELINE if os.path.exists(BASELINE) else None,
+                        help=f'baseline results file to compare against (default {BASELINE} if present)')
+    parser.add_argument('--save-baseline', action='store_true', help=f'also write the results to {BASELINE}')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='allowed fractional slowdown against the baseline (default 0.2)')
+    parser.add_argument('--startup', action='store_true', help='only time cold startup against the budget')
+    parser.add_argument('--startup-budget', type=float, default=STARTUP_BUDGET,
+                        help=f'cold startup budget in milliseconds (default {STARTUP_BUDGET:g})')
+    args = parser.parse_args(argv)
+    if args.startup:
+        return check_startup(args.startup_budget)
+    if not args.save_baseline and (args.baseline is None or not os.path.exists(args.baseline)):
+        missing = args.baseline or BASELINE
+        if args.threshold is not None:
+            print(f'error: --threshold needs a baseline, but {missing} does not exist; '
+                  'record one with --save-baseline', file=sys.stderr)
+            return 2
+        print(f'warning: no baseline ({missing}); results are not compared', file=sys.stderr)
+        args.baseline = None
+    threshold = 0.2 if args.threshold is None else args.threshold
+
+    results = {}
+    for name, setup, run, ops in benchmarks(args.sizes, args.fills, args.engines):
+        if args.filter not in name:
+            continue
+        results[name] = measure(setup, run, ops)
+        print(f"{name:40} {results[name]['ops_per_sec']:>14} ops/s "
+              f"{results[name]['peak_kib']:>12} KiB peak {results[name]['alloc_blocks']:>9} blocks")
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    for path in [args.output] + ([BASELINE] if args.save_baseline else []):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.baseline and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, threshold)
+        for name, ratio in regressions:
+            print(f'REGRESSION {name}: {ratio:.2f}x baseline')
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,49 +2,46 @@ import random
 import json
 import os
 
+from harvest_haven_catalog import load_catalog
+
 # --- Crop Types ---
-CROP_TYPES = {
-    'Wheat': {'grow_time': 3, 'water_needed': 1, 'fertilizer_needed': 0, 'sell_price': 5},
-    'Tomato': {'grow_time': 5, 'water_needed': 2, 'fertilizer_needed': 1, 'sell_price': 12},
-    'Carrot': {'grow_time': 4, 'water_needed': 1, 'fertilizer_needed': 1, 'sell_price': 8},
-}
+# Everything about the crops comes from the catalog file (crops.json by
+# default, see harvest_haven_catalog). CROP_TYPES, SHOP_ITEMS and
+# CROP_EMOJIS are name-keyed views of it for menus and policies; the
+# simulation and the renderer index CATALOG's lists by crop id.
+CATALOG = load_catalog()
+CROP_TYPES = CATALOG.crop_types()
 
 CROP_STAGES = ['Empty', 'Planted', 'Growing', 'Harvestable', 'Dead']
 
+# Shop items: (name, price in coins, quantity bought)
+SHOP_ITEMS = CATALOG.shop_items
+
 # Emoji mapping for crops and stages
-CROP_EMOJIS = {
-    'Wheat': {
-        1: '🌱',  # Planted
-        2: '🌾',  # Growing
-        3: '🥖',  # Harvestable (bread as a fun icon)
-        4: '💀',  # Dead
-    },
-    'Tomato': {
-        1: '🌱',
-        2: '🍅',
-        3: '🍅',
-        4: '💀',
-    },
-    'Carrot': {
-        1: '🌱',
-        2: '🥕',
-        3: '🥕',
-        4: '💀',
-    },
-    None: {0: '⬜'}  # Empty
-}
+CROP_EMOJIS = CATALOG.crop_emojis()
 
 # --- Crop Class ---
+# A crop stores its catalog id; `type` is the crop's name.
 class Crop:
+    __slots__ = ('type_id', 'stage', 'days_grown', 'watered', 'fertilized')
+
     def __init__(self, crop_type=None):
-        self.type = crop_type
+        self.type_id = CATALOG.ids[crop_type]
         self.stage = 0  # 0: Empty, 1: Planted, 2: Growing, 3: Harvestable, 4: Dead
         self.days_grown = 0
         self.watered = 0
         self.fertilized = 0
 
+    @property
+    def type(self):
+        return CATALOG.names[self.type_id]
+
+    @type.setter
+    def type(self, crop_type):
+        self.type_id = CATALOG.ids[crop_type]
+
     def plant(self, crop_type):
-        self.type = crop_type
+        self.type_id = CATALOG.ids[crop_type]
         self.stage = 1
         self.days_grown = 0
         self.watered = 0
@@ -56,13 +53,17 @@ class Crop:
         if rain:
             self.watered += 1
         self.days_grown += 1
+        self.update_stage()
+
+    def update_stage(self):
+        t = self.type_id
         # Check for death
-        if self.days_grown > CROP_TYPES[self.type]['grow_time'] + 2:
+        if self.days_grown >= CATALOG.death_day[t]:
             self.stage = 4  # Dead
         # Check for harvestable
-        elif self.days_grown >= CROP_TYPES[self.type]['grow_time']:
-            if self.watered >= CROP_TYPES[self.type]['water_needed'] and \
-               self.fertilized >= CROP_TYPES[self.type]['fertilizer_needed']:
+        elif self.days_grown >= CATALOG.grow_time[t]:
+            if self.watered >= CATALOG.water_needed[t] and \
+               self.fertilized >= CATALOG.fertilizer_needed[t]:
                 self.stage = 3  # Harvestable
             else:
                 self.stage = 2  # Still growing
@@ -81,7 +82,7 @@ class Crop:
         if self.stage == 3:
             self.stage = 0
             crop_type = self.type
-            self.type = None
+            self.type_id = 0
             return crop_type
         return None
 
@@ -97,35 +98,117 @@ class Crop:
     @classmethod
     def from_dict(cls, data):
         crop = cls()
-        crop.type = data['type']
+        crop.type_id = CATALOG.ids[data['type']]
         crop.stage = data['stage']
         crop.days_grown = data['days_grown']
         crop.watered = data['watered']
         crop.fertilized = data['fertilized']
         return crop
 
+# Every blank plot on every farm is this one shared, read-only Crop; Farm
+# swaps in a real Crop when something is planted there.
+class EmptyPlot(Crop):
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('EMPTY_PLOT is shared between cells; plant through Farm.plant')
+
+    def plant(self, crop_type):
+        raise AttributeError('EMPTY_PLOT is shared between cells; plant through Farm.plant')
+
+EMPTY_PLOT = object.__new__(EmptyPlot)
+for _field, _value in zip(Crop.__slots__, (0, 0, 0, 0, 0)):
+    object.__setattr__(EMPTY_PLOT, _field, _value)
+
+def crop_from_dict(data):
+    # Like Crop.from_dict, but blank plots come back as EMPTY_PLOT
+    if data['type'] is None and not (data['stage'] or data['days_grown'] or
+                                     data['watered'] or data['fertilized']):
+        return EMPTY_PLOT
+    return Crop.from_dict(data)
+
 # --- Farm Class ---
 class Farm:
     def __init__(self, size=5):
         self.size = size
-        self.grid = [[Crop() for _ in range(size)] for _ in range(size)]
+        self.grid = [[EMPTY_PLOT] * size for _ in range(size)]
+        self.listeners = []
+
+    # Listeners are called with a list of (x, y) cells after every change
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _notify(self, cells):
+        for listener in self.listeners:
+            listener(cells)
 
     def plant(self, x, y, crop_type):
-        self.grid[x][y].plant(crop_type)
+        crop = self.grid[x][y]
+        if crop is EMPTY_PLOT:
+            crop = self.grid[x][y] = Crop()
+        crop.plant(crop_type)
+        self._notify([(x, y)])
 
     def water(self, x, y):
         self.grid[x][y].water()
+        self._notify([(x, y)])
 
     def fertilize(self, x, y):
         self.grid[x][y].fertilize()
+        self._notify([(x, y)])
 
     def harvest(self, x, y):
-        return self.grid[x][y].harvest()
+        crop_type = self.grid[x][y].harvest()
+        if crop_type:
+            self._notify([(x, y)])
+        return crop_type
+
+    def kill(self, x, y):
+        # Pests only kill crops that are still Planted or Growing
+        if self.grid[x][y].stage in [1, 2]:
+            self.grid[x][y].stage = 4  # Dead
+            self._notify([(x, y)])
+
+    def set_cell(self, x, y, crop_data):
+        self.grid[x][y] = crop_from_dict(crop_data)
+        self._notify([(x, y)])
 
     def advance_day(self, rain=False):
-        for row in self.grid:
-            for crop in row:
-                crop.advance_day(rain=rain)
+        if not self.listeners:
+            for row in self.grid:
+                for crop in row:
+                    crop.advance_day(rain=rain)
+            return
+        changed = []
+        for i, row in enumerate(self.grid):
+            for j, crop in enumerate(row):
+                if crop.stage not in [0, 4]:
+                    crop.advance_day(rain=rain)
+                    changed.append((i, j))
+        if changed:
+            self._notify(changed)
+
+    def advance_days(self, n, weather_sequence=None):
+        # n days of weather at once, see fast_forward
+        advances, rains, pests = weather_prefix(n, weather_sequence)
+        changed = []
+        for i, row in enumerate(self.grid):
+            for j, crop in enumerate(row):
+                if crop.stage not in [0, 4]:
+                    k, killed = fast_forward(crop.type_id, crop.stage, crop.days_grown, crop.watered,
+                                             crop.fertilized, advances, rains, pests.get((i, j), ()))
+                    if k:
+                        crop.days_grown += k
+                        crop.watered += rains[k]
+                        crop.update_stage()
+                    if killed:
+                        crop.stage = 4  # Dead
+                    changed.append((i, j))
+        if changed and self.listeners:
+            self._notify(changed)
 
     def to_dict(self):
         return {
@@ -138,7 +221,24 @@ class Farm:
         farm = cls(size=data['size'])
         for i, row in enumerate(data['grid']):
             for j, crop_data in enumerate(row):
-                farm.grid[i][j] = Crop.from_dict(crop_data)
+                farm.grid[i][j] = crop_from_dict(crop_data)
+        return farm
+
+    @classmethod
+    def from_arrays(cls, size, type_names, fields):
+        # Build a farm from flat row-major field arrays (see harvest_haven_binary)
+        farm = cls(size=size)
+        type_ids = [CATALOG.ids[name] for name in type_names]
+        columns = zip(fields['type_id'], fields['stage'], fields['days_grown'],
+                      fields['watered'], fields['fertilized'])
+        for index, (t, s, d, w, f) in enumerate(columns):
+            if t or s or d or w or f:
+                crop = farm.grid[index // size][index % size] = Crop()
+                crop.type_id = type_ids[t]
+                crop.stage = int(s)
+                crop.days_grown = int(d)
+                crop.watered = int(w)
+                crop.fertilized = int(f)
         return farm
 
     def display(self):
@@ -154,34 +254,46 @@ class Player:
     def __init__(self):
         self.energy = 10
         self.coins = 20
-        self.inventory = {'Wheat': 3, 'Tomato': 1, 'Carrot': 1, 'Water': 10, 'Fertilizer': 2}
+        self.inventory = dict(CATALOG.starting_inventory)
         self.harvested = {}
 
     def can_plant(self, crop_type):
         return self.inventory.get(crop_type, 0) > 0
 
-    def use_seed(self, crop_type):
-        if self.can_plant(crop_type):
-            self.inventory[crop_type] -= 1
+    # The count arguments let bulk actions (harvest_haven_bulk) debit a
+    # whole batch at once
+    def use_seed(self, crop_type, count=1):
+        if self.inventory.get(crop_type, 0) >= count:
+            self.inventory[crop_type] -= count
             return True
         return False
 
-    def add_harvest(self, crop_type):
-        self.harvested[crop_type] = self.harvested.get(crop_type, 0) + 1
-        self.coins += CROP_TYPES[crop_type]['sell_price']
+    def add_harvest(self, crop_type, count=1):
+        self.harvested[crop_type] = self.harvested.get(crop_type, 0) + count
+        self.coins += CATALOG.sell_price[CATALOG.ids[crop_type]] * count
 
-    def use_water(self):
-        if self.inventory['Water'] > 0:
-            self.inventory['Water'] -= 1
+    def use_water(self, count=1):
+        if self.inventory['Water'] >= count:
+            self.inventory['Water'] -= count
             return True
         return False
 
-    def use_fertilizer(self):
-        if self.inventory['Fertilizer'] > 0:
-            self.inventory['Fertilizer'] -= 1
+    def use_fertilizer(self, count=1):
+        if self.inventory['Fertilizer'] >= count:
+            self.inventory['Fertilizer'] -= count
             return True
         return False
 
+    def buy(self, name, count=1):
+        for item, price, quantity in SHOP_ITEMS:
+            if item == name:
+                if self.coins < price * count:
+                    return False
+                self.inventory[name] = self.inventory.get(name, 0) + quantity * count
+                self.coins -= price * count
+                return True
+        return False
+
     def rest(self):
         self.energy = 10
 
@@ -202,42 +314,228 @@ class Player:
         player.harvested = data['harvested']
         return player
 
+# --- Weather and Events ---
+EVENTS = ['none', 'rain', 'drought', 'pests']
+
+EVENT_MESSAGES = {
+    'none': None,
+    'rain': 'It rained! All crops are watered.',
+    'drought': 'A drought! Crops need extra water today.',
+    'pests': 'Pests attacked! Some crops may not grow.',
+}
+
+# Each game owns an EventEngine with its own random.Random, so a seed fully
+# determines the weather and parallel games never share RNG state. Every
+# day's event is recorded as {'day': n, 'event': name} plus, for pests, the
+# attacked cells under 'pests'. A saved log can be loaded back to replay a
+# season exactly. Pass keep_log=False for very long runs that don't need
+# the log.
+class EventEngine:
+    def __init__(self, seed=None, replay=None, keep_log=True):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.replay = list(replay) if replay is not None else None
+        self.keep_log = keep_log
+        self.log = []
+        self.days = 0  # Days run so far
+
+    def next_event(self, size):
+        if self.replay is not None:
+            if self.days >= len(self.replay):
+                raise IndexError('Event log exhausted')
+            return self.replay[self.days]
+        record = {'day': self.days + 1, 'event': self.rng.choice(EVENTS)}
+        if record['event'] == 'pests':
+            high = max(size, 1) - 1
+            record['pests'] = [[self.rng.randint(0, high), self.rng.randint(0, high)]
+                               for _ in range(self.rng.randint(1, 3))]
+        return record
+
+    def run_day(self, farm):
+        record = self.next_event(farm.size)
+        apply_event(farm, record)
+        self.days += 1
+        if self.keep_log:
+            self.log.append(record)
+        return record
+
+    def run_days(self, farm, n):
+        # Same events and farm as n run_day calls, but the farm jumps to the
+        # end in one farm.advance_days
+        records = []
+        for _ in range(n):
+            records.append(self.next_event(farm.size))
+            self.days += 1
+        if self.keep_log:
+            self.log.extend(records)
+        farm.advance_days(n, records)
+        return records
+
+    def save_log(self, filename):
+        with open(filename, 'w') as f:
+            json.dump({'seed': self.seed, 'events': self.log}, f)
+
+    @classmethod
+    def load_log(cls, filename):
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        return cls(seed=data['seed'], replay=data['events'])
+
+def apply_event(farm, record):
+    # Drought and pest days don't advance growth
+    event = record['event']
+    if event == 'rain':
+        farm.advance_day(rain=True)
+    elif event == 'pests':
+        for x, y in record['pests']:
+            farm.kill(x, y)
+    elif event == 'none':
+        farm.advance_day()
+
+# --- Fast Forward ---
+# Crop.advance_day is a pure function of how many growth days (rain or
+# none) and rain days have passed: the stage after k growth days depends
+# only on days_grown + k, watered + rains and fertilized, and a dead crop
+# stops changing. advance_days uses that to jump n days at once: the
+# weather is reduced to prefix counts once, then every crop is updated in
+# O(1) plus the pest attacks that land on it.
+def weather_prefix(n, weather_sequence=None):
+    # Returns (advances, rains, pests): advances[j] is the number of growth
+    # days before day j (j = 0..n), rains[k] the number of rain days among
+    # the first k growth days, and pests maps (x, y) to the days pests land
+    # on it, in order. weather_sequence holds EventEngine records (or bare
+    # event names); without one every day is a plain growth day.
+    if weather_sequence is None:
+        return list(range(n + 1)), [0] * (n + 1), {}
+    weather_sequence = list(weather_sequence)[:n]
+    if len(weather_sequence) < n:
+        raise ValueError(f'Need {n} days of weather, got {len(weather_sequence)}')
+    advances = [0]
+    rains = [0]
+    pests = {}
+    for day, record in enumerate(weather_sequence):
+        event = record if isinstance(record, str) else record['event']
+        if event in ('rain', 'none'):
+            rains.append(rains[-1] + (event == 'rain'))
+        elif event == 'pests':
+            for x, y in record['pests']:
+                pests.setdefault((x, y), []).append(day)
+        advances.append(len(rains) - 1)
+    return advances, rains, pests
+
+def growing_after(type_id, stage, days_grown, watered, fertilized, k, rains):
+    # Whether a crop would be Planted or Growing (so pests can kill it)
+    # after k more growth days
+    if k == 0:
+        return stage in [1, 2]
+    days_grown += k
+    if days_grown >= CATALOG.death_day[type_id]:
+        return False
+    return not (days_grown >= CATALOG.grow_time[type_id] and
+                watered + rains[k] >= CATALOG.water_needed[type_id] and
+                fertilized >= CATALOG.fertilizer_needed[type_id])
+
+def fast_forward(type_id, stage, days_grown, watered, fertilized, advances, rains, pest_days=()):
+    # Returns the growth days the crop lives through and whether pests kill
+    # it at the end of them; call only for Planted/Growing/Harvestable crops
+    total = advances[-1]
+    # Growth stops on the death day
+    limit = min(total, max(CATALOG.death_day[type_id] - days_grown, 1))
+    for day in pest_days:
+        k = advances[day]
+        if k > limit:
+            break
+        if growing_after(type_id, stage, days_grown, watered, fertilized, k, rains):
+            return k, True
+    return limit, False
+
 # --- Game Functions ---
-def save_game(player, farm, filename='harvest_haven_save.json'):
-    with open(filename, 'w') as f:
-        json.dump({'player': player.to_dict(), 'farm': farm.to_dict()}, f)
+# Saves ending in .json are written as JSON, anything else uses the compact
+# binary format from harvest_haven_binary; a ChunkedFarm is saved as a
+# directory of chunk files (harvest_haven_chunked). load_game detects the
+# format.
+# The file is written next to the save and renamed over it, so a crash
+# mid-save leaves the previous save intact. `generation` ties the save to
+# its change journal (see harvest_haven_journal); a plain save drops the
+# journal because the full save already contains everything in it.
+def save_game(player, farm, filename='harvest_haven_save.json', format=None, generation=0):
+    if format is None and hasattr(farm, 'chunks'):
+        format = 'chunks'
+    if format is None:
+        format = 'json' if filename.endswith('.json') else 'binary'
+    if format == 'chunks':
+        import harvest_haven_chunked
+        harvest_haven_chunked.save_chunks(player, farm, filename, generation)
+        if not generation and os.path.exists(filename + '.journal'):
+            os.remove(filename + '.journal')
+        print('Game saved!')
+        return
+    tmp_filename = filename + '.tmp'
+    if format == 'binary':
+        import harvest_haven_binary
+        harvest_haven_binary.write_binary(player, farm, tmp_filename, generation)
+    else:
+        with open(tmp_filename, 'w') as f:
+            json.dump({'player': player.to_dict(), 'farm': farm.to_dict(), 'generation': generation}, f)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+    if not generation and os.path.exists(filename + '.journal'):
+        os.remove(filename + '.journal')
     print('Game saved!')
 
-def load_game(filename='harvest_haven_save.json'):
+def load_game(filename='harvest_haven_save.json', farm_cls=None):
     if not os.path.exists(filename):
         print('No save file found.')
         return None, None
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    player = Player.from_dict(data['player'])
-    farm = Farm.from_dict(data['farm'])
+    player, farm, _ = load_game_state(filename, farm_cls)
     print('Game loaded!')
     return player, farm
 
+# Like load_game, but also returns the save's journal generation. Pass
+# replay_journal=False to get the snapshot alone (SaveJournal replays it
+# itself to count the entries)
+def load_game_state(filename, farm_cls=None, replay_journal=True):
+    import harvest_haven_binary
+    import harvest_haven_chunked
+    if harvest_haven_chunked.is_chunk_save(filename):
+        player, farm = harvest_haven_chunked.load_chunks(filename)
+        generation = harvest_haven_chunked.read_generation(filename)
+    elif harvest_haven_binary.is_binary_save(filename):
+        player, farm = harvest_haven_binary.read_binary(filename, farm_cls)
+        generation = harvest_haven_binary.read_generation(filename)
+    else:
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        player = Player.from_dict(data['player'])
+        farm = (farm_cls or Farm).from_dict(data['farm'])
+        generation = data.get('generation', 0)
+    if replay_journal and generation and os.path.exists(filename + '.journal'):
+        import harvest_haven_journal
+        harvest_haven_journal.replay(filename + '.journal', player, farm, generation)
+    return player, farm, generation
+
+def emoji_for(crop_type, stage):
+    return CATALOG.emoji[CATALOG.ids.get(crop_type, 0)][stage]
+
 def get_crop_emoji(crop):
-    if crop.stage == 0 or crop.type is None:
-        return '⬜'
-    return CROP_EMOJIS.get(crop.type, {}).get(crop.stage, '⬜')
+    return CATALOG.emoji[crop.type_id][crop.stage]
 
 # --- Main Game Loop ---
-def main():
+def main(seed=None):
+    from harvest_haven_journal import SaveJournal
     print("Welcome to Harvest Haven!")
+    journal = SaveJournal('harvest_haven_save.json')
+    player, farm = None, None
     if os.path.exists('harvest_haven_save.json'):
         choice = input('Load previous game? (y/n): ').lower()
         if choice == 'y':
-            player, farm = load_game()
-            if player is None:
-                player, farm = Player(), Farm()
-        else:
-            player, farm = Player(), Farm()
-    else:
+            player, farm = journal.load()
+    if player is None:
         player, farm = Player(), Farm()
+        journal.attach(player, farm)
 
+    events = EventEngine(seed)
     day = 1
     while True:
         print(f"\n--- Day {day} ---")
@@ -246,21 +544,9 @@ def main():
         print(f"Inventory: {player.inventory}")
         print(f"Harvested: {player.harvested}")
         # Random event
-        event = random.choice(['none', 'rain', 'drought', 'pests'])
-        if event == 'rain':
-            print('It rained! All crops are watered.')
-            farm.advance_day(rain=True)
-        elif event == 'drought':
-            print('A drought! Crops need extra water today.')
-        elif event == 'pests':
-            print('Pests attacked! Some crops may not grow.')
-            # For simplicity, randomly kill a crop
-            for _ in range(random.randint(1, 3)):
-                x, y = random.randint(0, 4), random.randint(0, 4)
-                if farm.grid[x][y].stage in [1, 2]:
-                    farm.grid[x][y].stage = 4  # Dead
-        else:
-            farm.advance_day()
+        record = events.run_day(farm)
+        if EVENT_MESSAGES[record['event']]:
+            print(EVENT_MESSAGES[record['event']])
         # Player actions
         while player.energy > 0:
             print("\nActions: 1) Plant 2) Water 3) Fertilize 4) Harvest 5) Shop 6) Save 7) End Day 8) Quit")
@@ -305,37 +591,21 @@ def main():
                 else:
                     print("Nothing to harvest there.")
             elif action == '5':
-                print("Shop: 1) Wheat seed (2 coins) 2) Tomato seed (5 coins) 3) Carrot seed (3 coins) 4) Water (1 coin) 5) Fertilizer (2 coins)")
-                shop_choice = input("What do you want to buy? (1-5): ")
-                if shop_choice == '1' and player.coins >= 2:
-                    player.inventory['Wheat'] += 1
-                    player.coins -= 2
-                    print("Bought Wheat seed.")
-                elif shop_choice == '2' and player.coins >= 5:
-                    player.inventory['Tomato'] += 1
-                    player.coins -= 5
-                    print("Bought Tomato seed.")
-                elif shop_choice == '3' and player.coins >= 3:
-                    player.inventory['Carrot'] += 1
-                    player.coins -= 3
-                    print("Bought Carrot seed.")
-                elif shop_choice == '4' and player.coins >= 1:
-                    player.inventory['Water'] += 3
-                    player.coins -= 1
-                    print("Bought 3 Water.")
-                elif shop_choice == '5' and player.coins >= 2:
-                    player.inventory['Fertilizer'] += 1
-                    player.coins -= 2
-                    print("Bought Fertilizer.")
+                print("Shop: " + ' '.join(f"{i + 1}) {name} ({price} coins)" for i, (name, price, _) in enumerate(SHOP_ITEMS)))
+                shop_choice = input(f"What do you want to buy? (1-{len(SHOP_ITEMS)}): ")
+                if shop_choice.isdigit() and 1 <= int(shop_choice) <= len(SHOP_ITEMS) and \
+                   player.buy(SHOP_ITEMS[int(shop_choice) - 1][0]):
+                    name, _, quantity = SHOP_ITEMS[int(shop_choice) - 1]
+                    print(f"Bought {quantity} {name}.")
                 else:
                     print("Not enough coins or invalid choice.")
             elif action == '6':
-                save_game(player, farm)
+                journal.save()
             elif action == '7':
                 print("Ending day...")
                 break
             elif action == '8':
-                save_game(player, farm)
+                journal.save()
                 print("Goodbye!")
                 return
             else:
@@ -0,0 +1,320 @@
+import numpy as np
+import harvest_haven as hh
+
+# --- Crop Type Tables ---
+# Crop types are stored as the catalog's integer ids; id 0 is an empty plot.
+TYPE_NAMES = hh.CATALOG.names
+TYPE_IDS = hh.CATALOG.ids
+
+GROW_TIME = np.array(hh.CATALOG.grow_time, dtype=np.int32)
+DEATH_DAY = np.array(hh.CATALOG.death_day, dtype=np.int32)
+WATER_NEEDED = np.array(hh.CATALOG.water_needed, dtype=np.int32)
+FERTILIZER_NEEDED = np.array(hh.CATALOG.fertilizer_needed, dtype=np.int32)
+
+FIELDS = ('type_id', 'stage', 'days_grown', 'watered', 'fertilized')
+FIELD_DTYPES = {
+    'type_id': np.uint16,
+    'stage': np.uint8,
+    'days_grown': np.int32,
+    'watered': np.int32,
+    'fertilized': np.int32,
+}
+
+
+# --- Day Tick ---
+# Same rules as Crop.advance_day, applied to every active cell of the given
+# arrays at once. Works on whole grids or on row slices of them (see
+# harvest_haven_parallel); returns the mask of cells that were advanced.
+# rain may be a bool or a per-cell mask, and `where` limits the tick to a
+# mask of cells (see harvest_haven_spatial).
+def tick(type_id, stage, days_grown, watered, fertilized, rain=False, where=None):
+    active = (stage != 0) & (stage != 4)
+    if where is not None:
+        active &= where
+    if not active.any():
+        return active
+    if isinstance(rain, np.ndarray):
+        watered[active & rain] += 1
+    elif rain:
+        watered[active] += 1
+    days_grown[active] += 1
+    dead = active & (days_grown >= DEATH_DAY[type_id])
+    ready = active & ~dead & (days_grown >= GROW_TIME[type_id]) & \
+        (watered >= WATER_NEEDED[type_id]) & (fertilized >= FERTILIZER_NEEDED[type_id])
+    stage[active] = 2
+    stage[ready] = 3
+    stage[dead] = 4
+    return active
+
+
+# --- Cell Views ---
+# ArrayFarm.grid[x][y] returns a CellView so code written against Farm.grid
+# (get_crop_emoji, the pest logic, the UI) keeps working on the arrays.
+class CellView:
+    __slots__ = ('farm', 'x', 'y')
+
+    def __init__(self, farm, x, y):
+        self.farm = farm
+        self.x = x
+        self.y = y
+
+    @property
+    def type_id(self):
+        return int(self.farm.type_id[self.x, self.y])
+
+    @property
+    def type(self):
+        return TYPE_NAMES[self.farm.type_id[self.x, self.y]]
+
+    @type.setter
+    def type(self, value):
+        self.farm.type_id[self.x, self.y] = TYPE_IDS[value]
+
+    @property
+    def stage(self):
+        return int(self.farm.stage[self.x, self.y])
+
+    @stage.setter
+    def stage(self, value):
+        self.farm.stage[self.x, self.y] = value
+
+    @property
+    def days_grown(self):
+        return int(self.farm.days_grown[self.x, self.y])
+
+    @days_grown.setter
+    def days_grown(self, value):
+        self.farm.days_grown[self.x, self.y] = value
+
+    @property
+    def watered(self):
+        return int(self.farm.watered[self.x, self.y])
+
+    @watered.setter
+    def watered(self, value):
+        self.farm.watered[self.x, self.y] = value
+
+    @property
+    def fertilized(self):
+        return int(self.farm.fertilized[self.x, self.y])
+
+    @fertilized.setter
+    def fertilized(self, value):
+        self.farm.fertilized[self.x, self.y] = value
+
+    def plant(self, crop_type):
+        self.farm.plant(self.x, self.y, crop_type)
+
+    def water(self):
+        self.farm.water(self.x, self.y)
+
+    def fertilize(self):
+        self.farm.fertilize(self.x, self.y)
+
+    def harvest(self):
+        return self.farm.harvest(self.x, self.y)
+
+    def to_dict(self):
+        return {
+            'type': self.type,
+            'stage': self.stage,
+            'days_grown': self.days_grown,
+            'watered': self.watered,
+            'fertilized': self.fertilized
+        }
+
+
+class _RowView:
+    __slots__ = ('farm', 'x')
+
+    def __init__(self, farm, x):
+        self.farm = farm
+        self.x = x
+
+    def __len__(self):
+        return self.farm.size
+
+    def __getitem__(self, y):
+        if not -self.farm.size <= y < self.farm.size:
+            raise IndexError(y)
+        return CellView(self.farm, self.x, y % self.farm.size)
+
+    def __iter__(self):
+        for y in range(self.farm.size):
+            yield CellView(self.farm, self.x, y)
+
+
+class _GridView:
+    __slots__ = ('farm',)
+
+    def __init__(self, farm):
+        self.farm = farm
+
+    def __len__(self):
+        return self.farm.size
+
+    def __getitem__(self, x):
+        if not -self.farm.size <= x < self.farm.size:
+            raise IndexError(x)
+        return _RowView(self.farm, x % self.farm.size)
+
+    def __iter__(self):
+        for x in range(self.farm.size):
+            yield _RowView(self.farm, x)
+
+
+# --- ArrayFarm Class ---
+# Drop-in replacement for Farm that keeps every crop field in its own
+# size x size array (structure of arrays) and ticks the whole grid at once.
+class ArrayFarm:
+    def __init__(self, size=5):
+        self.size = size
+        for name in FIELDS:
+            setattr(self, name, np.zeros((size, size), dtype=FIELD_DTYPES[name]))
+        self.listeners = []
+
+    # Listeners are called with a list of (x, y) cells after every change
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _notify(self, cells):
+        for listener in self.listeners:
+            listener(cells)
+
+    @property
+    def grid(self):
+        return _GridView(self)
+
+    def plant(self, x, y, crop_type):
+        self.type_id[x, y] = TYPE_IDS[crop_type]
+        self.stage[x, y] = 1
+        self.days_grown[x, y] = 0
+        self.watered[x, y] = 0
+        self.fertilized[x, y] = 0
+        self._notify([(x, y)])
+
+    def water(self, x, y):
+        if self.stage[x, y] in (1, 2):
+            self.watered[x, y] += 1
+            self._notify([(x, y)])
+
+    def fertilize(self, x, y):
+        if self.stage[x, y] in (1, 2):
+            self.fertilized[x, y] += 1
+            self._notify([(x, y)])
+
+    def harvest(self, x, y):
+        if self.stage[x, y] == 3:
+            crop_type = TYPE_NAMES[self.type_id[x, y]]
+            self.stage[x, y] = 0
+            self.type_id[x, y] = 0
+            self._notify([(x, y)])
+            return crop_type
+        return None
+
+    def kill(self, x, y):
+        if self.stage[x, y] in (1, 2):
+            self.stage[x, y] = 4  # Dead
+            self._notify([(x, y)])
+
+    def set_cell(self, x, y, crop_data):
+        self.type_id[x, y] = TYPE_IDS[crop_data['type']]
+        self.stage[x, y] = crop_data['stage']
+        self.days_grown[x, y] = crop_data['days_grown']
+        self.watered[x, y] = crop_data['watered']
+        self.fertilized[x, y] = crop_data['fertilized']
+        self._notify([(x, y)])
+
+    def advance_day(self, rain=False):
+        active = tick(self.type_id, self.stage, self.days_grown, self.watered, self.fertilized, rain)
+        if self.listeners and active.any():
+            self._notify([tuple(cell) for cell in np.argwhere(active).tolist()])
+
+    def advance_days(self, n, weather_sequence=None):
+        # Vectorized hh.fast_forward: pest hits are resolved per cell first,
+        # then every active cell jumps to its last growth day at once
+        advances, rains, pests = hh.weather_prefix(n, weather_sequence)
+        active = (self.stage != 0) & (self.stage != 4)
+        if not active.any():
+            return
+        kills = {}
+        for (x, y), days in pests.items():
+            if active[x, y]:
+                k, killed = hh.fast_forward(int(self.type_id[x, y]), int(self.stage[x, y]),
+                                            int(self.days_grown[x, y]), int(self.watered[x, y]),
+                                            int(self.fertilized[x, y]), advances, rains, days)
+                if killed:
+                    kills[(x, y)] = k
+        limit = np.minimum(advances[-1], np.maximum(DEATH_DAY[self.type_id] - self.days_grown, 1))
+        for (x, y), k in kills.items():
+            limit[x, y] = k
+        grew = active & (limit > 0)
+        if grew.any():
+            self.days_grown[grew] += limit[grew]
+            self.watered[grew] += np.array(rains, dtype=np.int32)[limit[grew]]
+            t = self.type_id
+            dead = grew & (self.days_grown >= DEATH_DAY[t])
+            ready = grew & ~dead & (self.days_grown >= GROW_TIME[t]) & \
+                (self.watered >= WATER_NEEDED[t]) & (self.fertilized >= FERTILIZER_NEEDED[t])
+            self.stage[grew] = 2
+            self.stage[ready] = 3
+            self.stage[dead] = 4
+        for x, y in kills:
+            self.stage[x, y] = 4  # Dead
+        if self.listeners:
+            self._notify([tuple(cell) for cell in np.argwhere(active).tolist()])
+
+    def to_dict(self):
+        return {
+            'size': self.size,
+            'grid': [[{
+                'type': TYPE_NAMES[t],
+                'stage': s,
+                'days_grown': d,
+                'watered': w,
+                'fertilized': f
+            } for t, s, d, w, f in zip(*rows)] for rows in zip(
+                self.type_id.tolist(), self.stage.tolist(), self.days_grown.tolist(),
+                self.watered.tolist(), self.fertilized.tolist())]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        farm = cls(size=data['size'])
+        for i, row in enumerate(data['grid']):
+            for j, crop_data in enumerate(row):
+                farm.type_id[i, j] = TYPE_IDS[crop_data['type']]
+                farm.stage[i, j] = crop_data['stage']
+                farm.days_grown[i, j] = crop_data['days_grown']
+                farm.watered[i, j] = crop_data['watered']
+                farm.fertilized[i, j] = crop_data['fertilized']
+        return farm
+
+    @classmethod
+    def from_arrays(cls, size, type_names, fields):
+        # Adopts the arrays without copying when their dtypes already match
+        farm = cls.__new__(cls)
+        farm.size = size
+        farm.listeners = []
+        for name in FIELDS:
+            values = np.asarray(fields[name]).astype(FIELD_DTYPES[name], copy=False)
+            setattr(farm, name, values.reshape(size, size))
+        if list(type_names) != TYPE_NAMES:
+            lookup = np.array([TYPE_IDS[name] for name in type_names], dtype=FIELD_DTYPES['type_id'])
+            farm.type_id = lookup[farm.type_id]
+        return farm
+
+    @classmethod
+    def from_farm(cls, farm):
+        return cls.from_dict(farm.to_dict())
+
+    def to_farm(self):
+        return hh.Farm.from_dict(self.to_dict())
+
+    def display(self):
+        print("\nFarm Grid:")
+        for row in self.grid:
+            print(' '.join(hh.get_crop_emoji(crop) for crop in row))
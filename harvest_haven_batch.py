@@ -0,0 +1,231 @@
+import json
+import os
+import random
+import time
+
+import harvest_haven as hh
+
+# argparse, statistics and multiprocessing are imported where they are used,
+# so `import harvest_haven_batch` and a single run_game() start fast
+
+EVENTS = hh.EVENTS
+
+
+def make_farm(size=5, engine='object'):
+    if engine == 'array':
+        from harvest_haven_array import ArrayFarm
+        return ArrayFarm(size)
+    if engine == 'scheduled':
+        from harvest_haven_sched import ScheduledFarm
+        return ScheduledFarm(size)
+    if engine == 'parallel':
+        from harvest_haven_parallel import ParallelFarm
+        return ParallelFarm(size)
+    return hh.Farm(size)
+
+
+# --- Headless Game ---
+# A game without input(): the same rules as main(), driven by a policy.
+# Every action costs one energy and returns False when it could not be done.
+class HeadlessGame:
+    def __init__(self, seed=None, size=5, engine='object', replay=None, keep_log=True):
+        self.events = hh.EventEngine(seed, replay, keep_log)
+        # Policies get their own stream so they can't disturb the weather
+        self.rng = random.Random(seed)
+        self.player = hh.Player()
+        self.farm = make_farm(size, engine)
+        self.day = 1
+        self.energy_left = self.player.energy  # Energy at the end of the last day, before rest
+
+    def plant(self, x, y, crop_type):
+        if self.player.energy <= 0 or self.farm.grid[x][y].stage != 0:
+            return False
+        if crop_type not in hh.CROP_TYPES or not self.player.use_seed(crop_type):
+            return False
+        self.farm.plant(x, y, crop_type)
+        self.player.energy -= 1
+        return True
+
+    def water(self, x, y):
+        if self.player.energy <= 0 or not self.player.use_water():
+            return False
+        self.farm.water(x, y)
+        self.player.energy -= 1
+        return True
+
+    def fertilize(self, x, y):
+        if self.player.energy <= 0 or not self.player.use_fertilizer():
+            return False
+        self.farm.fertilize(x, y)
+        self.player.energy -= 1
+        return True
+
+    def harvest(self, x, y):
+        if self.player.energy <= 0:
+            return False
+        crop_type = self.farm.harvest(x, y)
+        if not crop_type:
+            return False
+        self.player.add_harvest(crop_type)
+        self.player.energy -= 1
+        return True
+
+    def buy(self, name):
+        return self.player.buy(name)
+
+    def play_day(self, policy):
+        event = self.events.run_day(self.farm)['event']
+        policy(self)
+        self.energy_left = self.player.energy
+        self.player.rest()
+        self.day += 1
+        return event
+
+
+# --- Policies ---
+# A policy is any picklable callable taking a HeadlessGame. It spends the
+# day's energy through the game's action methods.
+class GreedyPolicy:
+    def __init__(self, crops=None):
+        self.crops = list(crops or hh.CROP_TYPES)
+
+    def __call__(self, game):
+        farm, player = game.farm, game.player
+        cells = [(x, y) for x in range(farm.size) for y in range(farm.size)]
+        for x, y in cells:
+            if farm.grid[x][y].stage == 3:
+                game.harvest(x, y)
+        for x, y in cells:
+            crop = farm.grid[x][y]
+            if crop.stage in [1, 2]:
+                rules = hh.CROP_TYPES[crop.type]
+                if crop.watered < rules['water_needed']:
+                    game.water(x, y)
+                if crop.fertilized < rules['fertilizer_needed']:
+                    game.fertilize(x, y)
+        for crop_type in self.crops:
+            if player.inventory.get(crop_type, 0) == 0:
+                game.buy(crop_type)
+        if player.inventory['Water'] == 0:
+            game.buy('Water')
+        for x, y in cells:
+            if player.energy <= 0:
+                break
+            if farm.grid[x][y].stage == 0:
+                for crop_type in self.crops:
+                    if game.plant(x, y, crop_type):
+                        break
+
+
+class IdlePolicy:
+    def __call__(self, game):
+        pass
+
+
+# --- Batch Runner ---
+# Pass the 'event_log' of an earlier result as `replay` to rerun a season
+# with exactly the same weather
+def run_game(seed, days=30, policy=None, size=5, engine='object', replay=None, keep_log=False):
+    policy = policy or GreedyPolicy()
+    game = HeadlessGame(seed, size=size, engine=engine, replay=replay)
+    events = dict.fromkeys(EVENTS, 0)
+    for _ in range(days):
+        events[game.play_day(policy)] += 1
+    result = {
+        'seed': seed,
+        'coins': game.player.coins,
+        'harvested': dict(game.player.harvested),
+        'events': events,
+    }
+    if keep_log:
+        result['event_log'] = game.events.log
+    return result
+
+
+def _run_game_args(args):
+    return run_game(*args)
+
+
+def summarize(results):
+    import statistics
+    coins = [r['coins'] for r in results]
+    harvested = {}
+    for r in results:
+        for crop_type, count in r['harvested'].items():
+            harvested[crop_type] = harvested.get(crop_type, 0) + count
+    return {
+        'games': len(results),
+        'coins_mean': statistics.fmean(coins) if coins else 0,
+        'coins_stdev': statistics.pstdev(coins) if coins else 0,
+        'coins_min': min(coins, default=0),
+        'coins_max': max(coins, default=0),
+        'harvested_total': harvested,
+        'harvested_mean': {k: v / len(results) for k, v in harvested.items()},
+    }
+
+
+def run_batch(games, days=30, policy=None, size=5, engine='object', seed=0, workers=None):
+    # Run i is seeded with seed + i, so a batch gives the same results no
+    # matter how many workers it was split over. A ParallelFarm starts its
+    # own pool, which the batch pool's daemonic workers can't do, so the
+    # parallel engine runs its games one after another.
+    jobs = [(seed + i, days, policy, size, engine) for i in range(games)]
+    if engine == 'parallel':
+        if workers not in (None, 1):
+            raise ValueError('the parallel engine runs its own pool; use workers=1')
+        workers = 1
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or games < 2:
+        results = [_run_game_args(job) for job in jobs]
+    else:
+        from multiprocessing import Pool
+        chunksize = max(1, games // (workers * 4))
+        with Pool(workers) as pool:
+            results = list(pool.imap(_run_game_args, jobs, chunksize=chunksize))
+    return summarize(results)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Run headless Harvest Haven seasons.')
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--size', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--engine', choices=['object', 'array', 'scheduled', 'parallel'], default='object')
+    parser.add_argument('--policy', choices=['greedy', 'planner', 'idle'], default='greedy')
+    parser.add_argument('--profile', metavar='REPORT',
+                        help='run in one process under cProfile and write the stats report here')
+    parser.add_argument('--metrics', metavar='FILE',
+                        help='record hot-path metrics in one process; .prom for Prometheus text, else JSON lines')
+    args = parser.parse_args(argv)
+    if args.policy == 'planner':
+        from harvest_haven_planner import PlannedPolicy
+        policy = PlannedPolicy(args.days)
+    else:
+        policy = GreedyPolicy() if args.policy == 'greedy' else IdlePolicy()
+    workers = 1 if args.profile or args.metrics else args.workers
+    if args.metrics:
+        import harvest_haven_metrics
+        make_farm(1, args.engine)  # Import the engine module so it gets wrapped
+        harvest_haven_metrics.enable(harvest_haven_metrics.Metrics())
+    profiler = None
+    if args.profile:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.enable()
+    start = time.perf_counter()
+    summary = run_batch(args.games, args.days, policy, args.size, args.engine, args.seed, workers)
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    if profiler is not None:
+        profiler.disable()
+        with open(args.profile, 'w') as f:
+            pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(40)
+    if args.metrics:
+        harvest_haven_metrics.disable().write(args.metrics)
+    print(json.dumps(summary, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import harvest_haven as hh
+
+# --- Binary Save Format ---
+# Header (little-endian):
+#   magic 'HHSV', format version, journal generation (mod 2**16), farm size,
+#   length of the player JSON, length of the crop-type name table (JSON list)
+# followed by the player JSON, the name table, and then one fixed-width array
+# per crop field, each size*size cells in row-major order and 4-byte aligned.
+# Type id 0 is an empty plot; id i > 0 is names[i - 1]. Version 1 stored
+# type ids as one byte; version 2 uses two so catalogs can hold more than
+# 255 crops.
+MAGIC = b'HHSV'
+VERSION = 2
+HEADER = struct.Struct('<4sHHIII')
+
+# (field name, array typecode, numpy dtype)
+FIELDS = [
+    ('type_id', 'H', '<u2'),
+    ('stage', 'B', '<u1'),
+    ('days_grown', 'i', '<i4'),
+    ('watered', 'i', '<i4'),
+    ('fertilized', 'i', '<i4'),
+]
+VERSION_FIELDS = {1: [('type_id', 'B', '<u1')] + FIELDS[1:], 2: FIELDS}
+
+
+def _align(offset):
+    return (offset + 3) & ~3
+
+
+def is_binary_save(filename):
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def farm_arrays(farm):
+    # Flat row-major field arrays for any farm; ArrayFarm hands over its
+    # arrays directly, other farms are walked once.
+    if hasattr(farm, 'type_id'):
+        from harvest_haven_array import TYPE_NAMES
+        return TYPE_NAMES[1:], {name: getattr(farm, name).ravel() for name, _, _ in FIELDS}
+    fields = {name: array(code) for name, code, _ in FIELDS}
+    for row in farm.grid:
+        for crop in row:
+            fields['type_id'].append(crop.type_id)
+            fields['stage'].append(crop.stage)
+            fields['days_grown'].append(crop.days_grown)
+            fields['watered'].append(crop.watered)
+            fields['fertilized'].append(crop.fertilized)
+    return hh.CATALOG.names[1:], fields
+
+
+def _numpy():
+    # NumPy only if something already imported it (an ArrayFarm did), so
+    # saving or loading a plain Farm never pays for the import
+    return sys.modules.get('numpy')
+
+
+def _to_bytes(values, code, dtype):
+    np = _numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        return values.astype(dtype, copy=False).tobytes()
+    if not isinstance(values, array):
+        values = array(code, values)
+    if sys.byteorder == 'big' and values.itemsize > 1:
+        values = array(code, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_binary(player, farm, filename, generation=0):
+    names, fields = farm_arrays(farm)
+    player_bytes = json.dumps(player.to_dict()).encode('utf-8')
+    names_bytes = json.dumps(names).encode('utf-8')
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, generation & 0xFFFF, farm.size, len(player_bytes), len(names_bytes)))
+        f.write(player_bytes)
+        f.write(names_bytes)
+        offset = HEADER.size + len(player_bytes) + len(names_bytes)
+        for name, code, dtype in FIELDS:
+            f.write(b'\0' * (_align(offset) - offset))
+            data = _to_bytes(fields[name], code, dtype)
+            f.write(data)
+            offset = _align(offset) + len(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_generation(filename):
+    with open(filename, 'rb') as f:
+        return HEADER.unpack(f.read(HEADER.size))[2]
+
+
+def read_arrays(filename):
+    # Returns (player dict, size, names, {field: flat array}). With NumPy
+    # loaded the arrays are views over a copy-on-write mmap of the file, so nothing is
+    # read until it is touched and writes never reach the file.
+    with open(filename, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    magic, version, _, size, player_len, names_len = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError(f'{filename} is not a Harvest Haven binary save')
+    if version not in VERSION_FIELDS:
+        raise ValueError(f'Unsupported binary save version {version}')
+    offset = HEADER.size
+    player = json.loads(buf[offset:offset + player_len].decode('utf-8'))
+    offset += player_len
+    names = json.loads(buf[offset:offset + names_len].decode('utf-8'))
+    offset += names_len
+    count = size * size
+    fields = {}
+    np = _numpy()
+    for name, code, dtype in VERSION_FIELDS[version]:
+        offset = _align(offset)
+        if np is not None:
+            values = np.frombuffer(buf, dtype=dtype, count=count, offset=offset)
+            nbytes = values.nbytes
+        else:
+            values = array(code)
+            nbytes = values.itemsize * count
+            values.frombytes(buf[offset:offset + nbytes])
+            if sys.byteorder == 'big' and values.itemsize > 1:
+                values.byteswap()
+        fields[name] = values
+        offset += nbytes
+    return player, size, names, fields
+
+
+def read_binary(filename, farm_cls=None):
+    player_data, size, names, fields = read_arrays(filename)
+    farm_cls = farm_cls or hh.Farm
+    farm = farm_cls.from_arrays(size, [None] + names, fields)
+    return hh.Player.from_dict(player_data), farm
+
+
+def main(argv=None):
+    # Convert a save between formats: harvest_haven_binary.py SRC DST
+    # (DST ending in .json is written as JSON, anything else as binary)
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print('usage: harvest_haven_binary.py SRC DST')
+        return 2
+    player, farm = hh.load_game(args[0])
+    if player is None:
+        return 1
+    hh.save_game(player, farm, args[1])
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
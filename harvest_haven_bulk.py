@@ -0,0 +1,162 @@
+import harvest_haven as hh
+
+# --- Bulk Actions ---
+# Area versions of plant/water/fertilize/harvest. Each one picks the
+# eligible cells from a selection, caps the batch at what the player's
+# energy and inventory allow, debits the player once and returns a
+# per-cell result:
+#   {(x, y): 'planted' | 'watered' | 'fertilized' | 'harvested' |
+#            'not empty' | 'not growing' | 'not ready' |
+#            'no energy' | 'no seed' | 'no water' | 'no fertilizer' |
+#            'not a crop'}
+# ArrayFarm batches are applied with fancy indexing, other farms in a
+# tight loop over the farm methods.
+
+
+def select_cells(farm, rect=None, mask=None, cells=None):
+    # rect is (x0, y0, x1, y1) with the end exclusive; mask is a size x size
+    # grid of booleans (nested lists or a NumPy array); cells is an iterable
+    # of (x, y). With no arguments the whole farm is selected.
+    if cells is not None:
+        return list(dict.fromkeys((int(x), int(y)) for x, y in cells))
+    if mask is not None:
+        return [(x, y) for x, row in enumerate(mask) for y, selected in enumerate(row) if selected]
+    x0, y0, x1, y1 = rect if rect is not None else (0, 0, farm.size, farm.size)
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = min(x1, farm.size), min(y1, farm.size)
+    return [(x, y) for x in range(x0, x1) for y in range(y0, y1)]
+
+
+def summarize(results):
+    counts = {}
+    for status in results.values():
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def _is_array_farm(farm):
+    return hasattr(farm, 'type_id')
+
+
+def _stages(farm, cells):
+    if _is_array_farm(farm):
+        if not cells:
+            return []
+        xs, ys = zip(*cells)
+        return farm.stage[list(xs), list(ys)].tolist()
+    grid = farm.grid
+    return [grid[x][y].stage for x, y in cells]
+
+
+def _partition(farm, cells, eligible_stages, limit, ineligible, short):
+    # Split the selection into the cells to act on and the results for the
+    # rest; `limit` is how many cells the player can afford (energy can be
+    # negative, and a negative slice would count from the end)
+    limit = max(limit, 0)
+    results = {}
+    eligible = []
+    for cell, stage in zip(cells, _stages(farm, cells)):
+        if stage in eligible_stages:
+            eligible.append(cell)
+        else:
+            results[cell] = ineligible
+    for cell in eligible[limit:]:
+        results[cell] = short
+    return eligible[:limit], results
+
+
+def _columns(cells):
+    xs, ys = zip(*cells)
+    return list(xs), list(ys)
+
+
+def plant(player, farm, cells, crop_type):
+    if crop_type not in hh.CROP_TYPES:
+        return dict.fromkeys(cells, 'not a crop')
+    seeds = player.inventory.get(crop_type, 0)
+    limit = min(player.energy, seeds)
+    short = 'no energy' if player.energy <= seeds else 'no seed'
+    todo, results = _partition(farm, cells, (0,), limit, 'not empty', short)
+    if not todo:
+        return results
+    player.use_seed(crop_type, len(todo))
+    player.energy -= len(todo)
+    if _is_array_farm(farm):
+        from harvest_haven_array import TYPE_IDS
+        xs, ys = _columns(todo)
+        farm.type_id[xs, ys] = TYPE_IDS[crop_type]
+        farm.stage[xs, ys] = 1
+        farm.days_grown[xs, ys] = 0
+        farm.watered[xs, ys] = 0
+        farm.fertilized[xs, ys] = 0
+        farm._notify(todo)
+    else:
+        for x, y in todo:
+            farm.plant(x, y, crop_type)
+    results.update(dict.fromkeys(todo, 'planted'))
+    return results
+
+
+def _tend(player, farm, cells, item, field, done):
+    stock = player.inventory.get(item, 0)
+    limit = min(player.energy, stock)
+    short = 'no energy' if player.energy <= stock else f'no {item.lower()}'
+    todo, results = _partition(farm, cells, (1, 2), limit, 'not growing', short)
+    if not todo:
+        return results
+    player.inventory[item] -= len(todo)
+    player.energy -= len(todo)
+    if _is_array_farm(farm):
+        xs, ys = _columns(todo)
+        getattr(farm, field)[xs, ys] += 1
+        farm._notify(todo)
+    else:
+        action = farm.water if field == 'watered' else farm.fertilize
+        for x, y in todo:
+            action(x, y)
+    results.update(dict.fromkeys(todo, done))
+    return results
+
+
+def water(player, farm, cells):
+    return _tend(player, farm, cells, 'Water', 'watered', 'watered')
+
+
+def fertilize(player, farm, cells):
+    return _tend(player, farm, cells, 'Fertilizer', 'fertilized', 'fertilized')
+
+
+def harvest(player, farm, cells):
+    todo, results = _partition(farm, cells, (3,), player.energy, 'not ready', 'no energy')
+    if not todo:
+        return results
+    counts = {}
+    if _is_array_farm(farm):
+        from harvest_haven_array import TYPE_NAMES
+        xs, ys = _columns(todo)
+        for type_id in farm.type_id[xs, ys].tolist():
+            counts[TYPE_NAMES[type_id]] = counts.get(TYPE_NAMES[type_id], 0) + 1
+        farm.stage[xs, ys] = 0
+        farm.type_id[xs, ys] = 0
+        farm._notify(todo)
+    else:
+        for x, y in todo:
+            crop_type = farm.harvest(x, y)
+            counts[crop_type] = counts.get(crop_type, 0) + 1
+    player.energy -= len(todo)
+    for crop_type, count in counts.items():
+        player.add_harvest(crop_type, count)
+    results.update(dict.fromkeys(todo, 'harvested'))
+    return results
+
+
+def buy(player, name, count):
+    # Buys as many of `count` as the player can afford in one debit;
+    # returns how many were bought
+    price = next((price for item, price, _ in hh.SHOP_ITEMS if item == name), None)
+    if price is None:
+        return 0
+    count = min(count, player.coins // price) if price else count
+    if count > 0:
+        player.buy(name, count)
+    return max(count, 0)
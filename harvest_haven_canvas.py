@@ -0,0 +1,128 @@
+import tkinter as tk
+import harvest_haven as hh
+
+# --- Farm Canvas ---
+# Draws the farm on a single tk.Canvas. Only the cells inside the visible
+# viewport exist as canvas items, so startup and redraw cost depend on the
+# window size, not the farm size. Scroll with the mouse wheel (Shift for
+# sideways) or the arrow keys, zoom with Ctrl+wheel or +/-.
+MIN_CELL_SIZE = 16
+MAX_CELL_SIZE = 96
+
+
+class FarmCanvas:
+    def __init__(self, master, farm, on_click, cell_size=56):
+        self.farm = farm
+        self.on_click = on_click
+        self.cell_size = cell_size
+        # Top-left corner of the viewport, in farm pixels
+        self.offset_x = 0
+        self.offset_y = 0
+        self.items = {}  # (x, y) -> canvas text item of a visible cell
+        self.canvas = tk.Canvas(master, width=cell_size * min(farm.size, 10),
+                                height=cell_size * min(farm.size, 10),
+                                bg='white', highlightthickness=0)
+        self.canvas.bind('<Configure>', lambda event: self.redraw())
+        self.canvas.bind('<Button-1>', self._on_click)
+        self.canvas.bind('<MouseWheel>', self._on_wheel)
+        self.canvas.bind('<Button-4>', lambda event: self._on_wheel(event, 120))
+        self.canvas.bind('<Button-5>', lambda event: self._on_wheel(event, -120))
+        for key, (dx, dy) in {'<Left>': (-1, 0), '<Right>': (1, 0), '<Up>': (0, -1), '<Down>': (0, 1)}.items():
+            self.canvas.bind(key, lambda event, dx=dx, dy=dy: self.scroll(dx * self.cell_size, dy * self.cell_size))
+        self.canvas.bind('<plus>', lambda event: self.set_zoom(self.cell_size + 8))
+        self.canvas.bind('<equal>', lambda event: self.set_zoom(self.cell_size + 8))
+        self.canvas.bind('<minus>', lambda event: self.set_zoom(self.cell_size - 8))
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def viewport(self):
+        # Visible (first_row, last_row, first_col, last_col), end exclusive
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        first_col = self.offset_x // self.cell_size
+        first_row = self.offset_y // self.cell_size
+        last_col = min(self.farm.size, (self.offset_x + width) // self.cell_size + 1)
+        last_row = min(self.farm.size, (self.offset_y + height) // self.cell_size + 1)
+        return first_row, last_row, first_col, last_col
+
+    def cell_at(self, px, py):
+        y = (px + self.offset_x) // self.cell_size
+        x = (py + self.offset_y) // self.cell_size
+        if 0 <= x < self.farm.size and 0 <= y < self.farm.size:
+            return x, y
+        return None
+
+    def _cell_center(self, x, y):
+        return ((y + 0.5) * self.cell_size - self.offset_x,
+                (x + 0.5) * self.cell_size - self.offset_y)
+
+    def redraw(self):
+        self.canvas.delete('all')
+        self.items = {}
+        first_row, last_row, first_col, last_col = self.viewport()
+        size = self.cell_size
+        font = ('Arial', max(size // 2, 8))
+        left = first_col * size - self.offset_x
+        top = first_row * size - self.offset_y
+        right = last_col * size - self.offset_x
+        bottom = last_row * size - self.offset_y
+        for row in range(first_row, last_row + 1):
+            line_y = row * size - self.offset_y
+            self.canvas.create_line(left, line_y, right, line_y, fill='#cccccc')
+        for col in range(first_col, last_col + 1):
+            line_x = col * size - self.offset_x
+            self.canvas.create_line(line_x, top, line_x, bottom, fill='#cccccc')
+        for x in range(first_row, last_row):
+            row = self.farm.grid[x]
+            for y in range(first_col, last_col):
+                cx, cy = self._cell_center(x, y)
+                self.items[(x, y)] = self.canvas.create_text(
+                    cx, cy, text=hh.get_crop_emoji(row[y]), font=font)
+
+    def refresh(self, cells):
+        # Repaint changed cells that are on screen; the rest are drawn
+        # when they scroll into view
+        for x, y in cells:
+            item = self.items.get((x, y))
+            if item is not None:
+                self.canvas.itemconfig(item, text=hh.get_crop_emoji(self.farm.grid[x][y]))
+
+    def _clamp(self, offset_x, offset_y):
+        total = self.farm.size * self.cell_size
+        max_x = max(total - self.canvas.winfo_width(), 0)
+        max_y = max(total - self.canvas.winfo_height(), 0)
+        return min(max(offset_x, 0), max_x), min(max(offset_y, 0), max_y)
+
+    def scroll(self, dx, dy):
+        offset_x, offset_y = self._clamp(self.offset_x + dx, self.offset_y + dy)
+        if (offset_x, offset_y) != (self.offset_x, self.offset_y):
+            self.offset_x, self.offset_y = offset_x, offset_y
+            self.redraw()
+
+    def set_zoom(self, cell_size):
+        cell_size = min(max(cell_size, MIN_CELL_SIZE), MAX_CELL_SIZE)
+        if cell_size == self.cell_size:
+            return
+        # Keep the cell at the top-left corner in place while zooming
+        offset_x = self.offset_x * cell_size // self.cell_size
+        offset_y = self.offset_y * cell_size // self.cell_size
+        self.cell_size = cell_size
+        self.offset_x, self.offset_y = self._clamp(offset_x, offset_y)
+        self.redraw()
+
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_click(*cell)
+
+    def _on_wheel(self, event, delta=None):
+        delta = event.delta if delta is None else delta
+        steps = 1 if delta > 0 else -1
+        if event.state & 0x0004:  # Control: zoom
+            self.set_zoom(self.cell_size + 8 * steps)
+        elif event.state & 0x0001:  # Shift: scroll sideways
+            self.scroll(-steps * self.cell_size, 0)
+        else:
+            self.scroll(0, -steps * self.cell_size)
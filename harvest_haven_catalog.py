@@ -0,0 +1,142 @@
+import json
+import os
+
+# --- Crop Catalog ---
+# Crop rules, shop items and emojis are data: a JSON (or TOML) file with a
+# list of crops and a list of other shop items.
+#   {"crops": [{"name": "Wheat", "grow_time": 3, "water_needed": 1,
+#               "fertilizer_needed": 0, "sell_price": 5, "seed_cost": 2,
+#               "starting_seeds": 3, "death_after": 2,
+#               "emoji": ["🌱", "🌾", "🥖", "💀"]}, ...],
+#    "items": [{"name": "Water", "price": 1, "quantity": 3, "starting": 10}, ...]}
+# starting_seeds, death_after (days a crop survives past grow_time, default
+# 2) and starting (default 0) are optional; emoji lists the Planted,
+# Growing, Harvestable and Dead icons. The game waters and fertilizes from
+# the REQUIRED_ITEMS, so every catalog must list them.
+#
+# load_catalog validates the file and compiles it into a Catalog: dense
+# lists indexed by a small integer crop id, with id 0 for an empty plot, so
+# the simulation and the renderer index by id instead of looking rules up
+# by name for every cell.
+CATALOG_ENV = 'HARVEST_HAVEN_CATALOG'
+DEFAULT_CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crops.json')
+EMPTY_EMOJI = '⬜'
+
+CROP_FIELDS = ['grow_time', 'water_needed', 'fertilizer_needed', 'sell_price', 'seed_cost']
+CROP_DEFAULTS = {'starting_seeds': 0, 'death_after': 2}
+ITEM_FIELDS = ['price', 'quantity']
+ITEM_DEFAULTS = {'starting': 0}
+REQUIRED_ITEMS = ['Water', 'Fertilizer']
+
+
+class CatalogError(ValueError):
+    pass
+
+
+class Catalog:
+    def __init__(self, crops, items=()):
+        # crops and items are validated entry dicts (see validate)
+        self.names = [None] + [crop['name'] for crop in crops]
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.grow_time = [0] + [crop['grow_time'] for crop in crops]
+        # First days_grown value at which an unharvested crop is dead
+        self.death_day = [0] + [crop['grow_time'] + crop['death_after'] + 1 for crop in crops]
+        self.water_needed = [0] + [crop['water_needed'] for crop in crops]
+        self.fertilizer_needed = [0] + [crop['fertilizer_needed'] for crop in crops]
+        self.sell_price = [0] + [crop['sell_price'] for crop in crops]
+        self.seed_cost = [0] + [crop['seed_cost'] for crop in crops]
+        # emoji[id][stage], stage 0 (Empty) included
+        self.emoji = [(EMPTY_EMOJI,) * 5] + [(EMPTY_EMOJI,) + tuple(crop['emoji']) for crop in crops]
+        # Shop items: (name, price in coins, quantity bought)
+        self.shop_items = [(crop['name'], crop['seed_cost'], 1) for crop in crops] + \
+            [(item['name'], item['price'], item['quantity']) for item in items]
+        self.starting_inventory = {crop['name']: crop['starting_seeds'] for crop in crops}
+        self.starting_inventory.update((item['name'], item['starting']) for item in items)
+
+    def __len__(self):
+        return len(self.names) - 1
+
+    def crop_types(self):
+        # The rules as the old name-keyed dict, for code that wants a name
+        return {name: {
+            'grow_time': self.grow_time[i],
+            'water_needed': self.water_needed[i],
+            'fertilizer_needed': self.fertilizer_needed[i],
+            'sell_price': self.sell_price[i],
+            'seed_cost': self.seed_cost[i],
+            'death_day': self.death_day[i],
+        } for i, name in enumerate(self.names) if name is not None}
+
+    def crop_emojis(self):
+        table = {name: dict(enumerate(self.emoji[i][1:], 1)) for i, name in enumerate(self.names) if name}
+        table[None] = {0: EMPTY_EMOJI}
+        return table
+
+
+def _check_fields(kind, entry, fields, defaults):
+    if not isinstance(entry, dict):
+        raise CatalogError(f'{kind} entries must be objects, got {entry!r}')
+    name = entry.get('name')
+    if not isinstance(name, str) or not name:
+        raise CatalogError(f'{kind} entry without a name: {entry!r}')
+    unknown = set(entry) - set(fields) - set(defaults) - {'name', 'emoji'}
+    if unknown:
+        raise CatalogError(f'{kind} {name!r} has unknown fields: {", ".join(sorted(unknown))}')
+    checked = dict(defaults, **entry)
+    for field in fields + list(defaults):
+        if field not in checked:
+            raise CatalogError(f'{kind} {name!r} is missing {field!r}')
+        value = checked[field]
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise CatalogError(f'{kind} {name!r}: {field} must be a non-negative integer, got {value!r}')
+    return checked
+
+
+def validate(data):
+    # Returns (crops, items) as checked entry dicts, raising CatalogError
+    if not isinstance(data, dict) or not isinstance(data.get('crops'), list):
+        raise CatalogError('a catalog needs a "crops" list')
+    items = data.get('items', [])
+    if not isinstance(items, list):
+        raise CatalogError('"items" must be a list')
+    crops = [_check_fields('crop', entry, CROP_FIELDS, CROP_DEFAULTS) for entry in data['crops']]
+    items = [_check_fields('item', entry, ITEM_FIELDS, ITEM_DEFAULTS) for entry in items]
+    if not crops:
+        raise CatalogError('a catalog needs at least one crop')
+    missing = [name for name in REQUIRED_ITEMS if name not in {item['name'] for item in items}]
+    if missing:
+        raise CatalogError(f'a catalog needs the items {", ".join(missing)}')
+    if len(crops) > 0xFFFF:
+        raise CatalogError(f'too many crops ({len(crops)}); crop ids are 16-bit')
+    seen = set()
+    for entry in crops + items:
+        if entry['name'] in seen:
+            raise CatalogError(f'duplicate name {entry["name"]!r}')
+        seen.add(entry['name'])
+    for crop in crops:
+        if crop['grow_time'] < 1:
+            raise CatalogError(f'crop {crop["name"]!r}: grow_time must be at least 1')
+        emoji = crop.get('emoji')
+        if not isinstance(emoji, list) or len(emoji) != 4 or not all(isinstance(e, str) and e for e in emoji):
+            raise CatalogError(f'crop {crop["name"]!r}: emoji must be a list of 4 strings '
+                               '(Planted, Growing, Harvestable, Dead)')
+    return crops, items
+
+
+def load_catalog(filename=None):
+    # Defaults to $HARVEST_HAVEN_CATALOG, then crops.json next to this file
+    filename = filename or os.environ.get(CATALOG_ENV) or DEFAULT_CATALOG
+    if filename.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:
+            raise CatalogError('TOML catalogs need Python 3.11 or later') from None
+        with open(filename, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(filename, encoding='utf-8') as f:
+            data = json.load(f)
+    try:
+        return Catalog(*validate(data))
+    except CatalogError as error:
+        raise CatalogError(f'{filename}: {error}') from None
@@ -0,0 +1,349 @@
+import json
+import os
+
+import harvest_haven as hh
+
+# --- Chunked Farm ---
+# A sparse farm for huge, mostly empty worlds. Cells live in CHUNK_SIZE x
+# CHUNK_SIZE chunks that are created on the first plant and dropped once
+# their last crop is harvested; inside a chunk only non-blank cells are
+# stored. Coordinates are non-negative and unbounded unless a size is
+# given. Harvested plots go back to EMPTY_PLOT here rather than keeping
+# their counters, so an all-harvested chunk really is empty.
+#
+# Saves are directories (see save_chunks): one file per chunk, and only
+# chunks changed since the last save are rewritten.
+CHUNK_SIZE = 32
+
+
+class Chunk:
+    __slots__ = ('crops', 'dirty')
+
+    def __init__(self):
+        self.crops = {}  # (local x, local y) -> Crop
+        self.dirty = True
+
+
+class _RowView:
+    __slots__ = ('farm', 'x')
+
+    def __init__(self, farm, x):
+        self.farm = farm
+        self.x = x
+
+    def __len__(self):
+        return self.farm.size
+
+    def __getitem__(self, y):
+        return self.farm.cell(self.x, y)
+
+    def __iter__(self):
+        for y in range(self.farm.size):
+            yield self.farm.cell(self.x, y)
+
+
+class _GridView:
+    __slots__ = ('farm',)
+
+    def __init__(self, farm):
+        self.farm = farm
+
+    def __len__(self):
+        return self.farm.size
+
+    def __getitem__(self, x):
+        return _RowView(self.farm, x)
+
+    def __iter__(self):
+        for x in range(self.farm.size):
+            yield _RowView(self.farm, x)
+
+
+class ChunkedFarm:
+    def __init__(self, size=None, chunk_size=CHUNK_SIZE):
+        self.bound = size
+        self.chunk_size = chunk_size
+        self.chunks = {}  # (chunk x, chunk y) -> Chunk
+        self.dropped = set()  # chunks removed since the last save
+        # The directory this farm last saved to (or was loaded from) and the
+        # token written into its meta.json; see save_chunks
+        self.saved_to = None
+        self.save_token = None
+        self.listeners = []
+
+    @property
+    def size(self):
+        # The fixed bound if there is one, otherwise just enough to cover
+        # every stored chunk
+        if self.bound is not None:
+            return self.bound
+        if not self.chunks:
+            return 0
+        return (max(max(cx, cy) for cx, cy in self.chunks) + 1) * self.chunk_size
+
+    @property
+    def grid(self):
+        return _GridView(self)
+
+    # Listeners are called with a list of (x, y) cells after every change
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _notify(self, cells):
+        for listener in self.listeners:
+            listener(cells)
+
+    def _locate(self, x, y):
+        if x < 0 or y < 0 or (self.bound is not None and (x >= self.bound or y >= self.bound)):
+            raise IndexError(f'({x},{y}) is outside the farm')
+        return (x // self.chunk_size, y // self.chunk_size), (x % self.chunk_size, y % self.chunk_size)
+
+    def cell(self, x, y):
+        key, local = self._locate(x, y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            return hh.EMPTY_PLOT
+        return chunk.crops.get(local, hh.EMPTY_PLOT)
+
+    def _store(self, x, y, crop):
+        # Put a crop (or EMPTY_PLOT) at (x, y), creating or dropping chunks
+        key, local = self._locate(x, y)
+        chunk = self.chunks.get(key)
+        if crop is hh.EMPTY_PLOT:
+            if chunk is None or local not in chunk.crops:
+                return
+            del chunk.crops[local]
+            chunk.dirty = True
+            if not chunk.crops:
+                del self.chunks[key]
+                self.dropped.add(key)
+            return
+        if chunk is None:
+            chunk = self.chunks[key] = Chunk()
+            self.dropped.discard(key)
+        chunk.crops[local] = crop
+        chunk.dirty = True
+
+    def _touch(self, x, y):
+        key, _ = self._locate(x, y)
+        self.chunks[key].dirty = True
+
+    def plant(self, x, y, crop_type):
+        crop = self.cell(x, y)
+        if crop is hh.EMPTY_PLOT:
+            crop = hh.Crop()
+            self._store(x, y, crop)
+        else:
+            self._touch(x, y)
+        crop.plant(crop_type)
+        self._notify([(x, y)])
+
+    def water(self, x, y):
+        crop = self.cell(x, y)
+        if crop.stage in [1, 2]:
+            crop.water()
+            self._touch(x, y)
+            self._notify([(x, y)])
+
+    def fertilize(self, x, y):
+        crop = self.cell(x, y)
+        if crop.stage in [1, 2]:
+            crop.fertilize()
+            self._touch(x, y)
+            self._notify([(x, y)])
+
+    def harvest(self, x, y):
+        crop_type = self.cell(x, y).harvest()
+        if crop_type:
+            self._store(x, y, hh.EMPTY_PLOT)
+            self._notify([(x, y)])
+        return crop_type
+
+    def kill(self, x, y):
+        crop = self.cell(x, y)
+        if crop.stage in [1, 2]:
+            crop.stage = 4  # Dead
+            self._touch(x, y)
+            self._notify([(x, y)])
+
+    def set_cell(self, x, y, crop_data):
+        self._store(x, y, hh.crop_from_dict(crop_data))
+        self._notify([(x, y)])
+
+    def advance_day(self, rain=False):
+        changed = []
+        for (cx, cy), chunk in self.chunks.items():
+            touched = False
+            for (lx, ly), crop in chunk.crops.items():
+                if crop.stage not in [0, 4]:
+                    crop.advance_day(rain=rain)
+                    touched = True
+                    if self.listeners:
+                        changed.append((cx * self.chunk_size + lx, cy * self.chunk_size + ly))
+            if touched:
+                chunk.dirty = True
+        if changed:
+            self._notify(changed)
+
+    def advance_days(self, n, weather_sequence=None):
+        # n days of weather at once, see hh.fast_forward
+        advances, rains, pests = hh.weather_prefix(n, weather_sequence)
+        changed = []
+        for x, y, crop in list(self.crops()):
+            if crop.stage not in [0, 4]:
+                k, killed = hh.fast_forward(crop.type_id, crop.stage, crop.days_grown, crop.watered,
+                                            crop.fertilized, advances, rains, pests.get((x, y), ()))
+                if k:
+                    crop.days_grown += k
+                    crop.watered += rains[k]
+                    crop.update_stage()
+                if killed:
+                    crop.stage = 4  # Dead
+                self._touch(x, y)
+                changed.append((x, y))
+        if changed and self.listeners:
+            self._notify(changed)
+
+    def crops(self):
+        # Yields (x, y, crop) for every stored cell
+        for (cx, cy), chunk in self.chunks.items():
+            for (lx, ly), crop in chunk.crops.items():
+                yield cx * self.chunk_size + lx, cy * self.chunk_size + ly, crop
+
+    def chunk_to_dict(self, key):
+        return [[lx, ly, crop.to_dict()] for (lx, ly), crop in sorted(self.chunks[key].crops.items())]
+
+    def to_dict(self):
+        return {
+            'size': self.bound,
+            'chunk_size': self.chunk_size,
+            'chunks': {f'{cx},{cy}': self.chunk_to_dict((cx, cy)) for cx, cy in sorted(self.chunks)},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        # Accepts ChunkedFarm.to_dict output or a dense Farm.to_dict
+        if 'grid' in data:
+            farm = cls(size=data['size'])
+            for i, row in enumerate(data['grid']):
+                for j, crop_data in enumerate(row):
+                    farm._store(i, j, hh.crop_from_dict(crop_data))
+            return farm
+        farm = cls(size=data['size'], chunk_size=data['chunk_size'])
+        for key, cells in data['chunks'].items():
+            farm.load_chunk(tuple(int(part) for part in key.split(',')), cells)
+        return farm
+
+    def load_chunk(self, key, cells):
+        cx, cy = key
+        for lx, ly, crop_data in cells:
+            self._store(cx * self.chunk_size + lx, cy * self.chunk_size + ly, hh.crop_from_dict(crop_data))
+        if key in self.chunks:
+            self.chunks[key].dirty = False
+
+    def display(self):
+        print("\nFarm Grid:")
+        if not self.chunks:
+            return
+        first_x = min(cx for cx, _ in self.chunks) * self.chunk_size
+        first_y = min(cy for _, cy in self.chunks) * self.chunk_size
+        last_x = (max(cx for cx, _ in self.chunks) + 1) * self.chunk_size
+        last_y = (max(cy for _, cy in self.chunks) + 1) * self.chunk_size
+        for x in range(first_x, last_x):
+            print(' '.join(hh.get_crop_emoji(self.cell(x, y)) for y in range(first_y, last_y)))
+
+
+# --- Chunked Saves ---
+# A save directory holds meta.json (farm settings, the player, the journal
+# generation and a save token) and one chunk_<cx>_<cy>.json per stored chunk. Each file is
+# written to a temp file and renamed into place.
+#
+# Dirty flags only describe the directory the farm last wrote. A save into
+# any other directory, or one that something else has written since (its
+# token no longer matches), is a full save: every chunk is written and
+# chunk files the farm doesn't have are deleted.
+def _write_json(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _chunk_path(dirname, key):
+    return os.path.join(dirname, f'chunk_{key[0]}_{key[1]}.json')
+
+
+def _read_meta(dirname):
+    try:
+        with open(os.path.join(dirname, 'meta.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _chunk_files(dirname):
+    # {(cx, cy): file name} of the chunk files in a save directory
+    files = {}
+    for name in os.listdir(dirname):
+        if name.startswith('chunk_') and name.endswith('.json'):
+            cx, cy = name[len('chunk_'):-len('.json')].split('_')
+            files[(int(cx), int(cy))] = name
+    return files
+
+
+def save_chunks(player, farm, dirname, generation=0):
+    # Returns the number of chunk files written
+    os.makedirs(dirname, exist_ok=True)
+    path = os.path.abspath(dirname)
+    meta = _read_meta(dirname)
+    full = farm.saved_to != path or meta is None or meta.get('token') != farm.save_token
+    if full:
+        farm.save_token = os.urandom(8).hex()
+    written = 0
+    for key, chunk in farm.chunks.items():
+        if chunk.dirty or full:
+            _write_json(_chunk_path(dirname, key), farm.chunk_to_dict(key))
+            chunk.dirty = False
+            written += 1
+    stale = set(_chunk_files(dirname)) - set(farm.chunks) if full else farm.dropped
+    for key in stale:
+        if os.path.exists(_chunk_path(dirname, key)):
+            os.remove(_chunk_path(dirname, key))
+    farm.dropped.clear()
+    _write_json(os.path.join(dirname, 'meta.json'), {
+        'size': farm.bound,
+        'chunk_size': farm.chunk_size,
+        'player': player.to_dict(),
+        'token': farm.save_token,
+        'generation': generation,
+    })
+    farm.saved_to = path
+    return written
+
+
+def read_generation(dirname):
+    meta = _read_meta(dirname)
+    return meta.get('generation', 0) if meta else 0
+
+
+def is_chunk_save(path):
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, 'meta.json'))
+
+
+def load_chunks(dirname):
+    with open(os.path.join(dirname, 'meta.json')) as f:
+        meta = json.load(f)
+    farm = ChunkedFarm(size=meta['size'], chunk_size=meta['chunk_size'])
+    for key, name in _chunk_files(dirname).items():
+        with open(os.path.join(dirname, name)) as f:
+            farm.load_chunk(key, json.load(f))
+    farm.dropped.clear()
+    # The loaded chunks are clean against this directory
+    farm.saved_to = os.path.abspath(dirname)
+    farm.save_token = meta.get('token')
+    return hh.Player.from_dict(meta['player']), farm
@@ -0,0 +1,182 @@
+import argparse
+import csv
+import gzip
+import io
+import json
+
+import harvest_haven as hh
+
+# --- Day History ---
+# One compact record per day:
+#   {"day": 1, "event": "rain", "coins": 20, "energy": 2,
+#    "inventory": {"Wheat": 3, ...}, "stages": {"Empty": 20, "Planted": 5, ...},
+#    "crops": {"Wheat": 4, ...}}
+# energy is what the player had left when the day ended, before resting.
+# stages counts the farm's cells per stage, crops the live (Planted to
+# Harvestable) crops per type.
+#
+# Everything is streamed: day_records() is a generator that plays a
+# headless game one day at a time, HistoryWriter appends records through a
+# buffered (optionally gzip) file and read_history() yields them back one
+# line at a time, so memory stays flat however long the run. Files ending
+# in .csv or .csv.gz are CSV with dotted column names ("inventory.Water"),
+# anything else JSON lines; a .gz suffix means gzip.
+BUFFER_SIZE = 1 << 16
+
+
+def stage_counts(farm):
+    counts = [0] * len(hh.CROP_STAGES)
+    crops = [0] * len(hh.CATALOG.names)
+    if hasattr(farm, 'type_id'):
+        import numpy as np
+        counts = np.bincount(farm.stage.ravel(), minlength=len(counts)).tolist()
+        live = (farm.stage >= 1) & (farm.stage <= 3)
+        crops = np.bincount(farm.type_id[live], minlength=len(crops)).tolist()
+    else:
+        cells = farm.crops() if hasattr(farm, 'chunks') else \
+            ((x, y, crop) for x, row in enumerate(farm.grid) for y, crop in enumerate(row))
+        stored = 0
+        for _, _, crop in cells:
+            stored += 1
+            counts[crop.stage] += 1
+            if 1 <= crop.stage <= 3:
+                crops[crop.type_id] += 1
+        counts[0] += farm.size * farm.size - stored  # Cells a chunked farm doesn't store
+    return (dict(zip(hh.CROP_STAGES, counts)),
+            {name: crops[i] for i, name in enumerate(hh.CATALOG.names) if name is not None})
+
+
+def day_record(day, event, player, farm, energy=None):
+    stages, crops = stage_counts(farm)
+    return {
+        'day': day,
+        'event': event,
+        'coins': player.coins,
+        'energy': player.energy if energy is None else energy,
+        'inventory': dict(player.inventory),
+        'stages': stages,
+        'crops': crops,
+    }
+
+
+def day_records(game, policy, days):
+    # Plays `days` days of a HeadlessGame and yields each day's record,
+    # taken after the day's event, actions and the night's rest; energy is
+    # the amount left before that rest
+    for _ in range(days):
+        day = game.day
+        event = game.play_day(policy)
+        yield day_record(day, event, game.player, game.farm, game.energy_left)
+
+
+# --- Writing ---
+def _is_csv(filename):
+    return filename.removesuffix('.gz').endswith('.csv')
+
+
+def _open_text(filename, mode, buffer_size=BUFFER_SIZE):
+    if filename.endswith('.gz'):
+        raw = gzip.GzipFile(filename, mode + 'b')
+        buffered = io.BufferedWriter(raw, buffer_size) if mode == 'w' else io.BufferedReader(raw, buffer_size)
+        return io.TextIOWrapper(buffered, encoding='utf-8', newline='')
+    return open(filename, mode, buffering=buffer_size, encoding='utf-8', newline='')
+
+
+def _flatten(record):
+    row = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            for name, count in value.items():
+                row[f'{key}.{name}'] = count
+        else:
+            row[key] = value
+    return row
+
+
+def _unflatten(row):
+    record = {}
+    for key, value in row.items():
+        if value is None:
+            continue
+        if key != 'event':
+            value = int(value)
+        if '.' in key:
+            group, name = key.split('.', 1)
+            record.setdefault(group, {})[name] = value
+        else:
+            record[key] = value
+    return record
+
+
+class HistoryWriter:
+    def __init__(self, filename, buffer_size=BUFFER_SIZE):
+        self.filename = filename
+        self.csv = _is_csv(filename)
+        self.file = _open_text(filename, 'w', buffer_size)
+        self.writer = None
+        self.count = 0
+
+    def write(self, record):
+        if self.csv:
+            row = _flatten(record)
+            if self.writer is None:
+                # Columns come from the first record; later keys are ignored
+                self.writer = csv.DictWriter(self.file, fieldnames=list(row), extrasaction='ignore')
+                self.writer.writeheader()
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_history(records, filename, buffer_size=BUFFER_SIZE):
+    # Drains an iterable of records into filename; returns how many
+    with HistoryWriter(filename, buffer_size) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+
+# --- Reading ---
+def read_history(filename, buffer_size=BUFFER_SIZE):
+    # Yields the records back one at a time
+    with _open_text(filename, 'r', buffer_size) as f:
+        if _is_csv(filename):
+            for row in csv.DictReader(f):
+                yield _unflatten(row)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream a headless game\'s day-by-day history to a file.')
+    parser.add_argument('output', help='.jsonl or .csv, with .gz for gzip')
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--size', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--engine', choices=['object', 'array', 'scheduled'], default='object')
+    parser.add_argument('--policy', choices=['greedy', 'planner', 'idle'], default='greedy')
+    args = parser.parse_args(argv)
+    from harvest_haven_batch import GreedyPolicy, HeadlessGame, IdlePolicy
+    if args.policy == 'planner':
+        from harvest_haven_planner import PlannedPolicy
+        policy = PlannedPolicy(args.days)
+    else:
+        policy = GreedyPolicy() if args.policy == 'greedy' else IdlePolicy()
+    game = HeadlessGame(args.seed, size=args.size, engine=args.engine, keep_log=False)
+    count = write_history(day_records(game, policy, args.days), args.output)
+    print(f'Wrote {count} days to {args.output}')
+
+if __name__ == '__main__':
+    main()
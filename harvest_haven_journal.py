@@ -0,0 +1,131 @@
+import copy
+import json
+import os
+
+import harvest_haven as hh
+
+# --- Change Journal ---
+# A journaled save is a full snapshot (written by save_game) plus an
+# append-only '<save>.journal' file. Each journal line holds only the cells
+# and player fields that changed since the previous line:
+#   {"gen": 3, "cells": [[x, y, {crop dict}], ...], "player": {"coins": 25}}
+# Lines are tagged with the snapshot's generation, so lines left over from an
+# older snapshot (for example after a crash during compaction) are ignored.
+# A torn last line from a crash mid-append is ignored too, and
+# SaveJournal.load cuts it off so new lines don't get appended onto it.
+
+
+def replay(journal_filename, player, farm, generation):
+    # Returns (entries applied, byte offset just past the last good line)
+    applied = 0
+    offset = 0
+    with open(journal_filename, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            offset += len(line)
+            if entry.get('gen') != generation:
+                continue
+            for x, y, crop_data in entry.get('cells', []):
+                farm.set_cell(x, y, crop_data)
+            for field, value in entry.get('player', {}).items():
+                setattr(player, field, value)
+            applied += 1
+    return applied, offset
+
+
+def _next_generation(generation):
+    # Snapshot generations are stored mod 2**16 in binary saves; 0 means
+    # "no journal"
+    return generation % 0xFFFF + 1
+
+
+class SaveJournal:
+    def __init__(self, filename='harvest_haven_save.json', compact_every=50):
+        self.filename = filename
+        self.journal_filename = filename + '.journal'
+        self.compact_every = compact_every
+        self.player = None
+        self.farm = None
+        self.generation = 0
+        self.entries = 0
+        self.dirty = set()
+        self.saved_player = None
+
+    def load(self, farm_cls=None):
+        if not os.path.exists(self.filename):
+            return None, None
+        player, farm, generation = hh.load_game_state(self.filename, farm_cls, replay_journal=False)
+        entries = 0
+        if generation and os.path.exists(self.journal_filename):
+            entries, offset = replay(self.journal_filename, player, farm, generation)
+            if offset < os.path.getsize(self.journal_filename):
+                # Drop a torn or corrupt tail before appending after it
+                with open(self.journal_filename, 'r+b') as f:
+                    f.truncate(offset)
+                    f.flush()
+                    os.fsync(f.fileno())
+        self.attach(player, farm)
+        self.generation = generation
+        # Replayed lines count towards the next compaction
+        self.entries = entries
+        self.saved_player = copy.deepcopy(player.to_dict())
+        print('Game loaded!')
+        return player, farm
+
+    def attach(self, player, farm):
+        if self.farm is not None:
+            self.farm.remove_listener(self._on_change)
+        self.player = player
+        self.farm = farm
+        self.farm.add_listener(self._on_change)
+        self.dirty = set()
+        self.saved_player = None
+        self.generation = 0
+
+    def _on_change(self, cells):
+        self.dirty.update(cells)
+
+    def _player_changes(self):
+        current = self.player.to_dict()
+        return {field: value for field, value in current.items() if self.saved_player.get(field) != value}
+
+    def save(self):
+        # Appends a delta, or writes a full snapshot when there is none yet,
+        # the journal is long, or most of the farm changed anyway
+        if not self.generation or self.entries >= self.compact_every or \
+           len(self.dirty) * 2 > self.farm.size * self.farm.size:
+            self.checkpoint()
+            return
+        entry = {
+            'gen': self.generation,
+            'cells': [[x, y, self.farm.grid[x][y].to_dict()] for x, y in sorted(self.dirty)],
+            'player': self._player_changes(),
+        }
+        with open(self.journal_filename, 'a') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries += 1
+        self.dirty.clear()
+        self.saved_player = copy.deepcopy(self.player.to_dict())
+        print('Game saved!')
+
+    def checkpoint(self):
+        generation = _next_generation(self.generation)
+        hh.save_game(self.player, self.farm, self.filename, generation=generation)
+        # Only reached once the new snapshot is in place; until the journal
+        # is reset its old lines carry the previous generation
+        tmp_filename = self.journal_filename + '.tmp'
+        with open(tmp_filename, 'w') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, self.journal_filename)
+        self.generation = generation
+        self.entries = 0
+        self.dirty.clear()
+        self.saved_player = copy.deepcopy(self.player.to_dict())
@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from harvest_haven_server import GameServer
+
+# --- Load Test Client ---
+# Opens one connection per simulated player against a local GameServer
+# (started in-process unless --port points at a running one), plays random
+# actions for a number of days and reports request latency and throughput.
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = []
+
+    @classmethod
+    async def connect(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, **request):
+        start = time.perf_counter()
+        self.writer.write((json.dumps(request) + '\n').encode('utf-8'))
+        await self.writer.drain()
+        reply = json.loads(await self.reader.readline())
+        self.latencies.append(time.perf_counter() - start)
+        return reply
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play(host, port, name, days, actions_per_day, seed):
+    rng = random.Random(seed)
+    client = await Client.connect(host, port)
+    reply = await client.request(session=name, action='new', seed=seed)
+    size = 5
+    for _ in range(days):
+        for _ in range(actions_per_day):
+            x, y = rng.randrange(size), rng.randrange(size)
+            action = rng.choice(['plant', 'water', 'fertilize', 'harvest', 'buy'])
+            if action == 'plant':
+                reply = await client.request(session=name, action='plant', x=x, y=y,
+                                             crop=rng.choice(['Wheat', 'Tomato', 'Carrot']))
+            elif action == 'buy':
+                reply = await client.request(session=name, action='buy', item=rng.choice(['Wheat', 'Water']))
+            else:
+                reply = await client.request(session=name, action=action, x=x, y=y)
+        reply = await client.request(session=name, action='end_day')
+    await client.request(session=name, action='save')
+    await client.request(session=name, action='close')
+    await client.close()
+    return client.latencies, reply['state']['coins']
+
+
+async def run(clients, days, actions_per_day, host='127.0.0.1', port=None, save_dir='loadtest_saves'):
+    server = None
+    if port is None:
+        server = await GameServer(host, 0, save_dir).start()
+        port = server.port
+    start = time.perf_counter()
+    try:
+        results = await asyncio.gather(*[
+            play(host, port, f'player{i}', days, actions_per_day, i) for i in range(clients)])
+    finally:
+        if server is not None:
+            await server.stop()
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for client_latencies, _ in results for latency in client_latencies)
+    return {
+        'clients': clients,
+        'requests': len(latencies),
+        'seconds': round(elapsed, 3),
+        'requests_per_sec': round(len(latencies) / elapsed, 1),
+        'latency_ms_p50': round(latencies[len(latencies) // 2] * 1000, 2),
+        'latency_ms_p99': round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+        'coins_mean': statistics.fmean(coins for _, coins in results),
+        'server_ticks': server.ticks if server is not None else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load-test a Harvest Haven game server.')
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--days', type=int, default=10)
+    parser.add_argument('--actions', type=int, default=10, help='actions per client per day')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None, help='use a running server instead of starting one')
+    parser.add_argument('--save-dir', default='loadtest_saves')
+    args = parser.parse_args(argv)
+    summary = asyncio.run(run(args.clients, args.days, args.actions, args.host, args.port, args.save_dir))
+    print(json.dumps(summary, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+import functools
+import json
+import sys
+import time
+
+import harvest_haven as hh
+
+# --- Metrics ---
+# Opt-in instrumentation for the hot paths. enable() swaps timing wrappers
+# onto the methods in HOT_PATHS and disable() puts the originals back, so a
+# game that never calls enable() runs the plain code with no overhead at
+# all. Only modules that are already imported get wrapped (enabling never
+# pulls in NumPy or tkinter); call enable() again after importing one.
+#
+# Every wrapped call lands in a latency histogram named "Class.method" (or
+# "module.function"). Per-day counters are kept from the Player and
+# EventEngine hooks, one record per EventEngine.run_day (numbered across
+# every game played while enabled):
+#   {"day": 1, "planted": 3, "harvested": 1, "died": 0, "coins_earned": 5}
+FARM_METHODS = ['plant', 'water', 'fertilize', 'harvest', 'kill', 'advance_day']
+HOT_PATHS = [
+    ('harvest_haven', 'Farm', FARM_METHODS),
+    ('harvest_haven_array', 'ArrayFarm', FARM_METHODS),
+    ('harvest_haven_sched', 'ScheduledFarm', FARM_METHODS),
+    ('harvest_haven_chunked', 'ChunkedFarm', FARM_METHODS),
+    ('harvest_haven_parallel', 'ParallelFarm', FARM_METHODS),
+    ('harvest_haven', None, ['save_game', 'load_game', 'load_game_state']),
+    ('harvest_haven_ui', 'HarvestHavenUI', ['update_ui']),
+]
+BUCKETS = [0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0, float('inf')]  # Seconds
+DAY_COUNTERS = ['planted', 'harvested', 'died', 'coins_earned']
+
+
+class Histogram:
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                return
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'buckets': {_label(bound): count for bound, count in zip(BUCKETS, self.counts)},
+        }
+
+
+def _label(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+class Metrics:
+    def __init__(self):
+        self.timers = {}  # "Class.method" -> Histogram
+        self.days = [self._new_day(0)]  # Day 0 collects anything before the first event
+
+    @staticmethod
+    def _new_day(day):
+        record = {'day': day}
+        record.update(dict.fromkeys(DAY_COUNTERS, 0))
+        return record
+
+    def observe(self, name, seconds):
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = Histogram()
+        timer.observe(seconds)
+
+    def count(self, counter, amount=1):
+        self.days[-1][counter] += amount
+
+    def start_day(self):
+        self.days.append(self._new_day(len(self.days)))
+
+    def totals(self):
+        return {counter: sum(day[counter] for day in self.days) for counter in DAY_COUNTERS}
+
+    def write_jsonl(self, filename):
+        with open(filename, 'w') as f:
+            for name, timer in sorted(self.timers.items()):
+                f.write(json.dumps(dict(type='timer', name=name, **timer.to_dict())) + '\n')
+            for day in self.days:
+                f.write(json.dumps(dict(type='day', **day)) + '\n')
+
+    def prometheus(self):
+        lines = ['# TYPE harvest_haven_call_seconds histogram']
+        for name, timer in sorted(self.timers.items()):
+            running = 0
+            for bound, count in zip(BUCKETS, timer.counts):
+                running += count
+                lines.append(f'harvest_haven_call_seconds_bucket{{method="{name}",le="{_label(bound)}"}} {running}')
+            lines.append(f'harvest_haven_call_seconds_sum{{method="{name}"}} {timer.total}')
+            lines.append(f'harvest_haven_call_seconds_count{{method="{name}"}} {timer.count}')
+        for counter, total in self.totals().items():
+            lines.append(f'# TYPE harvest_haven_{counter}_total counter')
+            lines.append(f'harvest_haven_{counter}_total {total}')
+        lines.append('# TYPE harvest_haven_days_total counter')
+        lines.append(f'harvest_haven_days_total {len(self.days) - 1}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, filename):
+        with open(filename, 'w') as f:
+            f.write(self.prometheus())
+
+    def write(self, filename):
+        # .prom files get the Prometheus text format, anything else JSON lines
+        if filename.endswith('.prom'):
+            self.write_prometheus(filename)
+        else:
+            self.write_jsonl(filename)
+
+
+# --- Hooks ---
+metrics = None  # The active Metrics while enabled
+_originals = []  # (owner, attribute, original) for disable()
+
+
+def _timed(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.observe(name, time.perf_counter() - start)
+    return wrapper
+
+
+def _dead_count(farm, cells):
+    # How many of the given cells hold a dead crop. Farms only report cells
+    # that were live before a tick or a kill, so this counts the deaths of
+    # that change without scanning the farm.
+    if not cells:
+        return 0
+    if hasattr(farm, 'type_id'):
+        xs, ys = zip(*cells)
+        return int((farm.stage[list(xs), list(ys)] == 4).sum())
+    grid = farm.grid
+    return sum(1 for x, y in cells if grid[x][y].stage == 4)
+
+
+def _day_hooks():
+    # Player and EventEngine methods that feed the per-day counters
+    use_seed = hh.Player.use_seed
+    add_harvest = hh.Player.add_harvest
+    run_day = hh.EventEngine.run_day
+
+    def counted_use_seed(self, crop_type, count=1):
+        used = use_seed(self, crop_type, count)
+        if used:
+            metrics.count('planted', count)
+        return used
+
+    def counted_add_harvest(self, crop_type, count=1):
+        coins = self.coins
+        add_harvest(self, crop_type, count)
+        metrics.count('harvested', count)
+        metrics.count('coins_earned', self.coins - coins)
+
+    def counted_run_day(self, farm):
+        metrics.start_day()
+        changed = set()
+        listener = changed.update
+        farm.add_listener(listener)
+        try:
+            record = run_day(self, farm)
+        finally:
+            farm.remove_listener(listener)
+        metrics.count('died', _dead_count(farm, changed))
+        return record
+
+    return [(hh.Player, 'use_seed', counted_use_seed),
+            (hh.Player, 'add_harvest', counted_add_harvest),
+            (hh.EventEngine, 'run_day', _timed('EventEngine.run_day', counted_run_day))]
+
+
+def enable(target=None):
+    # Starts recording into `target` (by default the current Metrics, or a
+    # fresh one) and returns it; enabling again also wraps any modules
+    # imported since
+    global metrics
+    if _originals:
+        disable()
+    metrics = target if target is not None else (metrics or Metrics())
+    patches = _day_hooks()
+    for module_name, class_name, names in HOT_PATHS:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        owner = getattr(module, class_name) if class_name else module
+        prefix = class_name or module_name
+        for name in names:
+            # Only wrap what the class defines itself; inherited methods are
+            # already wrapped on the base class
+            if class_name and name not in vars(owner):
+                continue
+            patches.append((owner, name, _timed(f'{prefix}.{name}', getattr(owner, name))))
+    for owner, name, wrapper in patches:
+        _originals.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, wrapper)
+    return metrics
+
+
+def disable():
+    # Restores the original methods; the recorded metrics are kept
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    return metrics
+
+
+def enabled():
+    return bool(_originals)
@@ -0,0 +1,162 @@
+import argparse
+import os
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+import harvest_haven as hh
+from harvest_haven_array import ArrayFarm, FIELDS, FIELD_DTYPES, tick
+
+# --- Parallel Farm ---
+# An ArrayFarm whose arrays live in shared memory so a process pool can
+# tick row bands of one huge farm at the same time. The workers map the
+# same blocks once when the pool starts; a tick only sends each worker its
+# (first row, last row, rain) band, never the arrays themselves.
+#
+# Only the day tick runs in the workers. Events are still rolled and
+# applied in the parent (pests through kill, which writes the shared arrays
+# directly), and every cell's tick depends only on that cell, so the result
+# is identical to ArrayFarm for the same seed.
+#
+# Call close() (or use the farm as a context manager) to stop the pool and
+# free the shared memory.
+MIN_PARALLEL_CELLS = 250_000  # Smaller farms tick faster in one process
+
+_worker_arrays = {}
+_worker_blocks = []
+
+
+def _attach(names, size):
+    # Pool initializer: map the parent's blocks into this worker
+    for field, name in zip(FIELDS, names):
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        _worker_arrays[field] = np.ndarray((size, size), dtype=FIELD_DTYPES[field], buffer=block.buf)
+
+
+def _tick_band(band):
+    x0, x1, rain, want_cells = band
+    arrays = [_worker_arrays[field][x0:x1] for field in FIELDS]
+    active = tick(*arrays, rain=rain)
+    if not want_cells:
+        return None
+    cells = np.argwhere(active)
+    cells[:, 0] += x0
+    return cells.tolist()
+
+
+class ParallelFarm(ArrayFarm):
+    def __init__(self, size=5, workers=None, min_cells=MIN_PARALLEL_CELLS):
+        self.size = size
+        self.listeners = []
+        self.workers = workers or os.cpu_count() or 1
+        self.min_cells = min_cells
+        self.blocks = []
+        for field in FIELDS:
+            nbytes = max(size * size * np.dtype(FIELD_DTYPES[field]).itemsize, 1)
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.blocks.append(block)
+            values = np.ndarray((size, size), dtype=FIELD_DTYPES[field], buffer=block.buf)
+            values.fill(0)
+            setattr(self, field, values)
+        self.pool = None
+
+    def _bands(self):
+        step = -(-self.size // self.workers)
+        return [(x0, min(x0 + step, self.size)) for x0 in range(0, self.size, step)]
+
+    def start(self):
+        # Starts the worker pool; advance_day does this on first use
+        if self.pool is None and self.workers > 1:
+            names = [block.name for block in self.blocks]
+            self.pool = Pool(self.workers, initializer=_attach, initargs=(names, self.size))
+
+    def advance_day(self, rain=False):
+        if self.workers == 1 or self.size * self.size < self.min_cells:
+            return super().advance_day(rain)
+        self.start()
+        want_cells = bool(self.listeners)
+        results = self.pool.map(_tick_band, [(x0, x1, rain, want_cells) for x0, x1 in self._bands()])
+        if want_cells:
+            changed = [tuple(cell) for cells in results for cell in cells]
+            if changed:
+                self._notify(changed)
+
+    @classmethod
+    def from_arrays(cls, size, type_names, fields):
+        loaded = ArrayFarm.from_arrays(size, type_names, fields)
+        farm = cls(size)
+        for field in FIELDS:
+            getattr(farm, field)[:] = getattr(loaded, field)
+        return farm
+
+    @classmethod
+    def from_farm(cls, farm, workers=None, min_cells=MIN_PARALLEL_CELLS):
+        parallel = cls(farm.size, workers, min_cells)
+        source = farm if hasattr(farm, 'type_id') else ArrayFarm.from_farm(farm)
+        for field in FIELDS:
+            getattr(parallel, field)[:] = getattr(source, field)
+        return parallel
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        if not self.blocks:
+            return
+        # Drop our views first; a block with live exports can't be closed
+        for field in FIELDS:
+            setattr(self, field, getattr(self, field).copy())
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# --- Speedup Benchmark ---
+def timed_ticks(farm, days, seed):
+    events = hh.EventEngine(seed)
+    start = time.perf_counter()
+    for _ in range(days):
+        events.run_day(farm)
+    return (time.perf_counter() - start) / days
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time the parallel day tick against the serial ArrayFarm.')
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--days', type=int, default=20)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    serial = ArrayFarm(args.size)
+    crop_types = list(hh.CROP_TYPES)
+    serial.type_id[:] = np.arange(args.size * args.size).reshape(args.size, args.size) % len(crop_types) + 1
+    serial.stage[:] = 1
+    print(f'{os.cpu_count()} CPU(s), {args.size}x{args.size} farm, {args.days} days')
+    base = timed_ticks(ArrayFarm.from_arrays(args.size, [None] + crop_types,
+                                             {f: getattr(serial, f).copy() for f in FIELDS}), args.days, args.seed)
+    print(f'serial      {base * 1000:8.2f} ms/day')
+    for workers in args.workers:
+        with ParallelFarm.from_farm(serial, workers) as farm:
+            farm.start()  # Keep pool startup out of the timed days
+            per_day = timed_ticks(farm, args.days, args.seed)
+        print(f'{workers} worker(s) {per_day * 1000:8.2f} ms/day  {base / per_day:5.2f}x')
+
+if __name__ == '__main__':
+    main()
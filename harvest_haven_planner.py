@@ -0,0 +1,152 @@
+from collections import OrderedDict, namedtuple
+
+import harvest_haven as hh
+
+# --- Growth Planner ---
+# Answers "what happens if I plant this?" from a table instead of
+# re-simulating crops. An outcome is keyed by
+#   (crop type, watering days, fertilizer count, rain pattern)
+# where watering days lists the growth day before which each watering
+# happens (0 = at planting) and the rain pattern has one bool per growth
+# day (missing days are dry). Fertilizer is applied at planting. Each
+# outcome is worked out once with a real Crop and kept in an LRU table of
+# `maxsize` entries.
+#
+# harvest_day and death_day count growth days from planting (harvest_day is
+# None if the plan never ripens); profit is the sell price minus what the
+# seed, water and fertilizer cost at SHOP_ITEMS prices.
+Outcome = namedtuple('Outcome', ['harvest_day', 'death_day', 'cost', 'profit'])
+
+
+def unit_prices():
+    # Coins per unit of every shop item
+    return {name: price / quantity for name, price, quantity in hh.SHOP_ITEMS}
+
+
+class Planner:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.table = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.prices = unit_prices()
+        self.ranked = []  # (crop type, minimal-plan Outcome), best profit first
+        self.precompute()
+
+    def _key(self, crop_type, waterings, fertilizers, rain):
+        t = hh.CATALOG.ids[crop_type]
+        if waterings is None:
+            # Just enough watering at planting to cover what rain doesn't
+            rain_days = sum(1 for wet in rain[:hh.CATALOG.grow_time[t]] if wet)
+            waterings = max(hh.CATALOG.water_needed[t] - rain_days, 0)
+        if isinstance(waterings, int):
+            waterings = (0,) * waterings
+        if fertilizers is None:
+            fertilizers = hh.CATALOG.fertilizer_needed[t]
+        # Rain after the death day can't matter
+        rain = tuple(bool(wet) for wet in rain[:hh.CATALOG.death_day[t]])
+        while rain and not rain[-1]:
+            rain = rain[:-1]
+        return crop_type, tuple(sorted(waterings)), fertilizers, rain
+
+    def outcome(self, crop_type, waterings=None, fertilizers=None, rain=()):
+        # waterings may be a count (all at planting) or a tuple of growth
+        # days; None waters and fertilizes just enough
+        key = self._key(crop_type, waterings, fertilizers, rain)
+        result = self.table.get(key)
+        if result is not None:
+            self.hits += 1
+            self.table.move_to_end(key)
+            return result
+        self.misses += 1
+        result = self.table[key] = self._simulate(*key)
+        if len(self.table) > self.maxsize:
+            self.table.popitem(last=False)
+        return result
+
+    def _simulate(self, crop_type, waterings, fertilizers, rain):
+        crop = hh.Crop()
+        crop.plant(crop_type)
+        for _ in range(fertilizers):
+            crop.fertilize()
+        death_day = hh.CATALOG.death_day[crop.type_id]
+        harvest_day = None
+        for day in range(death_day):
+            for _ in range(waterings.count(day)):
+                crop.water()
+            crop.advance_day(rain=day < len(rain) and rain[day])
+            if crop.stage == 3:
+                harvest_day = day + 1
+                break
+        cost = self.prices[crop_type] + len(waterings) * self.prices['Water'] + \
+            fertilizers * self.prices['Fertilizer']
+        profit = (hh.CROP_TYPES[crop_type]['sell_price'] if harvest_day else 0) - cost
+        return Outcome(harvest_day, death_day, cost, profit)
+
+    def precompute(self):
+        # The minimal plan of every crop, ranked by profit
+        ranked = [(crop_type, self.outcome(crop_type)) for crop_type in hh.CROP_TYPES]
+        ranked.sort(key=lambda item: (-item[1].profit, item[1].harvest_day or 0))
+        self.ranked = ranked
+
+    def best_crop(self, days_left, inventory, coins=0):
+        # The most profitable crop that ripens within days_left growth days
+        # and that the inventory (plus coins for missing items) can cover
+        for crop_type, outcome in self.ranked:
+            if outcome.harvest_day is None or outcome.harvest_day > days_left or outcome.profit <= 0:
+                continue
+            t = hh.CATALOG.ids[crop_type]
+            shortfall = 0.0
+            if inventory.get(crop_type, 0) <= 0:
+                shortfall += self.prices[crop_type]
+            missing = hh.CATALOG.water_needed[t] - inventory.get('Water', 0)
+            if missing > 0:
+                shortfall += missing * self.prices['Water']
+            missing = hh.CATALOG.fertilizer_needed[t] - inventory.get('Fertilizer', 0)
+            if missing > 0:
+                shortfall += missing * self.prices['Fertilizer']
+            if shortfall <= coins:
+                return crop_type
+        return None
+
+    def stats(self):
+        return {'entries': len(self.table), 'hits': self.hits, 'misses': self.misses}
+
+
+# --- Planning Policy ---
+# Like GreedyPolicy, but plants whatever the planner says pays best in the
+# days left of a `days` long season.
+class PlannedPolicy:
+    def __init__(self, days=30, planner=None):
+        self.days = days
+        self.planner = planner or Planner()
+
+    def __call__(self, game):
+        farm, player = game.farm, game.player
+        cells = [(x, y) for x in range(farm.size) for y in range(farm.size)]
+        for x, y in cells:
+            if farm.grid[x][y].stage == 3:
+                game.harvest(x, y)
+        for x, y in cells:
+            crop = farm.grid[x][y]
+            if crop.stage in [1, 2]:
+                t = crop.type_id
+                if crop.watered < hh.CATALOG.water_needed[t]:
+                    game.water(x, y)
+                if crop.fertilized < hh.CATALOG.fertilizer_needed[t]:
+                    game.fertilize(x, y)
+        days_left = self.days - game.day
+        for x, y in cells:
+            if player.energy <= 0:
+                break
+            if farm.grid[x][y].stage != 0:
+                continue
+            crop_type = self.planner.best_crop(days_left, player.inventory, player.coins)
+            if crop_type is None:
+                break
+            if player.inventory.get(crop_type, 0) <= 0 and not game.buy(crop_type):
+                break
+            if not game.plant(x, y, crop_type):
+                break
+        if player.inventory.get('Water', 0) == 0 and player.energy > 0:
+            game.buy('Water')
@@ -0,0 +1,147 @@
+import heapq
+import harvest_haven as hh
+
+# --- Scheduled Farm ---
+# A Farm whose day tick only touches crops that change stage that day.
+#
+# A crop's stage only changes at predictable days_grown values: Planted ->
+# Growing after one day, then a check at grow_time, one check per day while
+# it waits for water/fertilizer until its death day, and death at its
+# death day (grow_time + 3 unless the catalog says otherwise). Each active crop has one pending entry in a priority queue
+# keyed by the day of its next check; Empty and Dead cells have none.
+#
+# days_grown and watered of active crops are kept lazily: each active cell
+# remembers the tick and rain counters at which its Crop was last brought up
+# to date, and rain is a single global counter. Reading farm.grid brings
+# every active crop up to date once per day; the action methods only sync
+# the cell they touch. Change cells through the Farm methods, not by
+# assigning to Crop fields, so the schedule stays in step.
+class ScheduledFarm(hh.Farm):
+    def __init__(self, size=5):
+        self.day = 0
+        self.rain_days = 0
+        self.active = {}  # (x, y) -> [synced day, synced rain_days, schedule seq]
+        self.queue = []  # (day, seq, x, y)
+        self.seq = 0
+        self._synced = (0, 0)
+        super().__init__(size)
+
+    @property
+    def grid(self):
+        if self._synced != (self.day, self.rain_days):
+            for x, y in self.active:
+                self._sync(x, y)
+            self._synced = (self.day, self.rain_days)
+        return self._grid
+
+    @grid.setter
+    def grid(self, value):
+        self._grid = value
+
+    def _sync(self, x, y):
+        entry = self.active[(x, y)]
+        crop = self._grid[x][y]
+        crop.days_grown += self.day - entry[0]
+        crop.watered += self.rain_days - entry[1]
+        entry[0] = self.day
+        entry[1] = self.rain_days
+
+    def _cell(self, x, y):
+        if (x, y) in self.active:
+            self._sync(x, y)
+        return self._grid[x][y]
+
+    def _next_check(self, crop):
+        # Days from now until the crop's stage may next change
+        if crop.stage == 1:
+            return 1
+        if crop.stage == 3:
+            return max(hh.CATALOG.death_day[crop.type_id] - crop.days_grown, 1)
+        return max(hh.CATALOG.grow_time[crop.type_id] - crop.days_grown, 1)
+
+    def _schedule(self, x, y):
+        crop = self._grid[x][y]
+        if crop.stage in [0, 4]:
+            self.active.pop((x, y), None)
+            return
+        self.seq += 1
+        self.active[(x, y)] = [self.day, self.rain_days, self.seq]
+        heapq.heappush(self.queue, (self.day + self._next_check(crop), self.seq, x, y))
+
+    def reschedule_all(self):
+        # Rebuild the schedule from the crops themselves, e.g. after loading
+        self.active = {}
+        self.queue = []
+        for x, row in enumerate(self._grid):
+            for y, crop in enumerate(row):
+                self._schedule(x, y)
+
+    def plant(self, x, y, crop_type):
+        crop = self._cell(x, y)
+        if crop is hh.EMPTY_PLOT:
+            crop = self._grid[x][y] = hh.Crop()
+        crop.plant(crop_type)
+        self._schedule(x, y)
+        self._notify([(x, y)])
+
+    def water(self, x, y):
+        self._cell(x, y).water()
+        self._notify([(x, y)])
+
+    def fertilize(self, x, y):
+        self._cell(x, y).fertilize()
+        self._notify([(x, y)])
+
+    def harvest(self, x, y):
+        crop_type = self._cell(x, y).harvest()
+        if crop_type:
+            self._schedule(x, y)
+            self._notify([(x, y)])
+        return crop_type
+
+    def kill(self, x, y):
+        crop = self._cell(x, y)
+        if crop.stage in [1, 2]:
+            crop.stage = 4  # Dead
+            self._schedule(x, y)
+            self._notify([(x, y)])
+
+    def set_cell(self, x, y, crop_data):
+        self._grid[x][y] = hh.crop_from_dict(crop_data)
+        self._schedule(x, y)
+        self._notify([(x, y)])
+
+    def advance_day(self, rain=False):
+        self.day += 1
+        if rain:
+            self.rain_days += 1
+        changed = []
+        while self.queue and self.queue[0][0] <= self.day:
+            _, seq, x, y = heapq.heappop(self.queue)
+            entry = self.active.get((x, y))
+            if entry is None or entry[2] != seq:
+                continue  # Superseded by a later schedule
+            self._sync(x, y)
+            self._grid[x][y].update_stage()
+            self._schedule(x, y)
+            changed.append((x, y))
+        if self.listeners:
+            # Every active crop's days_grown moved, not just the checked ones
+            checked = set(changed)
+            self._notify(changed + [cell for cell in self.active if cell not in checked])
+
+    def advance_days(self, n, weather_sequence=None):
+        super().advance_days(n, weather_sequence)
+        self.reschedule_all()
+
+    @classmethod
+    def from_dict(cls, data):
+        farm = super().from_dict(data)
+        farm.reschedule_all()
+        return farm
+
+    @classmethod
+    def from_arrays(cls, size, type_names, fields):
+        farm = super().from_arrays(size, type_names, fields)
+        farm.reschedule_all()
+        return farm
@@ -0,0 +1,211 @@
+import argparse
+import asyncio
+import copy
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import harvest_haven as hh
+from harvest_haven_batch import HeadlessGame
+
+# --- Game Server ---
+# Hosts many games in one process. Clients talk JSON lines over TCP; each
+# request names a session and an action from main():
+#   {"session": "alice", "action": "new", "seed": 1, "size": 5}
+#   {"session": "alice", "action": "plant", "x": 0, "y": 0, "crop": "Wheat"}
+#   {"session": "alice", "action": "water" | "fertilize" | "harvest", "x": 0, "y": 0}
+#   {"session": "alice", "action": "buy", "item": "Water"}
+#   {"session": "alice", "action": "state" | "save" | "end_day" | "close"}
+# and every request gets one reply line: {"ok": true|false, "message": ..., "state": {...}}.
+#
+# Sessions only share the event loop: each has its own Player, Farm and
+# EventEngine. end_day requests are queued and the ticker advances every
+# waiting session in one batch every tick_interval seconds. Saves are
+# snapshotted on the loop and written by a thread pool, so the loop never
+# waits on disk.
+#
+# Session names double as save file names, so they must match SESSION_NAME,
+# and "new" farms are capped at MAX_FARM_SIZE cells a side.
+SESSION_NAME = re.compile(r'[A-Za-z0-9_-]{1,64}')
+MAX_FARM_SIZE = 100
+
+
+class Session:
+    def __init__(self, name, seed=None, size=5):
+        self.name = name
+        self.game = HeadlessGame(seed, size=size)
+        self.last_event = self.game.events.run_day(self.game.farm)
+
+    def state(self):
+        player = self.game.player
+        return {
+            'day': self.game.day,
+            'event': self.last_event['event'],
+            'energy': player.energy,
+            'coins': player.coins,
+            'inventory': dict(player.inventory),
+            'harvested': dict(player.harvested),
+        }
+
+    def end_day(self):
+        # Same order as main(): rest, then the next day's event
+        self.game.player.rest()
+        self.game.day += 1
+        self.last_event = self.game.events.run_day(self.game.farm)
+
+
+def _write_snapshot(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class GameServer:
+    def __init__(self, host='127.0.0.1', port=8765, save_dir='saves', tick_interval=0.05, save_workers=4):
+        self.host = host
+        self.port = port
+        self.save_dir = save_dir
+        self.tick_interval = tick_interval
+        self.sessions = {}
+        self.pending_days = {}  # session name -> futures waiting for end_day
+        self.pool = ThreadPoolExecutor(max_workers=save_workers)
+        self.server = None
+        self.ticker = None
+        self.ticks = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ticker = asyncio.get_running_loop().create_task(self.tick_loop())
+        return self
+
+    async def stop(self):
+        self.ticker.cancel()
+        self.server.close()
+        await self.server.wait_closed()
+        self.pool.shutdown(wait=True)
+
+    async def tick_loop(self):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            self.tick()
+
+    def tick(self):
+        # Advance every session that asked to end its day, in one batch
+        if not self.pending_days:
+            return
+        pending, self.pending_days = self.pending_days, {}
+        for name, waiters in pending.items():
+            session = self.sessions.get(name)
+            if session is not None:
+                session.end_day()
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(session)
+        self.ticks += 1
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit; the rest of the line can't
+                    # be told apart from the next request, so hang up
+                    writer.write((json.dumps({'ok': False, 'message': 'Request too long'}) + '\n').encode('utf-8'))
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    reply = await self.dispatch(request)
+                except (ValueError, KeyError, TypeError, IndexError) as error:
+                    reply = {'ok': False, 'message': f'Bad request: {error}'}
+                except OSError as error:
+                    reply = {'ok': False, 'message': f'Server error: {error}'}
+                writer.write((json.dumps(reply) + '\n').encode('utf-8'))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request):
+        name = str(request['session'])
+        action = request['action']
+        if not SESSION_NAME.fullmatch(name):
+            return {'ok': False, 'message': 'Session names are 1-64 letters, digits, _ or -'}
+        if action == 'new':
+            size = request.get('size', 5)
+            if not isinstance(size, int) or isinstance(size, bool) or not 1 <= size <= MAX_FARM_SIZE:
+                return {'ok': False, 'message': f'size must be an integer from 1 to {MAX_FARM_SIZE}'}
+            session = self.sessions[name] = Session(name, request.get('seed'), size)
+            return {'ok': True, 'message': f'Started {name}', 'state': session.state()}
+        session = self.sessions.get(name)
+        if session is None:
+            return {'ok': False, 'message': f'No session {name}'}
+        game = session.game
+        if action in ('plant', 'water', 'fertilize', 'harvest'):
+            x, y = int(request['x']), int(request['y'])
+            if not (0 <= x < game.farm.size and 0 <= y < game.farm.size):
+                return {'ok': False, 'message': 'Outside the farm', 'state': session.state()}
+            if action == 'plant':
+                ok = game.plant(x, y, request['crop'])
+            else:
+                ok = getattr(game, action)(x, y)
+            return {'ok': ok, 'message': f'{action} ({x},{y})', 'state': session.state()}
+        if action == 'buy':
+            ok = game.buy(request['item'])
+            return {'ok': ok, 'message': f"buy {request['item']}", 'state': session.state()}
+        if action == 'state':
+            return {'ok': True, 'state': session.state(), 'farm': game.farm.to_dict()}
+        if action == 'save':
+            path = await self.save(session)
+            return {'ok': True, 'message': f'Saved to {path}'}
+        if action == 'end_day':
+            waiter = asyncio.get_running_loop().create_future()
+            self.pending_days.setdefault(name, []).append(waiter)
+            await waiter
+            return {'ok': True, 'message': hh.EVENT_MESSAGES[session.last_event['event']], 'state': session.state()}
+        if action == 'close':
+            del self.sessions[name]
+            return {'ok': True, 'message': f'Closed {name}'}
+        return {'ok': False, 'message': f'Unknown action {action}'}
+
+    async def save(self, session):
+        # Snapshot on the loop so the thread never sees a half-applied action
+        data = {'player': copy.deepcopy(session.game.player.to_dict()), 'farm': session.game.farm.to_dict()}
+        os.makedirs(self.save_dir, exist_ok=True)
+        path = os.path.join(self.save_dir, f'{session.name}.json')
+        await asyncio.get_running_loop().run_in_executor(self.pool, _write_snapshot, path, data)
+        return path
+
+
+async def serve(host, port, save_dir, tick_interval):
+    server = await GameServer(host, port, save_dir, tick_interval).start()
+    print(f'Harvest Haven server listening on {server.host}:{server.port}')
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Host many Harvest Haven games over a JSON line protocol.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--save-dir', default='saves')
+    parser.add_argument('--tick-interval', type=float, default=0.05)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.save_dir, args.tick_interval))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+import harvest_haven as hh
+
+# --- Snapshots ---
+# A Snapshot is an immutable copy of a Player and a Farm. The farm is kept
+# as a tuple of rows, each row a tuple of cell states
+# (type_id, stage, days_grown, watered, fertilized). A Tracker listens to
+# the farm and rebuilds only the rows that changed since its last
+# snapshot; every other row tuple is shared with the previous snapshot.
+# Each changed row is copied whole, so taking a snapshot costs
+# O(changed rows x width) plus O(height) for the new tuple of row
+# references, not O(changed cells): one watered cell copies its whole row.
+#
+# History builds undo/redo on top: call record() before each player action,
+# then undo()/redo() move the live Player and Farm between snapshots. A
+# restore compares the rows the two snapshots don't share, cell by cell
+# (O(differing rows x width)), and rewrites only the cells that differ. Snapshot.fork() turns any snapshot
+# into an independent game for what-if runs.
+EMPTY_STATE = (0, 0, 0, 0, 0)
+
+
+def _copy_player(data):
+    # Player dicts share their inventory dicts with the Player
+    data = dict(data)
+    data['inventory'] = dict(data['inventory'])
+    data['harvested'] = dict(data['harvested'])
+    return data
+
+
+def _row_state(farm, x):
+    if hasattr(farm, 'type_id'):
+        return tuple(zip(farm.type_id[x].tolist(), farm.stage[x].tolist(), farm.days_grown[x].tolist(),
+                         farm.watered[x].tolist(), farm.fertilized[x].tolist()))
+    return tuple(EMPTY_STATE if crop is hh.EMPTY_PLOT else
+                 (crop.type_id, crop.stage, crop.days_grown, crop.watered, crop.fertilized)
+                 for crop in farm.grid[x])
+
+
+def _cell_dict(state):
+    type_id, stage, days_grown, watered, fertilized = state
+    return {
+        'type': hh.CATALOG.names[type_id],
+        'stage': stage,
+        'days_grown': days_grown,
+        'watered': watered,
+        'fertilized': fertilized
+    }
+
+
+class Snapshot:
+    __slots__ = ('player', 'size', 'rows')
+
+    def __init__(self, player, size, rows):
+        self.player = player  # Player.to_dict() copy
+        self.size = size
+        self.rows = rows
+
+    def cell(self, x, y):
+        return _cell_dict(self.rows[x][y])
+
+    def shared_rows(self, other):
+        # How many row tuples this snapshot shares with another
+        return sum(1 for mine, theirs in zip(self.rows, other.rows) if mine is theirs)
+
+    def fork(self, farm_cls=None):
+        # A new, independent (Player, Farm) holding this snapshot's state
+        player = hh.Player.from_dict(_copy_player(self.player))
+        farm = (farm_cls or hh.Farm)(self.size)
+        for x, row in enumerate(self.rows):
+            for y, state in enumerate(row):
+                if state != EMPTY_STATE:
+                    farm.set_cell(x, y, _cell_dict(state))
+        return player, farm
+
+
+class Tracker:
+    def __init__(self, player, farm):
+        self.player = player
+        self.farm = farm
+        self.dirty_rows = set()
+        self.last = Snapshot(_copy_player(player.to_dict()), farm.size,
+                             tuple(_row_state(farm, x) for x in range(farm.size)))
+        farm.add_listener(self._changed)
+
+    def _changed(self, cells):
+        self.dirty_rows.update(x for x, _ in cells)
+
+    def detach(self):
+        self.farm.remove_listener(self._changed)
+
+    def snapshot(self):
+        if self.dirty_rows:
+            rows = list(self.last.rows)
+            for x in self.dirty_rows:
+                rows[x] = _row_state(self.farm, x)
+            self.dirty_rows.clear()
+            rows = tuple(rows)
+        else:
+            rows = self.last.rows
+        self.last = Snapshot(_copy_player(self.player.to_dict()), self.farm.size, rows)
+        return self.last
+
+    def restore(self, snapshot):
+        # Rewrites only the cells that differ from the current state
+        current = self.snapshot()
+        for x, (row, target) in enumerate(zip(current.rows, snapshot.rows)):
+            if row is target:
+                continue
+            for y, (state, wanted) in enumerate(zip(row, target)):
+                if state != wanted:
+                    self.farm.set_cell(x, y, _cell_dict(wanted))
+        restored = hh.Player.from_dict(_copy_player(snapshot.player))
+        vars(self.player).update(vars(restored))
+        # The farm now matches the snapshot exactly, so keep sharing its rows
+        self.dirty_rows.clear()
+        self.last = snapshot
+
+
+class History:
+    def __init__(self, player, farm, limit=100):
+        self.tracker = Tracker(player, farm)
+        self.limit = limit
+        self.undo_stack = []
+        self.redo_stack = []
+
+    def record(self):
+        # Call before a player action
+        self.undo_stack.append(self.tracker.snapshot())
+        if len(self.undo_stack) > self.limit:
+            del self.undo_stack[0]
+        self.redo_stack.clear()
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self):
+        if not self.undo_stack:
+            return False
+        self.redo_stack.append(self.tracker.snapshot())
+        self.tracker.restore(self.undo_stack.pop())
+        return True
+
+    def redo(self):
+        if not self.redo_stack:
+            return False
+        self.undo_stack.append(self.tracker.snapshot())
+        self.tracker.restore(self.redo_stack.pop())
+        return True
+
+    def clear(self):
+        # Forget the stacks, e.g. once the day has ended
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def snapshot(self):
+        return self.tracker.snapshot()
+
+    def detach(self):
+        self.tracker.detach()
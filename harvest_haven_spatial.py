@@ -0,0 +1,168 @@
+import math
+import time
+
+import numpy as np
+
+import harvest_haven as hh
+from harvest_haven_array import ArrayFarm, tick
+
+# --- Spatial Events ---
+# Local weather and pests for array farms, in place of the EventEngine's
+# one-event-per-day model. Two float32 fields cover the farm, one value
+# per cell:
+#   clouds  regional rain fronts: coarse noise, blown across the farm by
+#           `wind` and smoothed with `rain_kernel`. Cells at or above
+#           rain_level get rain, cells at or below drought_level drought.
+#   pests   infestation density in [0, 1]: each day new outbreaks appear
+#           at `outbreak_rate`, the field spreads to neighbours through
+#           `pest_kernel`, grows logistically (`pest_growth`) on live crops,
+#           decays, and bare ground holds pests poorly. An outbreak moves
+#           outward as a front and dies down behind it.
+# Every day is a handful of whole-array passes (stencils, masks, one tick),
+# so the cost is linear in the number of cells.
+#
+# The rules per cell follow apply_event: a Planted or Growing crop (the
+# stages Farm.kill affects) that pests reach with density p dies with
+# probability p once p >= pest_kill; ripe crops survive. Drought cells don't
+# grow and lose one unit of water; everything else grows, rain cells with a
+# free watering. All randomness comes from one numpy Generator, so a seed
+# fixes the whole season.
+PEST_KERNEL = [[0.05, 0.1, 0.05],
+               [0.1, 0.4, 0.1],
+               [0.05, 0.1, 0.05]]
+RAIN_KERNEL = [[1 / 9] * 3] * 3
+BARE_PEST_FACTOR = 0.5  # Share of pests that survive a day on an empty or dead cell
+
+
+def convolve(field, kernel, mode='constant'):
+    # 2D stencil: one shifted multiply-add per kernel weight. mode is
+    # np.pad's: 'constant' pads with zeros (pests fall off the farm),
+    # 'edge' repeats the border (clouds don't thin out at the edges)
+    kernel = np.asarray(kernel, dtype=np.float32)
+    kx, ky = kernel.shape
+    if kx % 2 == 0 or ky % 2 == 0:
+        raise ValueError('kernels need odd dimensions')
+    n, m = field.shape
+    padded = np.pad(field, ((kx // 2,) * 2, (ky // 2,) * 2), mode=mode)
+    out = np.zeros_like(field)
+    for i in range(kx):
+        for j in range(ky):
+            if kernel[i, j]:
+                out += kernel[i, j] * padded[i:i + n, j:j + m]
+    return out
+
+
+def shift(field, dx, dy):
+    # Moves the field dx rows down and dy columns right; what leaves one
+    # side comes back in on the other, so the windward edge gets weather
+    # like everywhere else
+    return np.roll(field, (dx, dy), axis=(0, 1))
+
+
+class SpatialEvents:
+    def __init__(self, size, seed=None, pest_kernel=PEST_KERNEL, rain_kernel=RAIN_KERNEL,
+                 outbreak_rate=0.0001, pest_growth=1.0, pest_decay=0.9, pest_kill=0.5,
+                 front_scale=16, wind=(0, 1), persistence=0.7, rain_level=0.6, drought_level=0.35):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.pest_kernel = pest_kernel
+        self.rain_kernel = rain_kernel
+        self.outbreak_rate = outbreak_rate
+        self.pest_growth = pest_growth
+        self.pest_decay = pest_decay
+        self.pest_kill = pest_kill
+        self.front_scale = front_scale
+        self.wind = wind
+        self.persistence = persistence
+        self.rain_level = rain_level
+        self.drought_level = drought_level
+        self.pests = np.zeros((size, size), dtype=np.float32)
+        self.clouds = self._fronts()
+        self.days = 0
+
+    def _fronts(self):
+        # Noise that is constant over front_scale x front_scale blocks, with
+        # the block edges smoothed
+        blocks = math.ceil(self.size / self.front_scale)
+        coarse = self.rng.random((blocks, blocks), dtype=np.float32)
+        fine = coarse.repeat(self.front_scale, axis=0).repeat(self.front_scale, axis=1)
+        return convolve(fine[:self.size, :self.size], self.rain_kernel, mode='edge')
+
+    def step(self, active, growing):
+        # Advances the fields one day; pests live on the `active` cells and
+        # kill among the `growing` ones. Returns the (rain, drought, killed)
+        # masks
+        keep = self.persistence
+        self.clouds = shift(self.clouds, *self.wind) * keep + self._fronts() * (1 - keep)
+        rain = self.clouds >= self.rain_level
+        drought = self.clouds <= self.drought_level
+
+        shape = (self.size, self.size)
+        self.pests[self.rng.random(shape, dtype=np.float32) < self.outbreak_rate] = 1.0
+        pests = convolve(self.pests, self.pest_kernel)
+        pests += np.where(active, self.pest_growth * pests * (1 - pests), (BARE_PEST_FACTOR - 1) * pests)
+        pests *= self.pest_decay
+        np.clip(pests, 0, 1, out=pests)
+        self.pests = pests
+        killed = growing & (pests >= self.pest_kill) & (self.rng.random(shape, dtype=np.float32) < pests)
+        return rain, drought, killed
+
+    def run_day(self, farm):
+        # Applies one day to an ArrayFarm and returns a summary record
+        if not isinstance(farm, ArrayFarm) or farm.size != self.size:
+            raise TypeError(f'SpatialEvents needs an ArrayFarm of size {self.size}')
+        active = (farm.stage != 0) & (farm.stage != 4)
+        growing = (farm.stage == 1) | (farm.stage == 2)
+        rain, drought, killed = self.step(active, growing)
+        farm.stage[killed] = 4  # Dead
+        dry = active & drought & ~killed
+        farm.watered[dry & (farm.watered > 0)] -= 1
+        grew = tick(farm.type_id, farm.stage, farm.days_grown, farm.watered, farm.fertilized,
+                    rain=rain, where=~drought)
+        if farm.listeners:
+            changed = grew | killed | dry
+            farm._notify([tuple(cell) for cell in np.argwhere(changed).tolist()])
+        self.days += 1
+        return {
+            'day': self.days,
+            'event': 'spatial',
+            'rain': int(rain.sum()),
+            'drought': int(drought.sum()),
+            'infested': int((self.pests >= self.pest_kill).sum()),
+            'killed': int(killed.sum()),
+        }
+
+
+# --- Benchmark ---
+def planted_farm(size, fill=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    farm = ArrayFarm(size)
+    planted = rng.random((size, size)) < fill
+    farm.type_id[planted] = rng.integers(1, len(hh.CATALOG.names), planted.sum())
+    farm.stage[planted] = 1
+    return farm
+
+
+def bench(size, days=10, seed=0):
+    # Seconds per simulated day
+    farm = planted_farm(size, seed=seed)
+    events = SpatialEvents(size, seed)
+    events.run_day(farm)  # Warm-up
+    start = time.perf_counter()
+    for _ in range(days):
+        events.run_day(farm)
+    return (time.perf_counter() - start) / days
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Time the spatial event model per simulated day.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 500, 1000])
+    parser.add_argument('--days', type=int, default=10)
+    args = parser.parse_args(argv)
+    for size in args.sizes:
+        seconds = bench(size, args.days)
+        print(f'{size}x{size}: {seconds * 1000:8.1f} ms/day  {seconds / (size * size) * 1e9:6.1f} ns/cell')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+
+import harvest_haven as hh
+
+# --- Terminal Renderer ---
+# An ANSI front end for terminals and SSH sessions. The renderer keeps the
+# last frame it drew (the emoji of every visible cell and each status line)
+# and listens to the farm, so a redraw only checks the cells that changed
+# and only writes escape sequences for what actually looks different. The
+# bytes written per day grow with the number of changes, not the farm size.
+#
+# Screen layout (1-based terminal rows):
+#   1..STATUS_LINES   day/energy/coins, inventory, harvested, last message
+#   then              the viewport: as many farm rows and columns as fit
+#   second-to-last    the command prompt (the last row stays blank so the
+#                     newline after a command never scrolls the screen)
+# Grids larger than the terminal scroll with the viewport.
+STATUS_LINES = 4
+CELL_WIDTH = 3  # A double-width emoji and a space
+CSI = '\x1b['
+CLEAR = CSI + '2J'
+CLEAR_LINE = CSI + 'K'
+
+
+def _move(row, col):
+    return f'{CSI}{row};{col}H'
+
+
+class TerminalRenderer:
+    def __init__(self, farm, out=None, lines=None, columns=None):
+        self.farm = farm
+        self.out = out or sys.stdout
+        size = shutil.get_terminal_size()
+        self.lines = lines or size.lines
+        self.columns = columns or size.columns
+        self.top = 0  # First visible farm row
+        self.left = 0  # First visible farm column
+        self.cells = {}  # (x, y) -> emoji on screen, visible cells only
+        self.status = []  # Status lines on screen
+        self.dirty = set()
+        self.full = True  # Next frame repaints everything
+        farm.add_listener(self._changed)
+
+    def _changed(self, cells):
+        self.dirty.update(cells)
+
+    def detach(self):
+        self.farm.remove_listener(self._changed)
+
+    # Viewport
+    def view_size(self):
+        # (rows, columns) of farm cells that fit on screen
+        return (max(self.lines - STATUS_LINES - 2, 1), max(self.columns // CELL_WIDTH, 1))
+
+    def viewport(self):
+        # Visible (first_row, last_row, first_col, last_col), end exclusive
+        rows, cols = self.view_size()
+        return (self.top, min(self.top + rows, self.farm.size),
+                self.left, min(self.left + cols, self.farm.size))
+
+    def scroll(self, rows, cols):
+        view_rows, view_cols = self.view_size()
+        top = min(max(self.top + rows, 0), max(self.farm.size - view_rows, 0))
+        left = min(max(self.left + cols, 0), max(self.farm.size - view_cols, 0))
+        if (top, left) != (self.top, self.left):
+            self.top, self.left = top, left
+            self.full = True
+
+    def page(self, rows, cols):
+        # Scrolls by half a screen per step
+        view_rows, view_cols = self.view_size()
+        self.scroll(rows * max(view_rows // 2, 1), cols * max(view_cols // 2, 1))
+
+    def resize(self, lines, columns):
+        if (lines, columns) != (self.lines, self.columns):
+            self.lines, self.columns = lines, columns
+            self.scroll(0, 0)  # Clamp to the new size
+            self.full = True
+
+    def prompt_row(self):
+        return max(self.lines - 1, STATUS_LINES + 2)
+
+    # Frames
+    def _cell(self, x, y):
+        return hh.get_crop_emoji(self.farm.grid[x][y])
+
+    def _cell_writes(self, cells):
+        # Escape sequences for (x, y, emoji) in row-major order; cells that
+        # follow each other on a row skip the cursor move
+        parts = []
+        cursor = None
+        for x, y, emoji in cells:
+            row = STATUS_LINES + 1 + x - self.top
+            col = (y - self.left) * CELL_WIDTH + 1
+            if cursor == (row, col - 1):
+                parts.append(' ')
+            else:
+                parts.append(_move(row, col))
+            parts.append(emoji)
+            cursor = (row, col + 2)
+        return parts
+
+    def frame(self, status):
+        # The escape sequences that turn the last frame into this one
+        status = [line[:self.columns] for line in status]
+        first_row, last_row, first_col, last_col = self.viewport()
+        parts = []
+        if self.full:
+            parts.append(CLEAR)
+            self.status = [''] * STATUS_LINES
+            self.cells = {(x, y): self._cell(x, y)
+                          for x in range(first_row, last_row) for y in range(first_col, last_col)}
+            changed = [(x, y, emoji) for (x, y), emoji in self.cells.items()]
+            self.full = False
+        else:
+            changed = []
+            for x, y in sorted(self.dirty):
+                if first_row <= x < last_row and first_col <= y < last_col:
+                    emoji = self._cell(x, y)
+                    if self.cells.get((x, y)) != emoji:
+                        self.cells[(x, y)] = emoji
+                        changed.append((x, y, emoji))
+        self.dirty.clear()
+        for i, line in enumerate(status[:STATUS_LINES]):
+            if line != self.status[i]:
+                parts.append(_move(i + 1, 1) + line + CLEAR_LINE)
+                self.status[i] = line
+        parts.extend(self._cell_writes(changed))
+        parts.append(_move(self.prompt_row(), 1) + CLEAR_LINE)
+        return ''.join(parts)
+
+    def draw(self, status):
+        # Writes the next frame; returns how many bytes that took
+        text = self.frame(status)
+        self.out.write(text)
+        self.out.flush()
+        return len(text.encode('utf-8'))
+
+
+def status_lines(game, renderer, message=''):
+    first_row, last_row, first_col, last_col = renderer.viewport()
+    player = game.player
+    return [
+        f'Day {game.day} | Energy: {player.energy} | Coins: {player.coins} | '
+        f'Rows {first_row}-{last_row - 1} Cols {first_col}-{last_col - 1} of {game.farm.size}',
+        'Inventory: ' + ', '.join(f'{name} {count}' for name, count in player.inventory.items()),
+        'Harvested: ' + ', '.join(f'{name} {count}' for name, count in player.harvested.items()),
+        message,
+    ]
+
+
+# --- Terminal Game ---
+# Commands, typed at the prompt:
+#   p X Y CROP  plant      w X Y  water      f X Y  fertilize   h X Y  harvest
+#   b ITEM      buy        n      end day    s      save        q      quit
+#   < > ^ v     scroll the viewport by half a screen
+SCROLL_KEYS = {'<': (0, -1), '>': (0, 1), '^': (-1, 0), 'v': (1, 0)}
+HELP = 'p X Y CROP | w/f/h X Y | b ITEM | n end day | s save | q quit | < > ^ v scroll'
+
+
+def _quiet(func, *args):
+    # save_game/load_game print, which would scribble over the frame
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def run_command(game, renderer, command, save_file):
+    # Applies one command; returns (message, keep playing)
+    words = command.split()
+    if not words:
+        return '', True
+    name, args = words[0], words[1:]
+    if name in SCROLL_KEYS:
+        renderer.page(*SCROLL_KEYS[name])
+        return '', True
+    if name == 'q':
+        return '', False
+    if name == 'n':
+        game.player.rest()
+        game.day += 1
+        event = game.events.run_day(game.farm)['event']
+        return hh.EVENT_MESSAGES[event] or 'A quiet day.', True
+    if name == 's':
+        _quiet(hh.save_game, game.player, game.farm, save_file)
+        return f'Saved to {save_file}', True
+    if name == 'b' and args:
+        item = ' '.join(args)
+        return (f'Bought {item}' if game.buy(item) else f'Could not buy {item}'), True
+    actions = {'p': game.plant, 'w': game.water, 'f': game.fertilize, 'h': game.harvest}
+    if name in actions and len(args) >= 2:
+        try:
+            x, y = int(args[0]), int(args[1])
+        except ValueError:
+            return HELP, True
+        if not (0 <= x < game.farm.size and 0 <= y < game.farm.size):
+            return f'({x},{y}) is off the farm', True
+        if name == 'p':
+            done = len(args) > 2 and game.plant(x, y, ' '.join(args[2:]))
+        else:
+            done = actions[name](x, y)
+        return (f'Done at ({x},{y})' if done else f'Could not do that at ({x},{y})'), True
+    return HELP, True
+
+
+def main(argv=None):
+    import argparse
+    from harvest_haven_batch import HeadlessGame
+    parser = argparse.ArgumentParser(description='Play Harvest Haven in a terminal.')
+    parser.add_argument('--size', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--engine', choices=['object', 'array', 'scheduled'], default='object')
+    parser.add_argument('--save', default='harvest_haven_save.json')
+    parser.add_argument('--load', action='store_true', help='continue the game in --save')
+    args = parser.parse_args(argv)
+    game = HeadlessGame(args.seed, size=args.size, engine=args.engine, keep_log=False)
+    if args.load and os.path.exists(args.save):
+        game.player, game.farm = _quiet(hh.load_game, args.save, type(game.farm))
+    renderer = TerminalRenderer(game.farm)
+    message = hh.EVENT_MESSAGES[game.events.run_day(game.farm)['event']] or HELP
+    playing = True
+    try:
+        while playing:
+            size = shutil.get_terminal_size()
+            renderer.resize(size.lines, size.columns)
+            renderer.draw(status_lines(game, renderer, message))
+            try:
+                command = input('> ')
+            except EOFError:
+                break
+            message, playing = run_command(game, renderer, command, args.save)
+    finally:
+        renderer.detach()
+        sys.stdout.write(_move(renderer.lines, 1) + '\n')
+
+if __name__ == '__main__':
+    main()
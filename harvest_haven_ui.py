@@ -1,17 +1,35 @@
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from tkinter import simpledialog, ttk
 import harvest_haven as hh
+import harvest_haven_bulk as bulk
+from harvest_haven_canvas import FarmCanvas
+from harvest_haven_journal import SaveJournal
+from harvest_haven_snapshot import History
+from harvest_haven_worker import Worker
 
 class HarvestHavenUI:
-    def __init__(self, root):
+    def __init__(self, root, seed=None):
         self.root = root
         self.root.title('Harvest Haven')
         self.player = hh.Player()
         self.farm = hh.Farm()
+        self.journal = SaveJournal()
+        self.journal.attach(self.player, self.farm)
+        self.events = hh.EventEngine(seed)
         self.day = 1
         self.selected_action = None
+        # Cells changed since the last repaint, filled in by the farm
+        self.dirty_cells = set()
+        self.farm.add_listener(self.dirty_cells.update)
+        # Undo/redo for the actions of the current day
+        self.history = History(self.player, self.farm)
+        # Day ticks and saves run here; see harvest_haven_worker
+        self.worker = Worker(self.root.after)
+        self.job = None  # What the worker is doing, for the status bar
+        self.label_text = {}
         self.create_widgets()
-        self.update_ui()
+        self.root.protocol('WM_DELETE_WINDOW', self.close)
+        self.update_ui(full=True)
 
     def create_widgets(self):
         # Top info
@@ -32,21 +50,9 @@ class HarvestHavenUI:
         self.inv_text = tk.Label(self.inv_frame, text='')
         self.inv_text.pack(side=tk.LEFT)
 
-        # Farm grid
-        self.grid_frame = tk.Frame(self.root)
-        self.grid_frame.pack(pady=10, expand=True, fill=tk.BOTH)
-        self.grid_buttons = []
-        self.button_font = ("Arial", 28)  # Larger font for emojis
-        for i in range(5):
-            self.grid_frame.grid_rowconfigure(i, weight=1)
-            row = []
-            for j in range(5):
-                self.grid_frame.grid_columnconfigure(j, weight=1)
-                btn = tk.Button(self.grid_frame, text='[ ]', font=self.button_font, width=2, height=1,
-                                command=lambda x=i, y=j: self.on_grid_click(x, y))
-                btn.grid(row=i, column=j, padx=2, pady=2, sticky="nsew")
-                row.append(btn)
-            self.grid_buttons.append(row)
+        # Farm grid, drawn on one canvas that only renders the visible cells
+        self.farm_canvas = FarmCanvas(self.root, self.farm, self.on_grid_click)
+        self.farm_canvas.pack(pady=10, expand=True, fill=tk.BOTH)
 
         # Action buttons
         self.action_frame = tk.Frame(self.root)
@@ -56,42 +62,102 @@ class HarvestHavenUI:
             ('Water', self.set_action_water),
             ('Fertilize', self.set_action_fertilize),
             ('Harvest', self.set_action_harvest),
+            ('Harvest All', self.harvest_all),
             ('Shop', self.open_shop),
+            ('Undo', self.undo),
+            ('Redo', self.redo),
             ('Save', self.save_game),
             ('End Day', self.end_day)
         ]
         for (label, cmd) in actions:
             tk.Button(self.action_frame, text=label, width=10, command=cmd).pack(side=tk.LEFT, padx=2)
 
-    def update_ui(self):
-        self.day_label.config(text=f'Day {self.day}')
-        self.energy_label.config(text=f'Energy: {self.player.energy}')
-        self.coins_label.config(text=f'Coins: {self.player.coins}')
-        self.inv_text.config(text=str(self.player.inventory))
-        # Update grid
-        for i in range(5):
-            for j in range(5):
-                crop = self.farm.grid[i][j]
-                emoji = hh.get_crop_emoji(crop)
-                self.grid_buttons[i][j].config(text=emoji)
+        # Status bar: action results and event news, with a progress bar
+        # that runs while the worker is busy
+        self.status_frame = tk.Frame(self.root, relief=tk.SUNKEN, bd=1)
+        self.status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_label = tk.Label(self.status_frame, text='Welcome to Harvest Haven!', anchor='w')
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4)
+        self.progress = ttk.Progressbar(self.status_frame, mode='indeterminate', length=120)
+        self.progress.pack(side=tk.RIGHT, padx=4, pady=2)
+
+    def set_status(self, text):
+        self.set_label(self.status_label, text)
+
+    def busy(self):
+        # Actions are rejected while the worker owns the player and farm
+        if self.worker.busy:
+            self.set_status(f'Please wait: {self.job}...')
+            return True
+        return False
+
+    def start_job(self, job, func, on_done):
+        # Runs func on the worker; on_done(result) runs back on the UI thread
+        if self.busy():
+            return False
+        self.job = job
+        self.set_status(f'{job}...')
+        self.progress.start(15)
+        self.worker.submit(func, lambda result: self._job_done(on_done, result), self._job_failed)
+        return True
+
+    def _job_done(self, on_done, result):
+        self.progress.stop()
+        on_done(result)
+
+    def _job_failed(self, error):
+        self.progress.stop()
+        self.set_status(f'{self.job} failed: {error}')
+        self.update_ui(full=True)
+
+    def close(self):
+        # Let a running save or tick finish before the window goes away
+        if self.worker.busy:
+            self.set_status(f'Closing once done: {self.job}...')
+            self.root.after(50, self.close)
+            return
+        self.worker.close()
+        self.root.destroy()
+
+    def set_label(self, label, text):
+        # Only touch the widget when its text actually changed
+        if self.label_text.get(label) != text:
+            self.label_text[label] = text
+            label.config(text=text)
+
+    def update_ui(self, full=False):
+        self.set_label(self.day_label, f'Day {self.day}')
+        self.set_label(self.energy_label, f'Energy: {self.player.energy}')
+        self.set_label(self.coins_label, f'Coins: {self.player.coins}')
+        self.set_label(self.inv_text, str(self.player.inventory))
+        # Repaint only the cells the farm reported as changed
+        if full:
+            self.farm_canvas.redraw()
+        else:
+            self.farm_canvas.refresh(self.dirty_cells)
+        self.dirty_cells.clear()
+
+    def set_action(self, action):
+        if self.busy():
+            return
+        self.selected_action = action
+        self.set_status(f'Click a grid cell to {action}.')
 
     def set_action_plant(self):
-        self.selected_action = 'plant'
-        messagebox.showinfo('Action', 'Click a grid cell to plant.')
+        self.set_action('plant')
 
     def set_action_water(self):
-        self.selected_action = 'water'
-        messagebox.showinfo('Action', 'Click a grid cell to water.')
+        self.set_action('water')
 
     def set_action_fertilize(self):
-        self.selected_action = 'fertilize'
-        messagebox.showinfo('Action', 'Click a grid cell to fertilize.')
+        self.set_action('fertilize')
 
     def set_action_harvest(self):
-        self.selected_action = 'harvest'
-        messagebox.showinfo('Action', 'Click a grid cell to harvest.')
+        self.set_action('harvest')
 
     def on_grid_click(self, x, y):
+        if self.busy():
+            return
         if self.selected_action == 'plant':
             self.plant_crop(x, y)
         elif self.selected_action == 'water':
@@ -105,94 +171,108 @@ class HarvestHavenUI:
 
     def plant_crop(self, x, y):
         if self.farm.grid[x][y].stage != 0:
-            messagebox.showwarning('Error', 'That spot is not empty.')
+            self.set_status('That spot is not empty.')
             return
         # Choose crop
         seeds = {k: v for k, v in self.player.inventory.items() if k in hh.CROP_TYPES and v > 0}
         if not seeds:
-            messagebox.showwarning('Error', 'No seeds available!')
+            self.set_status('No seeds available!')
             return
         crop_type = simpledialog.askstring('Plant', f'Which crop? {list(seeds.keys())}')
         if crop_type not in seeds:
-            messagebox.showwarning('Error', 'Invalid crop type.')
+            self.set_status('Invalid crop type.')
             return
+        self.history.record()
         self.farm.plant(x, y, crop_type)
         self.player.use_seed(crop_type)
         self.player.energy -= 1
-        messagebox.showinfo('Planted', f'Planted {crop_type} at ({x},{y})')
+        self.set_status(f'Planted {crop_type} at ({x},{y})')
 
     def water_crop(self, x, y):
-        if self.player.use_water():
+        if self.player.inventory['Water'] > 0:
+            self.history.record()
+            self.player.use_water()
             self.farm.water(x, y)
             self.player.energy -= 1
-            messagebox.showinfo('Watered', f'Watered crop at ({x},{y})')
+            self.set_status(f'Watered crop at ({x},{y})')
         else:
-            messagebox.showwarning('Error', 'No water left!')
+            self.set_status('No water left!')
 
     def fertilize_crop(self, x, y):
-        if self.player.use_fertilizer():
+        if self.player.inventory['Fertilizer'] > 0:
+            self.history.record()
+            self.player.use_fertilizer()
             self.farm.fertilize(x, y)
             self.player.energy -= 1
-            messagebox.showinfo('Fertilized', f'Fertilized crop at ({x},{y})')
+            self.set_status(f'Fertilized crop at ({x},{y})')
         else:
-            messagebox.showwarning('Error', 'No fertilizer left!')
+            self.set_status('No fertilizer left!')
 
     def harvest_crop(self, x, y):
+        if self.farm.grid[x][y].stage == 3:
+            self.history.record()
         crop_type = self.farm.harvest(x, y)
         if crop_type:
             self.player.add_harvest(crop_type)
             self.player.energy -= 1
-            messagebox.showinfo('Harvested', f'Harvested {crop_type} at ({x},{y})')
+            self.set_status(f'Harvested {crop_type} at ({x},{y})')
         else:
-            messagebox.showwarning('Error', 'Nothing to harvest there.')
+            self.set_status('Nothing to harvest there.')
+
+    def harvest_all(self):
+        if self.busy():
+            return
+        self.history.record()
+        results = bulk.harvest(self.player, self.farm, bulk.select_cells(self.farm))
+        harvested = bulk.summarize(results).get('harvested', 0)
+        self.set_status(f'Harvested {harvested} crops.' if harvested else 'Nothing to harvest.')
+        self.update_ui()
 
     def open_shop(self):
-        shop_items = [
-            ('Wheat', 2),
-            ('Tomato', 5),
-            ('Carrot', 3),
-            ('Water', 1),
-            ('Fertilizer', 2)
-        ]
-        shop_str = '\n'.join([f'{i+1}) {name} ({price} coins)' for i, (name, price) in enumerate(shop_items)])
+        if self.busy():
+            return
+        shop_items = hh.SHOP_ITEMS
+        shop_str = '\n'.join([f'{i+1}) {name} ({price} coins)' for i, (name, price, _) in enumerate(shop_items)])
         choice = simpledialog.askinteger('Shop', f'What do you want to buy?\n{shop_str}')
         if not choice or choice < 1 or choice > len(shop_items):
             return
-        name, price = shop_items[choice-1]
+        name, price, _ = shop_items[choice-1]
         if self.player.coins < price:
-            messagebox.showwarning('Error', 'Not enough coins!')
+            self.set_status('Not enough coins!')
             return
-        if name == 'Water':
-            self.player.inventory['Water'] += 3
-        else:
-            self.player.inventory[name] = self.player.inventory.get(name, 0) + 1
-        self.player.coins -= price
-        messagebox.showinfo('Shop', f'Bought {name}!')
+        self.history.record()
+        self.player.buy(name)
+        self.set_status(f'Bought {name}!')
+        self.update_ui()
+
+    def undo(self):
+        if self.busy():
+            return
+        self.set_status('Undone.' if self.history.undo() else 'Nothing to undo.')
+        self.update_ui()
+
+    def redo(self):
+        if self.busy():
+            return
+        self.set_status('Redone.' if self.history.redo() else 'Nothing to redo.')
         self.update_ui()
 
     def save_game(self):
-        hh.save_game(self.player, self.farm)
-        messagebox.showinfo('Save', 'Game saved!')
+        self.start_job('Saving', self.journal.save, lambda _: self.set_status('Game saved!'))
 
     def end_day(self):
-        # Random event
-        import random
-        event = random.choice(['none', 'rain', 'drought', 'pests'])
-        if event == 'rain':
-            messagebox.showinfo('Event', 'It rained! All crops are watered.')
-            self.farm.advance_day(rain=True)
-        elif event == 'drought':
-            messagebox.showinfo('Event', 'A drought! Crops need extra water today.')
-        elif event == 'pests':
-            messagebox.showinfo('Event', 'Pests attacked! Some crops may not grow.')
-            for _ in range(random.randint(1, 3)):
-                x, y = random.randint(0, 4), random.randint(0, 4)
-                if self.farm.grid[x][y].stage in [1, 2]:
-                    self.farm.grid[x][y].stage = 4  # Dead
-        else:
-            self.farm.advance_day()
+        self.start_job('Ending the day', self._run_day, self._day_done)
+
+    def _run_day(self):
+        # Runs on the worker thread: random event, growth, then rest
+        record = self.events.run_day(self.farm)
         self.player.rest()
+        return record
+
+    def _day_done(self, record):
         self.day += 1
+        self.history.clear()
+        self.set_status(hh.EVENT_MESSAGES[record['event']] or f'Day {self.day} begins.')
         self.update_ui()
 
 if __name__ == '__main__':
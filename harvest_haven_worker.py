@@ -0,0 +1,64 @@
+import queue
+import threading
+
+# --- Background Worker ---
+# Runs slow jobs (day ticks, saves) on one thread so the Tk main loop never
+# blocks. Ownership is handed over rather than locked: while a job runs the
+# worker is `busy` and the UI rejects anything that would touch the Player
+# or the Farm, so only one thread ever uses them at a time. Results come
+# back as messages on a queue that the UI thread polls through
+# `schedule(ms, callback)` (root.after), so on_done and on_error always run
+# on the UI thread.
+POLL_MS = 20
+
+
+class Worker:
+    def __init__(self, schedule, poll_ms=POLL_MS):
+        self.schedule = schedule
+        self.poll_ms = poll_ms
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.busy = False
+        self.thread = threading.Thread(target=self._run, name='harvest-haven-worker', daemon=True)
+        self.thread.start()
+
+    def submit(self, func, on_done=None, on_error=None):
+        # Starts func() on the worker; returns False if a job is running.
+        # An error without an on_error is raised again on the UI thread.
+        if self.busy:
+            return False
+        self.busy = True
+        self.jobs.put((func, on_done, on_error))
+        self.schedule(self.poll_ms, self._poll)
+        return True
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            func, on_done, on_error = job
+            try:
+                self.results.put((True, func(), on_done, on_error))
+            except Exception as error:
+                self.results.put((False, error, on_done, on_error))
+
+    def _poll(self):
+        try:
+            ok, value, on_done, on_error = self.results.get_nowait()
+        except queue.Empty:
+            self.schedule(self.poll_ms, self._poll)
+            return
+        self.busy = False
+        if ok:
+            if on_done is not None:
+                on_done(value)
+        elif on_error is not None:
+            on_error(value)
+        else:
+            raise value
+
+    def close(self, timeout=None):
+        # Lets a running job finish, then stops the thread
+        self.jobs.put(None)
+        self.thread.join(timeout)
@@ -0,0 +1,32 @@
+import unittest
+import bench_harvest_haven as bench
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_measure_reports_rate_and_memory(self):
+        result = bench.measure(lambda: bench.filled_farm('object', 5, 1.0),
+                               lambda farm: farm.advance_day(), 1, min_time=0)
+        self.assertGreater(result['ops_per_sec'], 0)
+        self.assertGreaterEqual(result['peak_kib'], 0)
+
+    def test_compare_flags_regressions_past_threshold(self):
+        baseline = {'a': {'ops_per_sec': 100}, 'b': {'ops_per_sec': 100}}
+        results = {
+            'a': {'ops_per_sec': 85},
+            'b': {'ops_per_sec': 70},
+            'c': {'ops_per_sec': 1},
+        }
+        self.assertEqual(bench.compare(results, baseline, 0.2), [('b', 0.7)])
+
+    def test_threshold_without_baseline_fails(self):
+        missing = 'no_such_baseline.json'
+        self.assertEqual(bench.main(['--threshold', '0.2', '--baseline', missing, '--filter', 'none']), 2)
+
+    def test_startup_loads_no_heavy_modules(self):
+        for name, code in bench.STARTUP.items():
+            seconds, heavy = bench.startup_time(code, runs=1)
+            self.assertGreater(seconds, 0)
+            self.assertEqual(heavy, [], name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -48,6 +48,73 @@ class TestHarvestHaven(unittest.TestCase):
         self.assertEqual(loaded_farm.grid[2][2].type, 'Tomato')
         os.remove('test_save.json')
 
+    def test_farm_listener_reports_changed_cells(self):
+        changed = set()
+        self.farm.add_listener(changed.update)
+        self.farm.plant(3, 4, 'Carrot')
+        self.farm.harvest(0, 0)  # Nothing to harvest, no change
+        self.assertEqual(changed, {(3, 4)})
+        changed.clear()
+        self.farm.advance_day()
+        self.assertEqual(changed, {(3, 4)})
+
+    def test_crop_emoji_from_catalog_table(self):
+        self.farm.plant(0, 0, 'Tomato')
+        crop = self.farm.grid[0][0]
+        self.assertEqual(crop.type_id, hh.CATALOG.ids['Tomato'])
+        self.assertEqual(hh.get_crop_emoji(crop), hh.CROP_EMOJIS['Tomato'][1])
+        self.assertEqual(hh.emoji_for('Tomato', 1), hh.CROP_EMOJIS['Tomato'][1])
+        self.assertEqual(hh.get_crop_emoji(self.farm.grid[1][1]), '⬜')
+
+    def test_event_engine_is_seeded(self):
+        first, second = hh.EventEngine(seed=42), hh.EventEngine(seed=42)
+        for _ in range(30):
+            first.run_day(hh.Farm(20))
+            second.run_day(hh.Farm(20))
+        self.assertEqual(first.log, second.log)
+        pests = [record for record in first.log if record['event'] == 'pests']
+        self.assertTrue(all(0 <= x < 20 and 0 <= y < 20 for record in pests for x, y in record['pests']))
+
+    def test_event_log_replays_exactly(self):
+        engine = hh.EventEngine(seed=5)
+        farm = hh.Farm()
+        for x in range(5):
+            farm.plant(x, x, 'Wheat')
+        for _ in range(12):
+            engine.run_day(farm)
+        engine.save_log('test_events.json')
+        replay = hh.EventEngine.load_log('test_events.json')
+        os.remove('test_events.json')
+        replayed = hh.Farm()
+        for x in range(5):
+            replayed.plant(x, x, 'Wheat')
+        for _ in range(12):
+            replay.run_day(replayed)
+        self.assertEqual(replay.log, engine.log)
+        self.assertEqual(replayed.to_dict(), farm.to_dict())
+        with self.assertRaises(IndexError):
+            replay.run_day(replayed)
+
+    def test_empty_plots_share_flyweight(self):
+        self.assertIs(self.farm.grid[0][0], hh.EMPTY_PLOT)
+        self.assertIs(self.farm.grid[4][4], hh.EMPTY_PLOT)
+        with self.assertRaises(AttributeError):
+            self.farm.grid[0][0].stage = 1
+        self.farm.plant(0, 0, 'Wheat')
+        self.assertIsNot(self.farm.grid[0][0], hh.EMPTY_PLOT)
+        self.assertIs(self.farm.grid[0][1], hh.EMPTY_PLOT)
+        self.assertFalse(hasattr(self.farm.grid[0][0], '__dict__'))
+
+    def test_dict_format_unchanged_by_flyweight(self):
+        empty = {'type': None, 'stage': 0, 'days_grown': 0, 'watered': 0, 'fertilized': 0}
+        harvested = dict(empty, days_grown=5, watered=5, fertilized=2)
+        wheat = {'type': 'Wheat', 'stage': 2, 'days_grown': 2, 'watered': 1, 'fertilized': 1}
+        data = {'size': 3, 'grid': [[empty, harvested, empty], [empty, wheat, empty], [empty] * 3]}
+        farm = hh.Farm.from_dict(data)
+        self.assertEqual(farm.to_dict(), data)
+        self.assertIs(farm.grid[0][0], hh.EMPTY_PLOT)
+        self.assertIsNot(farm.grid[0][1], hh.EMPTY_PLOT)  # Harvested plot keeps its counters
+
     def test_farm_display(self):
         # Just check that display runs without error
         self.farm.display()
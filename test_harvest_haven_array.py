@@ -0,0 +1,59 @@
+import random
+import unittest
+import harvest_haven as hh
+
+try:
+    import numpy
+    import harvest_haven_array as hha
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestArrayFarm(unittest.TestCase):
+    def test_matches_object_farm_cell_for_cell(self):
+        rng = random.Random(1234)
+        size = 12
+        farm = hh.Farm(size)
+        array_farm = hha.ArrayFarm(size)
+        for _ in range(60):
+            for _ in range(20):
+                x, y = rng.randrange(size), rng.randrange(size)
+                action = rng.choice(['plant', 'water', 'fertilize', 'harvest'])
+                if action == 'plant':
+                    if farm.grid[x][y].stage == 0:
+                        crop_type = rng.choice(list(hh.CROP_TYPES))
+                        farm.plant(x, y, crop_type)
+                        array_farm.plant(x, y, crop_type)
+                elif action == 'water':
+                    farm.water(x, y)
+                    array_farm.water(x, y)
+                elif action == 'fertilize':
+                    farm.fertilize(x, y)
+                    array_farm.fertilize(x, y)
+                else:
+                    self.assertEqual(farm.harvest(x, y), array_farm.harvest(x, y))
+            rain = rng.random() < 0.3
+            farm.advance_day(rain=rain)
+            array_farm.advance_day(rain=rain)
+            self.assertEqual(farm.to_dict(), array_farm.to_dict())
+
+    def test_grid_view_reads_and_writes_arrays(self):
+        array_farm = hha.ArrayFarm()
+        array_farm.plant(1, 2, 'Tomato')
+        crop = array_farm.grid[1][2]
+        self.assertEqual(crop.type, 'Tomato')
+        self.assertEqual(crop.stage, 1)
+        crop.stage = 4
+        self.assertEqual(array_farm.stage[1, 2], 4)
+        self.assertEqual(hh.get_crop_emoji(crop), hh.CROP_EMOJIS['Tomato'][4])
+
+    def test_dict_round_trip(self):
+        empty = {'type': None, 'stage': 0, 'days_grown': 0, 'watered': 0, 'fertilized': 0}
+        harvested = dict(empty, days_grown=5, watered=5, fertilized=2)
+        tomato = {'type': 'Tomato', 'stage': 3, 'days_grown': 4, 'watered': 3, 'fertilized': 1}
+        data = {'size': 3, 'grid': [[empty, harvested, empty], [empty, tomato, empty], [empty] * 3]}
+        self.assertEqual(hha.ArrayFarm.from_dict(data).to_dict(), hh.Farm.from_dict(data).to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
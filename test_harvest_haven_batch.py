@@ -0,0 +1,48 @@
+import unittest
+import harvest_haven as hh
+import harvest_haven_batch as batch
+
+
+class TestBatchRunner(unittest.TestCase):
+    def test_runs_are_reproducible_per_seed(self):
+        self.assertEqual(batch.run_game(7, days=20), batch.run_game(7, days=20))
+
+    def test_replay_reproduces_a_season(self):
+        result = batch.run_game(11, days=25, keep_log=True)
+        replayed = batch.run_game(None, days=25, replay=result['event_log'], keep_log=True)
+        self.assertEqual(replayed['event_log'], result['event_log'])
+        self.assertEqual(replayed['coins'], result['coins'])
+
+    def test_greedy_policy_earns_coins(self):
+        result = batch.run_game(3, days=30)
+        self.assertGreater(sum(result['harvested'].values()), 0)
+
+    def test_batch_is_independent_of_worker_count(self):
+        serial = batch.run_batch(6, days=15, seed=10, workers=1)
+        parallel = batch.run_batch(6, days=15, seed=10, workers=2)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial['games'], 6)
+
+    def test_parallel_engine_runs_without_a_batch_pool(self):
+        with self.assertRaises(ValueError):
+            batch.run_batch(2, days=2, engine='parallel', workers=2)
+        self.assertEqual(batch.run_batch(2, days=2, engine='parallel')['games'], 2)
+
+    def test_actions_spend_energy(self):
+        game = batch.HeadlessGame(seed=1)
+        self.assertTrue(game.plant(0, 0, 'Wheat'))
+        self.assertFalse(game.plant(0, 0, 'Wheat'))
+        game.player.energy = 0
+        self.assertFalse(game.water(0, 0))
+        self.assertEqual(game.player.inventory['Wheat'], 2)
+
+    def test_player_buy(self):
+        player = hh.Player()
+        self.assertTrue(player.buy('Water'))
+        self.assertEqual(player.inventory['Water'], 13)
+        self.assertEqual(player.coins, 19)
+        player.coins = 0
+        self.assertFalse(player.buy('Tomato'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import unittest
+import harvest_haven as hh
+import harvest_haven_binary as hhb
+
+try:
+    import numpy
+    from harvest_haven_array import ArrayFarm
+except ImportError:
+    numpy = None
+
+
+class TestBinarySave(unittest.TestCase):
+    def setUp(self):
+        self.player = hh.Player()
+        self.farm = hh.Farm(7)
+        self.farm.plant(2, 3, 'Tomato')
+        self.farm.plant(6, 0, 'Wheat')
+        self.farm.water(6, 0)
+        self.farm.advance_day(rain=True)
+        self.player.harvested['Carrot'] = 2
+        self.filename = 'test_save.hhsv'
+
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def test_round_trip_matches_json(self):
+        hh.save_game(self.player, self.farm, filename=self.filename)
+        self.assertTrue(hhb.is_binary_save(self.filename))
+        player, farm = hh.load_game(filename=self.filename)
+        self.assertEqual(farm.to_dict(), self.farm.to_dict())
+        self.assertEqual(player.to_dict(), self.player.to_dict())
+
+    def test_explicit_json_format_is_detected(self):
+        hh.save_game(self.player, self.farm, filename=self.filename, format='json')
+        self.assertFalse(hhb.is_binary_save(self.filename))
+        _, farm = hh.load_game(filename=self.filename)
+        self.assertEqual(farm.to_dict(), self.farm.to_dict())
+
+    def test_bad_version_is_rejected(self):
+        hh.save_game(self.player, self.farm, filename=self.filename)
+        with open(self.filename, 'r+b') as f:
+            f.seek(4)
+            f.write(b'\x09\x00')
+        with self.assertRaises(ValueError):
+            hhb.read_binary(self.filename)
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_array_farm_loads_from_mapped_arrays(self):
+        hh.save_game(self.player, self.farm, filename=self.filename)
+        _, farm = hh.load_game(filename=self.filename, farm_cls=ArrayFarm)
+        self.assertEqual(farm.to_dict(), self.farm.to_dict())
+        farm.plant(0, 0, 'Carrot')
+        farm.advance_day()
+        _, again = hh.load_game(filename=self.filename, farm_cls=ArrayFarm)
+        self.assertEqual(again.to_dict(), self.farm.to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import harvest_haven as hh
+import harvest_haven_bulk as bulk
+
+try:
+    import numpy
+    from harvest_haven_array import ArrayFarm
+except ImportError:
+    numpy = None
+
+
+class TestBulkActions(unittest.TestCase):
+    def setUp(self):
+        self.player = hh.Player()
+        self.farm = hh.Farm()
+
+    def test_select_cells(self):
+        self.assertEqual(bulk.select_cells(self.farm, rect=(3, 3, 9, 9)), [(3, 3), (3, 4), (4, 3), (4, 4)])
+        mask = [[x == y for y in range(5)] for x in range(5)]
+        self.assertEqual(len(bulk.select_cells(self.farm, mask=mask)), 5)
+        self.assertEqual(bulk.select_cells(self.farm, cells=[(1, 2), (1, 2)]), [(1, 2)])
+
+    def test_plant_is_capped_by_seeds_and_debited_once(self):
+        self.farm.plant(0, 0, 'Carrot')
+        results = bulk.plant(self.player, self.farm, bulk.select_cells(self.farm, rect=(0, 0, 1, 5)), 'Wheat')
+        self.assertEqual(bulk.summarize(results), {'not empty': 1, 'planted': 3, 'no seed': 1})
+        self.assertEqual(self.player.inventory['Wheat'], 0)
+        self.assertEqual(self.player.energy, 7)
+
+    def test_water_is_capped_by_energy(self):
+        self.player.inventory['Wheat'] = 25
+        self.player.energy = 25
+        bulk.plant(self.player, self.farm, bulk.select_cells(self.farm), 'Wheat')
+        self.player.energy = 4
+        results = bulk.water(self.player, self.farm, bulk.select_cells(self.farm))
+        self.assertEqual(bulk.summarize(results), {'watered': 4, 'no energy': 21})
+        self.assertEqual(self.player.inventory['Water'], 6)
+
+    def test_harvest_credits_coins_per_batch(self):
+        for x, y in [(0, 0), (2, 2), (4, 4)]:
+            self.farm.plant(x, y, 'Wheat')
+            self.farm.grid[x][y].stage = 3
+        results = bulk.harvest(self.player, self.farm, bulk.select_cells(self.farm))
+        self.assertEqual(bulk.summarize(results)['harvested'], 3)
+        self.assertEqual(self.player.harvested, {'Wheat': 3})
+        self.assertEqual(self.player.coins, 20 + 3 * hh.CROP_TYPES['Wheat']['sell_price'])
+
+    def test_negative_energy_acts_on_nothing(self):
+        for x, y in [(0, 0), (2, 2), (4, 4)]:
+            self.farm.plant(x, y, 'Wheat')
+            self.farm.grid[x][y].stage = 3
+        self.player.energy = -5
+        results = bulk.harvest(self.player, self.farm, bulk.select_cells(self.farm))
+        self.assertEqual(bulk.summarize(results).get('harvested', 0), 0)
+        self.assertEqual(self.player.energy, -5)
+
+    def test_plant_rejects_items_that_are_not_crops(self):
+        results = bulk.plant(self.player, self.farm, [(0, 0)], 'Water')
+        self.assertEqual(results, {(0, 0): 'not a crop'})
+        self.assertEqual(self.player.inventory['Water'], 10)
+        self.assertEqual(self.player.energy, 10)
+
+    def test_buy_is_capped_by_coins(self):
+        self.assertEqual(bulk.buy(self.player, 'Tomato', 10), 4)
+        self.assertEqual(self.player.coins, 0)
+        self.assertEqual(self.player.inventory['Tomato'], 5)
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_array_farm_matches_object_farm(self):
+        farms = [hh.Farm(8), ArrayFarm(8)]
+        players = [hh.Player(), hh.Player()]
+        for player, farm in zip(players, farms):
+            player.energy = 100
+            player.inventory['Tomato'] = 40
+            bulk.plant(player, farm, bulk.select_cells(farm, rect=(0, 0, 4, 8)), 'Tomato')
+            bulk.water(player, farm, bulk.select_cells(farm, rect=(0, 0, 8, 3)))
+            bulk.fertilize(player, farm, bulk.select_cells(farm, rect=(2, 0, 3, 8)))
+            for _ in range(5):
+                farm.advance_day(rain=True)
+            bulk.harvest(player, farm, bulk.select_cells(farm))
+        self.assertEqual(farms[0].to_dict(), farms[1].to_dict())
+        self.assertEqual(players[0].to_dict(), players[1].to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
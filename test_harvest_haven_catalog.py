@@ -0,0 +1,108 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+import harvest_haven as hh
+from harvest_haven_catalog import Catalog, CatalogError, load_catalog, validate
+
+
+def crop_entry(name, **fields):
+    entry = {'name': name, 'grow_time': 3, 'water_needed': 1, 'fertilizer_needed': 0,
+             'sell_price': 5, 'seed_cost': 2, 'emoji': ['🌱', '🌾', '🥖', '💀']}
+    entry.update(fields)
+    return entry
+
+
+ITEMS = [{'name': 'Water', 'price': 1, 'quantity': 3}, {'name': 'Fertilizer', 'price': 2, 'quantity': 1}]
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_default_catalog_keeps_original_rules(self):
+        self.assertEqual(hh.CATALOG.names, [None, 'Wheat', 'Tomato', 'Carrot'])
+        self.assertEqual(hh.CROP_TYPES['Tomato']['grow_time'], 5)
+        self.assertEqual(hh.CATALOG.death_day[hh.CATALOG.ids['Wheat']], 6)
+        self.assertEqual(hh.SHOP_ITEMS, [('Wheat', 2, 1), ('Tomato', 5, 1), ('Carrot', 3, 1),
+                                         ('Water', 1, 3), ('Fertilizer', 2, 1)])
+        self.assertEqual(hh.Player().inventory,
+                         {'Wheat': 3, 'Tomato': 1, 'Carrot': 1, 'Water': 10, 'Fertilizer': 2})
+        self.assertEqual(hh.CROP_EMOJIS['Wheat'][3], '🥖')
+
+    def test_compiles_hundreds_of_crops(self):
+        crops, items = validate({'crops': [crop_entry(f'Crop{i}', grow_time=i % 7 + 1) for i in range(300)],
+                                 'items': ITEMS})
+        catalog = Catalog(crops, items)
+        self.assertEqual(len(catalog), 300)
+        self.assertEqual(catalog.ids['Crop299'], 300)
+        self.assertEqual(catalog.grow_time[300], 299 % 7 + 1)
+        self.assertEqual(len(catalog.shop_items), 302)
+
+    def test_loads_json_and_toml(self):
+        path = self.write('crops.json', json.dumps({
+            'crops': [crop_entry('Pumpkin', death_after=5)],
+            'items': ITEMS,
+        }))
+        catalog = load_catalog(path)
+        self.assertEqual(catalog.death_day[1], 9)
+        self.assertEqual(catalog.starting_inventory, {'Pumpkin': 0, 'Water': 0, 'Fertilizer': 0})
+        path = self.write('crops.toml', '''
+[[crops]]
+name = "Pumpkin"
+grow_time = 6
+water_needed = 2
+fertilizer_needed = 1
+sell_price = 20
+seed_cost = 8
+emoji = ["🌱", "🌿", "🎃", "💀"]
+
+[[items]]
+name = "Water"
+price = 1
+quantity = 3
+
+[[items]]
+name = "Fertilizer"
+price = 2
+quantity = 1
+''')
+        if sys.version_info < (3, 11):
+            self.skipTest('tomllib needs Python 3.11')
+        catalog = load_catalog(path)
+        self.assertEqual(catalog.emoji[1][3], '🎃')
+        self.assertEqual(catalog.shop_items, [('Pumpkin', 8, 1), ('Water', 1, 3), ('Fertilizer', 2, 1)])
+
+    def test_rejects_bad_entries(self):
+        bad = [
+            ({'crops': [], 'items': ITEMS}, 'at least one crop'),
+            ({'crops': [crop_entry('Wheat'), crop_entry('Wheat')], 'items': ITEMS}, 'duplicate'),
+            ({'crops': [crop_entry('Wheat', grow_time=-1)], 'items': ITEMS}, 'non-negative'),
+            ({'crops': [crop_entry('Wheat', grow_time=0)], 'items': ITEMS}, 'at least 1'),
+            ({'crops': [crop_entry('Wheat', sell_price='5')], 'items': ITEMS}, 'sell_price'),
+            ({'crops': [crop_entry('Wheat', emoji=['🌱'])], 'items': ITEMS}, 'emoji'),
+            ({'crops': [crop_entry('Wheat', colour='gold')], 'items': ITEMS}, 'unknown fields'),
+            ({'crops': [crop_entry('Wheat')], 'items': [{'name': 'Water', 'price': 1}]}, 'quantity'),
+            ({'crops': [crop_entry('Wheat')], 'items': ITEMS[:1]}, 'Fertilizer'),
+            ({'crops': [crop_entry('Wheat')]}, 'Water, Fertilizer'),
+        ]
+        for data, error in bad:
+            with self.assertRaisesRegex(CatalogError, error):
+                load_catalog(self.write('bad.json', json.dumps(data)))
+        missing = crop_entry('Wheat')
+        del missing['seed_cost']
+        with self.assertRaisesRegex(CatalogError, 'seed_cost'):
+            validate({'crops': [missing]})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import random
+import shutil
+import unittest
+import harvest_haven as hh
+from harvest_haven_chunked import ChunkedFarm, save_chunks
+
+
+class TestChunkedFarm(unittest.TestCase):
+    def setUp(self):
+        self.dirname = 'test_chunked_save'
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname, ignore_errors=True)
+
+    def test_chunks_created_on_write_and_dropped_when_empty(self):
+        farm = ChunkedFarm()
+        self.assertIs(farm.grid[5000][70], hh.EMPTY_PLOT)
+        self.assertEqual(farm.chunks, {})
+        farm.plant(5000, 70, 'Wheat')
+        self.assertEqual(list(farm.chunks), [(5000 // 32, 70 // 32)])
+        crop = farm.grid[5000][70]
+        crop.watered = 5
+        for _ in range(3):
+            farm.advance_day()
+        self.assertEqual(farm.harvest(5000, 70), 'Wheat')
+        self.assertEqual(farm.chunks, {})
+
+    def test_matches_dense_farm(self):
+        rng = random.Random(3)
+        dense, sparse = hh.Farm(40), ChunkedFarm(size=40, chunk_size=8)
+        for _ in range(40):
+            for _ in range(10):
+                x, y = rng.randrange(40), rng.randrange(40)
+                action = rng.choice(['plant', 'water', 'fertilize', 'kill'])
+                for farm in (dense, sparse):
+                    if action == 'plant':
+                        if farm.grid[x][y].stage == 0:
+                            farm.plant(x, y, 'Carrot')
+                    else:
+                        getattr(farm, action)(x, y)
+            rain = rng.random() < 0.4
+            dense.advance_day(rain=rain)
+            sparse.advance_day(rain=rain)
+            for x, y, crop in sparse.crops():
+                self.assertEqual(crop.to_dict(), dense.grid[x][y].to_dict())
+        self.assertEqual(ChunkedFarm.from_dict(sparse.to_dict()).to_dict(), sparse.to_dict())
+
+    def test_save_rewrites_only_changed_chunks(self):
+        player, farm = hh.Player(), ChunkedFarm()
+        farm.plant(0, 0, 'Wheat')
+        farm.plant(100, 100, 'Tomato')
+        self.assertEqual(save_chunks(player, farm, self.dirname), 2)
+        farm.water(100, 100)
+        self.assertEqual(save_chunks(player, farm, self.dirname), 1)
+        self.assertEqual(save_chunks(player, farm, self.dirname), 0)
+        farm.set_cell(0, 0, hh.EMPTY_PLOT.to_dict())
+        save_chunks(player, farm, self.dirname)
+        self.assertEqual(sorted(os.listdir(self.dirname)), ['chunk_3_3.json', 'meta.json'])
+        loaded_player, loaded = hh.load_game(self.dirname)
+        self.assertEqual(loaded.to_dict(), farm.to_dict())
+        self.assertEqual(loaded_player.to_dict(), player.to_dict())
+
+    def test_save_over_another_save_replaces_it(self):
+        player, old = hh.Player(), ChunkedFarm()
+        old.plant(0, 0, 'Wheat')
+        save_chunks(player, old, self.dirname)
+        farm = ChunkedFarm()
+        farm.plant(100, 100, 'Tomato')
+        save_chunks(player, farm, self.dirname)
+        _, loaded = hh.load_game(self.dirname)
+        self.assertEqual(sorted(loaded.chunks), [(3, 3)])
+        # The old farm saving again must not trust its dirty flags either
+        save_chunks(player, old, self.dirname)
+        _, loaded = hh.load_game(self.dirname)
+        self.assertEqual(sorted(loaded.chunks), [(0, 0)])
+
+    def test_save_to_a_second_directory_writes_every_chunk(self):
+        other = self.dirname + '_b'
+        self.addCleanup(shutil.rmtree, other, True)
+        player, farm = hh.Player(), ChunkedFarm()
+        save_chunks(player, ChunkedFarm(), other)
+        farm.plant(0, 0, 'Wheat')
+        save_chunks(player, farm, self.dirname)
+        self.assertEqual(save_chunks(player, farm, other), 1)
+        _, loaded = hh.load_game(other)
+        self.assertEqual(loaded.to_dict(), farm.to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
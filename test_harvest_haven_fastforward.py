@@ -0,0 +1,77 @@
+import random
+import unittest
+import harvest_haven as hh
+from harvest_haven_batch import make_farm
+from harvest_haven_chunked import ChunkedFarm
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def random_farm(farm, seed):
+    # Crops at every stage, with random water and fertilizer
+    rng = random.Random(seed)
+    for x in range(farm.size):
+        for y in range(farm.size):
+            if rng.random() < 0.8:
+                farm.plant(x, y, rng.choice(list(hh.CROP_TYPES)))
+                for _ in range(rng.randrange(3)):
+                    farm.water(x, y)
+                for _ in range(rng.randrange(2)):
+                    farm.fertilize(x, y)
+        for _ in range(rng.randrange(3)):
+            farm.advance_day(rain=rng.random() < 0.5)
+    return farm
+
+
+class TestAdvanceDays(unittest.TestCase):
+    def check_engine(self, new_farm):
+        for seed in range(6):
+            stepped = random_farm(new_farm(), seed)
+            jumped = random_farm(new_farm(), seed)
+            n = seed * 4 + 1
+            stepped_events = hh.EventEngine(seed=seed)
+            for _ in range(n):
+                stepped_events.run_day(stepped)
+            jumped_events = hh.EventEngine(seed=seed)
+            jumped_events.run_days(jumped, n)
+            self.assertEqual(stepped_events.log, jumped_events.log)
+            self.assertEqual(stepped.to_dict(), jumped.to_dict(), f'seed {seed}')
+
+    def test_object_farm_matches_daily_ticks(self):
+        self.check_engine(lambda: hh.Farm(8))
+
+    def test_scheduled_farm_matches_daily_ticks(self):
+        self.check_engine(lambda: make_farm(8, 'scheduled'))
+
+    def test_chunked_farm_matches_daily_ticks(self):
+        self.check_engine(lambda: ChunkedFarm(8, chunk_size=4))
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_array_farm_matches_daily_ticks(self):
+        self.check_engine(lambda: make_farm(8, 'array'))
+
+    def test_pests_only_kill_growing_crops(self):
+        farm = hh.Farm(2)
+        farm.plant(0, 0, 'Wheat')
+        farm.water(0, 0)
+        farm.plant(1, 1, 'Wheat')
+        weather = ['none', 'none', 'none', {'event': 'pests', 'pests': [[0, 0], [1, 1]]}]
+        farm.advance_days(4, weather)
+        self.assertEqual(farm.grid[0][0].stage, 3)  # Ripe before the pests came
+        self.assertEqual(farm.grid[1][1].stage, 4)  # Unwatered, still growing
+        self.assertEqual(farm.grid[1][1].days_grown, 3)
+
+    def test_crops_stop_at_their_death_day(self):
+        farm = hh.Farm(1)
+        farm.plant(0, 0, 'Wheat')
+        farm.advance_days(30, ['rain'] * 30)
+        crop = farm.grid[0][0]
+        self.assertEqual((crop.stage, crop.days_grown, crop.watered), (4, 6, 6))
+        with self.assertRaises(ValueError):
+            farm.advance_days(3, ['none'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import types
+import unittest
+import harvest_haven as hh
+import harvest_haven_history as history
+from harvest_haven_batch import GreedyPolicy, HeadlessGame
+from harvest_haven_chunked import ChunkedFarm
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def play(self, days):
+        game = HeadlessGame(seed=4, keep_log=False)
+        return history.day_records(game, GreedyPolicy(), days)
+
+    def test_round_trips_every_format(self):
+        expected = list(self.play(40))
+        for name in ['run.jsonl', 'run.jsonl.gz', 'run.csv', 'run.csv.gz']:
+            path = os.path.join(self.tmp.name, name)
+            self.assertEqual(history.write_history(self.play(40), path), 40)
+            self.assertEqual(list(history.read_history(path)), expected, name)
+
+    def test_reader_and_records_are_lazy(self):
+        records = self.play(10 ** 9)
+        self.assertIsInstance(records, types.GeneratorType)
+        first = next(records)
+        self.assertEqual(first['day'], 1)
+        self.assertLess(first['energy'], 10)  # The greedy policy spent some before resting
+        path = os.path.join(self.tmp.name, 'run.jsonl')
+        history.write_history(self.play(5), path)
+        reader = history.read_history(path)
+        self.assertIsInstance(reader, types.GeneratorType)
+        self.assertEqual(next(reader)['day'], 1)
+
+    def test_game_without_log_keeps_days(self):
+        game = HeadlessGame(seed=4, keep_log=False)
+        for _ in range(30):
+            game.play_day(GreedyPolicy())
+        self.assertEqual(game.events.log, [])
+        self.assertEqual(game.events.days, 30)
+
+    def test_stage_counts(self):
+        farm = hh.Farm(3)
+        farm.plant(0, 0, 'Wheat')
+        farm.plant(1, 1, 'Carrot')
+        farm.kill(1, 1)
+        stages, crops = history.stage_counts(farm)
+        self.assertEqual(stages, {'Empty': 7, 'Planted': 1, 'Growing': 0, 'Harvestable': 0, 'Dead': 1})
+        self.assertEqual(crops, {'Wheat': 1, 'Tomato': 0, 'Carrot': 0})
+        chunked = ChunkedFarm.from_dict(farm.to_dict())
+        self.assertEqual(history.stage_counts(chunked), (stages, crops))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import shutil
+import unittest
+import harvest_haven as hh
+from harvest_haven_chunked import ChunkedFarm
+from harvest_haven_journal import SaveJournal
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self):
+        self.filename = 'test_journal_save.json'
+        self.player = hh.Player()
+        self.farm = hh.Farm()
+        self.journal = SaveJournal(self.filename, compact_every=3)
+        self.journal.attach(self.player, self.farm)
+
+    def tearDown(self):
+        for name in (self.filename, self.filename + '.journal'):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def journal_lines(self):
+        with open(self.filename + '.journal') as f:
+            return f.readlines()
+
+    def test_delta_contains_only_changed_cells(self):
+        self.journal.save()  # First save is a full snapshot
+        self.assertEqual(self.journal_lines(), [])
+        self.farm.plant(1, 1, 'Wheat')
+        self.player.use_seed('Wheat')
+        self.journal.save()
+        lines = self.journal_lines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"cells":[[1,1,', lines[0])
+        self.assertIn('"inventory"', lines[0])
+        self.assertNotIn('"coins"', lines[0])
+
+    def test_load_replays_journal(self):
+        self.journal.save()
+        self.farm.plant(0, 2, 'Carrot')
+        self.journal.save()
+        self.farm.advance_day(rain=True)
+        self.farm.kill(0, 2)
+        self.player.buy('Water')
+        self.journal.save()
+        player, farm = hh.load_game(self.filename)
+        self.assertEqual(farm.to_dict(), self.farm.to_dict())
+        self.assertEqual(player.to_dict(), self.player.to_dict())
+
+    def test_compaction_resets_journal(self):
+        self.journal.save()
+        for i in range(4):
+            self.farm.plant(i, 0, 'Wheat')
+            self.journal.save()
+        self.assertEqual(self.journal_lines(), [])
+        self.assertEqual(self.journal.generation, 2)
+        _, farm = hh.load_game(self.filename)
+        self.assertEqual(farm.to_dict(), self.farm.to_dict())
+
+    def test_torn_and_stale_lines_are_ignored(self):
+        self.journal.save()
+        self.farm.plant(3, 3, 'Tomato')
+        self.journal.save()
+        expected = self.farm.to_dict()
+        with open(self.filename + '.journal', 'a') as f:
+            f.write('{"gen": 0, "cells": [[0, 0, {"type": "Wheat", "stage": 3, ')
+        _, farm = hh.load_game(self.filename)
+        self.assertEqual(farm.to_dict(), expected)
+        # A full save supersedes the journal and removes it
+        hh.save_game(self.player, hh.Farm(), self.filename)
+        self.assertFalse(os.path.exists(self.filename + '.journal'))
+
+    def test_journal_load_continues_deltas(self):
+        self.journal.save()
+        journal = SaveJournal(self.filename)
+        player, farm = journal.load()
+        farm.plant(4, 4, 'Wheat')
+        journal.save()
+        self.assertEqual(len(self.journal_lines()), 1)
+        _, again = hh.load_game(self.filename)
+        self.assertEqual(again.grid[4][4].type, 'Wheat')
+
+    def test_load_counts_replayed_entries(self):
+        self.journal.save()
+        for i in range(2):
+            self.farm.plant(i, 1, 'Wheat')
+            self.journal.save()
+        journal = SaveJournal(self.filename, compact_every=3)
+        player, farm = journal.load()
+        self.assertEqual(journal.entries, 2)
+        self.assertEqual(farm.to_dict(), self.farm.to_dict())
+        farm.plant(3, 1, 'Wheat')
+        journal.save()
+        farm.plant(4, 1, 'Wheat')
+        journal.save()  # The 4th entry compacts
+        self.assertEqual(self.journal_lines(), [])
+        self.assertEqual(journal.entries, 0)
+
+    def test_saves_after_a_torn_tail_are_kept(self):
+        self.journal.save()
+        self.farm.plant(0, 0, 'Wheat')
+        self.journal.save()
+        with open(self.filename + '.journal', 'a') as f:
+            f.write('{"gen":1,"cel')
+        journal = SaveJournal(self.filename)
+        player, farm = journal.load()
+        farm.plant(1, 1, 'Carrot')
+        journal.save()
+        farm.plant(2, 2, 'Tomato')
+        journal.save()
+        self.assertEqual(len(self.journal_lines()), 3)
+        _, again = hh.load_game(self.filename)
+        self.assertEqual(again.to_dict(), farm.to_dict())
+        self.assertEqual(again.grid[2][2].type, 'Tomato')
+
+    def test_chunked_farm_replays_journal(self):
+        dirname = 'test_journal_chunks'
+        self.addCleanup(shutil.rmtree, dirname, True)
+        self.addCleanup(lambda: os.path.exists(dirname + '.journal') and os.remove(dirname + '.journal'))
+        player, farm = hh.Player(), ChunkedFarm()
+        journal = SaveJournal(dirname)
+        journal.attach(player, farm)
+        journal.save()
+        farm.plant(40, 40, 'Wheat')
+        player.use_seed('Wheat')
+        journal.save()
+        self.assertEqual(journal.entries, 1)
+        loaded_player, loaded = hh.load_game(dirname)
+        self.assertEqual(loaded.grid[40][40].type, 'Wheat')
+        self.assertEqual(loaded_player.inventory['Wheat'], player.inventory['Wheat'])
+
+if __name__ == '__main__':
+    unittest.main()
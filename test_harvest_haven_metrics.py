@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+import harvest_haven as hh
+import harvest_haven_metrics as metrics
+from harvest_haven_batch import GreedyPolicy, run_game
+
+
+class TestMetrics(unittest.TestCase):
+    def tearDown(self):
+        metrics.disable()
+
+    def test_disable_restores_original_methods(self):
+        plant = hh.Farm.plant
+        save_game = hh.save_game
+        metrics.enable(metrics.Metrics())
+        self.assertIsNot(hh.Farm.plant, plant)
+        self.assertTrue(metrics.enabled())
+        metrics.disable()
+        self.assertIs(hh.Farm.plant, plant)
+        self.assertIs(hh.save_game, save_game)
+        self.assertFalse(metrics.enabled())
+
+    def test_records_calls_and_day_counters(self):
+        recorded = metrics.enable(metrics.Metrics())
+        result = run_game(seed=3, days=12, policy=GreedyPolicy())
+        metrics.disable()
+        self.assertEqual(recorded.timers['EventEngine.run_day'].count, 12)
+        self.assertEqual(recorded.timers['Farm.plant'].count, recorded.totals()['planted'])
+        self.assertEqual(len(recorded.days), 13)
+        self.assertEqual(recorded.totals()['harvested'], sum(result['harvested'].values()))
+        # Nothing is recorded once disabled
+        run_game(seed=3, days=2, policy=GreedyPolicy())
+        self.assertEqual(recorded.timers['EventEngine.run_day'].count, 12)
+
+    def test_died_counts_deaths_on_every_engine(self):
+        from harvest_haven_batch import HeadlessGame
+        for engine in ['object', 'array', 'scheduled']:
+            recorded = metrics.enable(metrics.Metrics())
+            game = HeadlessGame(seed=5, size=6, engine=engine)
+            policy = GreedyPolicy()
+            for _ in range(25):
+                game.play_day(policy)
+            metrics.disable()
+            dead = sum(1 for row in game.farm.grid for crop in row if crop.stage == 4)
+            self.assertGreater(dead, 0, engine)
+            self.assertEqual(recorded.totals()['died'], dead, engine)
+
+    def test_exports(self):
+        recorded = metrics.enable(metrics.Metrics())
+        farm = hh.Farm(2)
+        farm.plant(0, 0, 'Wheat')
+        metrics.disable()
+        with tempfile.TemporaryDirectory() as tmp:
+            prom = os.path.join(tmp, 'metrics.prom')
+            recorded.write(prom)
+            with open(prom) as f:
+                text = f.read()
+            self.assertIn('harvest_haven_call_seconds_count{method="Farm.plant"} 1', text)
+            self.assertIn('harvest_haven_call_seconds_bucket{method="Farm.plant",le="+Inf"} 1', text)
+            jsonl = os.path.join(tmp, 'metrics.jsonl')
+            recorded.write(jsonl)
+            with open(jsonl) as f:
+                self.assertEqual(len(f.readlines()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+import harvest_haven as hh
+
+try:
+    import numpy
+    from harvest_haven_array import ArrayFarm, FIELDS
+    from harvest_haven_parallel import ParallelFarm
+except ImportError:
+    numpy = None
+
+
+def planted_farm(size, seed):
+    rng = random.Random(seed)
+    farm = ArrayFarm(size)
+    for x in range(size):
+        for y in range(size):
+            if rng.random() < 0.7:
+                farm.plant(x, y, rng.choice(list(hh.CROP_TYPES)))
+                for _ in range(rng.randrange(3)):
+                    farm.water(x, y)
+                if rng.random() < 0.5:
+                    farm.fertilize(x, y)
+    return farm
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestParallelFarm(unittest.TestCase):
+    def test_matches_serial_tick_with_rain_and_pests(self):
+        serial = planted_farm(37, 5)
+        with ParallelFarm.from_farm(serial, workers=3, min_cells=0) as farm:
+            self.assertEqual(len(farm._bands()), 3)
+            serial_events = hh.EventEngine(seed=11)
+            parallel_events = hh.EventEngine(seed=11)
+            for _ in range(15):
+                self.assertEqual(serial_events.run_day(serial), parallel_events.run_day(farm))
+                for field in FIELDS:
+                    numpy.testing.assert_array_equal(getattr(serial, field), getattr(farm, field))
+            self.assertIsNotNone(farm.pool)
+
+    def test_listeners_get_every_active_cell(self):
+        serial = planted_farm(20, 2)
+        with ParallelFarm.from_farm(serial, workers=2, min_cells=0) as farm:
+            changed = []
+            serial_changed = []
+            farm.add_listener(changed.extend)
+            serial.add_listener(serial_changed.extend)
+            farm.advance_day(rain=True)
+            serial.advance_day(rain=True)
+            self.assertEqual(sorted(changed), sorted(serial_changed))
+
+    def test_close_keeps_state(self):
+        farm = ParallelFarm(4, workers=2)
+        farm.plant(1, 2, 'Carrot')
+        farm.close()
+        self.assertEqual(farm.blocks, [])
+        self.assertEqual(farm.grid[1][2].type, 'Carrot')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import harvest_haven as hh
+import harvest_haven_batch as batch
+from harvest_haven_planner import Planner, PlannedPolicy
+
+
+class TestPlanner(unittest.TestCase):
+    def setUp(self):
+        self.planner = Planner()
+
+    def test_minimal_plans_follow_crop_rules(self):
+        for crop_type, rules in hh.CROP_TYPES.items():
+            outcome = self.planner.outcome(crop_type)
+            self.assertEqual(outcome.harvest_day, rules['grow_time'])
+            self.assertEqual(outcome.death_day, rules['grow_time'] + 3)
+            self.assertAlmostEqual(outcome.profit, rules['sell_price'] - outcome.cost)
+
+    def test_unwatered_plan_never_ripens(self):
+        outcome = self.planner.outcome('Tomato', waterings=0)
+        self.assertIsNone(outcome.harvest_day)
+        self.assertLess(outcome.profit, 0)
+        # Rain can stand in for the watering
+        self.assertEqual(self.planner.outcome('Tomato', waterings=0, rain=(True, True)).harvest_day, 5)
+        # Watering late delays the harvest
+        self.assertEqual(self.planner.outcome('Wheat', waterings=(4,)).harvest_day, 5)
+
+    def test_table_is_lru(self):
+        planner = Planner(maxsize=3)  # Filled by the three minimal plans
+        planner.outcome('Wheat', waterings=2)
+        self.assertNotIn(('Wheat', (0,), 0, ()), planner.table)
+        misses = planner.misses
+        planner.outcome('Tomato')  # Hit, so Carrot is now the oldest
+        self.assertEqual(planner.misses, misses)
+        planner.outcome('Wheat', waterings=3)
+        self.assertEqual(len(planner.table), 3)
+        self.assertNotIn(('Carrot', (0,), 1, ()), planner.table)
+        self.assertIn(('Tomato', (0, 0), 1, ()), planner.table)
+        # Equivalent keys share one entry
+        misses = planner.misses
+        planner.outcome('Tomato', waterings=(0, 0), fertilizers=1, rain=(False,))
+        self.assertEqual(planner.misses, misses)
+
+    def test_best_crop_respects_days_and_budget(self):
+        inventory = {'Wheat': 1, 'Tomato': 1, 'Carrot': 1, 'Water': 5, 'Fertilizer': 5}
+        self.assertEqual(self.planner.best_crop(10, inventory), 'Tomato')
+        self.assertEqual(self.planner.best_crop(4, inventory), 'Wheat')
+        self.assertIsNone(self.planner.best_crop(2, inventory))
+        broke = {'Wheat': 0, 'Tomato': 0, 'Carrot': 0, 'Water': 0, 'Fertilizer': 0}
+        self.assertIsNone(self.planner.best_crop(10, broke, coins=0))
+        self.assertEqual(self.planner.best_crop(10, broke, coins=3), 'Wheat')
+
+    def test_planned_policy_beats_greedy(self):
+        seeds = range(20)
+        greedy = sum(batch.run_game(seed, days=30)['coins'] for seed in seeds)
+        planned = sum(batch.run_game(seed, days=30, policy=PlannedPolicy(30))['coins'] for seed in seeds)
+        self.assertGreater(planned, greedy)
+
+if __name__ == '__main__':
+    unittest.main()
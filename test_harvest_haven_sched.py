@@ -0,0 +1,60 @@
+import random
+import unittest
+import harvest_haven as hh
+from harvest_haven_sched import ScheduledFarm
+
+
+class TestScheduledFarm(unittest.TestCase):
+    def play(self, farm, seed, days=80, size=10):
+        rng = random.Random(seed)
+        snapshots = []
+        for _ in range(days):
+            for _ in range(15):
+                x, y = rng.randrange(size), rng.randrange(size)
+                action = rng.choice(['plant', 'water', 'fertilize', 'harvest', 'kill'])
+                if action == 'plant':
+                    if farm.grid[x][y].stage == 0:
+                        farm.plant(x, y, rng.choice(list(hh.CROP_TYPES)))
+                elif action == 'kill':
+                    if rng.random() < 0.2:
+                        farm.kill(x, y)
+                else:
+                    getattr(farm, action)(x, y)
+            farm.advance_day(rain=rng.random() < 0.3)
+            snapshots.append(farm.to_dict())
+        return snapshots
+
+    def test_matches_per_cell_tick(self):
+        for seed in range(3):
+            self.assertEqual(self.play(hh.Farm(10), seed), self.play(ScheduledFarm(10), seed))
+
+    def test_idle_cells_are_not_scheduled(self):
+        farm = ScheduledFarm(50)
+        farm.plant(10, 10, 'Wheat')
+        self.assertEqual(list(farm.active), [(10, 10)])
+        for _ in range(10):
+            farm.advance_day()
+        self.assertEqual(farm.grid[10][10].stage, 4)
+        self.assertEqual(farm.active, {})
+        self.assertEqual(farm.grid[10][10].days_grown, hh.CROP_TYPES['Wheat']['grow_time'] + 3)
+
+    def test_rain_is_applied_lazily(self):
+        farm = ScheduledFarm()
+        farm.plant(0, 0, 'Tomato')
+        farm.advance_day(rain=True)
+        farm.advance_day(rain=True)
+        self.assertEqual(farm.grid[0][0].watered, 2)
+        self.assertEqual(farm.grid[0][0].days_grown, 2)
+
+    def test_loaded_farm_is_scheduled(self):
+        farm = hh.Farm()
+        farm.plant(1, 1, 'Carrot')
+        farm.advance_day()
+        scheduled = ScheduledFarm.from_dict(farm.to_dict())
+        for _ in range(6):
+            farm.advance_day(rain=True)
+            scheduled.advance_day(rain=True)
+        self.assertEqual(scheduled.to_dict(), farm.to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import shutil
+import unittest
+import harvest_haven_loadtest as loadtest
+from harvest_haven_server import GameServer
+
+
+class TestGameServer(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = 'test_server_saves'
+
+    def tearDown(self):
+        shutil.rmtree(self.save_dir, ignore_errors=True)
+
+    def run_async(self, coro):
+        return asyncio.run(asyncio.wait_for(coro, timeout=30))
+
+    def test_sessions_are_isolated(self):
+        async def scenario():
+            server = await GameServer(port=0, save_dir=self.save_dir).start()
+            try:
+                alice = await loadtest.Client.connect('127.0.0.1', server.port)
+                bob = await loadtest.Client.connect('127.0.0.1', server.port)
+                await alice.request(session='alice', action='new', seed=1)
+                await bob.request(session='bob', action='new', seed=1)
+                reply = await alice.request(session='alice', action='plant', x=0, y=0, crop='Wheat')
+                self.assertTrue(reply['ok'])
+                self.assertEqual(reply['state']['energy'], 9)
+                reply = await bob.request(session='bob', action='state')
+                self.assertEqual(reply['state']['energy'], 10)
+                self.assertEqual(reply['farm']['grid'][0][0]['type'], None)
+                reply = await bob.request(session='bob', action='plant', x=9, y=9, crop='Wheat')
+                self.assertFalse(reply['ok'])
+                reply = await alice.request(session='alice', action='save')
+                self.assertTrue(reply['ok'])
+                self.assertTrue(os.path.exists(os.path.join(self.save_dir, 'alice.json')))
+                await alice.close()
+                await bob.close()
+            finally:
+                await server.stop()
+        self.run_async(scenario())
+
+    def test_rejects_unsafe_names_huge_farms_and_reports_save_errors(self):
+        async def scenario():
+            server = await GameServer(port=0, save_dir=self.save_dir).start()
+            try:
+                client = await loadtest.Client.connect('127.0.0.1', server.port)
+                for name in ['../up', '/tmp/escaped', '', 'a' * 65]:
+                    reply = await client.request(session=name, action='new')
+                    self.assertFalse(reply['ok'], name)
+                reply = await client.request(session='big', action='new', size=10 ** 6)
+                self.assertFalse(reply['ok'])
+                self.assertNotIn('big', server.sessions)
+                await client.request(session='ok', action='new')
+                with open(self.save_dir, 'w'):
+                    pass  # A file where the save directory should be
+                reply = await client.request(session='ok', action='save')
+                self.assertFalse(reply['ok'])
+                self.assertTrue((await client.request(session='ok', action='state'))['ok'])
+                await client.close()
+            finally:
+                await server.stop()
+                if os.path.isfile(self.save_dir):
+                    os.remove(self.save_dir)
+        self.run_async(scenario())
+
+    def test_overlong_request_gets_a_reply_and_a_hang_up(self):
+        async def scenario():
+            server = await GameServer(port=0, save_dir=self.save_dir).start()
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+                writer.write(b'{"session": "' + b'a' * 100000 + b'"}\n')
+                await writer.drain()
+                self.assertEqual(json.loads(await reader.readline()), {'ok': False, 'message': 'Request too long'})
+                self.assertEqual(await reader.read(), b'')
+                writer.close()
+                client = await loadtest.Client.connect('127.0.0.1', server.port)
+                self.assertTrue((await client.request(session='next', action='new'))['ok'])
+                await client.close()
+            finally:
+                await server.stop()
+        self.run_async(scenario())
+
+    def test_end_day_requests_are_batched(self):
+        async def scenario():
+            server = await GameServer(port=0, save_dir=self.save_dir, tick_interval=0.2).start()
+            try:
+                clients = [await loadtest.Client.connect('127.0.0.1', server.port) for _ in range(5)]
+                for i, client in enumerate(clients):
+                    await client.request(session=f'p{i}', action='new', seed=i)
+                replies = await asyncio.gather(*[
+                    client.request(session=f'p{i}', action='end_day') for i, client in enumerate(clients)])
+                self.assertTrue(all(reply['state']['day'] == 2 for reply in replies))
+                self.assertEqual(server.ticks, 1)
+                for client in clients:
+                    await client.close()
+            finally:
+                await server.stop()
+        self.run_async(scenario())
+
+    def test_load_test_runs_against_local_server(self):
+        summary = self.run_async(loadtest.run(4, 3, 5, save_dir=self.save_dir))
+        self.assertEqual(summary['requests'], 4 * (1 + 3 * 6 + 2))
+
+if __name__ == '__main__':
+    unittest.main()
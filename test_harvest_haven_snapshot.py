@@ -0,0 +1,88 @@
+import unittest
+import harvest_haven as hh
+from harvest_haven_batch import make_farm
+from harvest_haven_snapshot import History, Tracker
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestSnapshots(unittest.TestCase):
+    def check_undo_redo(self, engine):
+        player = hh.Player()
+        farm = make_farm(6, engine)
+        history = History(player, farm)
+        history.record()
+        farm.plant(1, 1, 'Wheat')
+        player.use_seed('Wheat')
+        player.energy -= 1
+        planted = farm.to_dict()
+        history.record()
+        farm.water(1, 1)
+        player.use_water()
+        watered = farm.to_dict()
+
+        self.assertTrue(history.undo())
+        self.assertEqual(farm.to_dict(), planted)
+        self.assertEqual(player.inventory['Water'], 10)
+        self.assertTrue(history.undo())
+        self.assertEqual(farm.grid[1][1].stage, 0)
+        self.assertEqual((player.energy, player.inventory['Wheat']), (10, 3))
+        self.assertFalse(history.undo())
+        self.assertTrue(history.redo())
+        self.assertTrue(history.redo())
+        self.assertEqual(farm.to_dict(), watered)
+        self.assertEqual(player.inventory['Water'], 9)
+        self.assertFalse(history.redo())
+
+    def test_undo_redo_object_farm(self):
+        self.check_undo_redo('object')
+
+    def test_undo_redo_scheduled_farm(self):
+        self.check_undo_redo('scheduled')
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_undo_redo_array_farm(self):
+        self.check_undo_redo('array')
+
+    def test_snapshots_share_unchanged_rows(self):
+        player = hh.Player()
+        farm = hh.Farm(50)
+        tracker = Tracker(player, farm)
+        first = tracker.snapshot()
+        farm.plant(10, 3, 'Carrot')
+        second = tracker.snapshot()
+        self.assertEqual(second.shared_rows(first), 49)
+        self.assertIs(tracker.snapshot().rows, second.rows)
+        # Later changes to the live farm never leak into a snapshot
+        farm.water(10, 3)
+        self.assertEqual(second.cell(10, 3)['watered'], 0)
+
+    def test_fork_is_independent(self):
+        player = hh.Player()
+        farm = hh.Farm(4)
+        farm.plant(0, 2, 'Tomato')
+        snapshot = Tracker(player, farm).snapshot()
+        forked_player, forked = snapshot.fork()
+        forked.water(0, 2)
+        forked_player.inventory['Water'] -= 1
+        self.assertEqual(farm.grid[0][2].watered, 0)
+        self.assertEqual(player.inventory['Water'], 10)
+        self.assertEqual(forked.grid[0][2].type, 'Tomato')
+        self.assertEqual(snapshot.player['inventory']['Water'], 10)
+
+    def test_new_action_clears_redo(self):
+        player = hh.Player()
+        farm = hh.Farm(3)
+        history = History(player, farm)
+        history.record()
+        farm.plant(0, 0, 'Wheat')
+        history.undo()
+        history.record()
+        farm.plant(1, 1, 'Carrot')
+        self.assertFalse(history.can_redo())
+
+if __name__ == '__main__':
+    unittest.main()
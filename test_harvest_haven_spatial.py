@@ -0,0 +1,104 @@
+import unittest
+
+try:
+    import numpy
+    from harvest_haven_array import GROW_TIME, ArrayFarm
+    from harvest_haven_spatial import SpatialEvents, convolve, planted_farm, shift
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestSpatialEvents(unittest.TestCase):
+    def test_convolve_spreads_to_neighbours(self):
+        field = numpy.zeros((5, 5), dtype=numpy.float32)
+        field[0, 0] = 1
+        out = convolve(field, [[0, 1, 0], [1, 2, 1], [0, 1, 0]])
+        self.assertEqual(out[0, 0], 2)
+        self.assertEqual(out[0, 1], 1)
+        self.assertEqual(out[1, 0], 1)
+        self.assertEqual(out[1, 1], 0)
+        self.assertEqual(out.sum(), 4)  # The rest fell off the edge
+        with self.assertRaises(ValueError):
+            convolve(field, [[1, 1]])
+
+    def test_shift_wraps_around(self):
+        field = numpy.arange(9, dtype=numpy.float32).reshape(3, 3)
+        moved = shift(field, 0, 1)
+        self.assertEqual(moved[:, 0].tolist(), field[:, 2].tolist())
+        self.assertEqual(moved[:, 1:].tolist(), field[:, :2].tolist())
+
+    def test_edges_get_the_same_weather_as_the_interior(self):
+        size, days = 128, 200
+        events = SpatialEvents(size, seed=4, outbreak_rate=0)
+        drought = numpy.zeros((size, size))
+        rain = numpy.zeros((size, size))
+        active = numpy.zeros((size, size), dtype=bool)
+        for _ in range(days):
+            day_rain, day_drought, _ = events.step(active, active)
+            drought += day_drought
+            rain += day_rain
+        interior_drought = drought[8:-8, 8:-8].mean() / days
+        interior_rain = rain[8:-8, 8:-8].mean() / days
+        for name, edge in [('first column', numpy.s_[:, 0]), ('last column', numpy.s_[:, -1]),
+                           ('first row', numpy.s_[0, :]), ('last row', numpy.s_[-1, :])]:
+            self.assertLess(abs(drought[edge].mean() / days - interior_drought), 0.05, name)
+            self.assertLess(abs(rain[edge].mean() / days - interior_rain), 0.05, name)
+
+    def test_same_seed_same_season(self):
+        farms = [planted_farm(64, seed=3) for _ in range(2)]
+        records = []
+        for farm in farms:
+            events = SpatialEvents(64, seed=7, outbreak_rate=0.01)
+            records.append([events.run_day(farm) for _ in range(10)])
+        self.assertEqual(records[0], records[1])
+        self.assertTrue((farms[0].stage == farms[1].stage).all())
+
+    def test_pest_outbreak_spreads_to_neighbouring_crops(self):
+        farm = planted_farm(40, fill=1.0)
+        farm.days_grown[:] = -100  # Nothing ripens or dies of age
+        events = SpatialEvents(40, seed=1, outbreak_rate=0, rain_level=2, drought_level=-1)
+        events.pests[20, 20] = 1
+        for _ in range(15):
+            events.run_day(farm)
+        dead = numpy.argwhere(farm.stage == 4)
+        self.assertGreater(len(dead), 10)
+        # Deaths stay around the outbreak
+        self.assertLessEqual(numpy.abs(dead - 20).max(), 10)
+
+    def test_pests_spare_ripe_crops(self):
+        farm = planted_farm(8, fill=1.0)
+        farm.stage[:] = 3  # Harvestable, and staying so for two more days
+        farm.days_grown[:] = GROW_TIME[farm.type_id]
+        farm.watered[:] = farm.fertilized[:] = 10
+        events = SpatialEvents(8, seed=1, outbreak_rate=0, rain_level=2, drought_level=-1)
+        events.pests[:] = 1
+        for _ in range(2):
+            record = events.run_day(farm)
+            self.assertGreater(record['infested'], 0)
+        self.assertTrue((farm.stage == 3).all())
+
+    def test_rain_drought_and_growth_are_local(self):
+        farm = planted_farm(32, fill=1.0)
+        events = SpatialEvents(32, seed=2, outbreak_rate=0)
+        events.clouds[:] = 0.5
+        events.persistence = 1.0  # Keep the hand-made clouds
+        events.wind = (0, 0)
+        events.clouds[:16] = 1.0  # Rain on the top half
+        events.clouds[16:, :8] = 0.0  # Drought in a corner
+        farm.watered[:] = 1
+        record = events.run_day(farm)
+        self.assertEqual(record['rain'], 16 * 32)
+        self.assertEqual(record['drought'], 16 * 8)
+        self.assertTrue((farm.watered[:16] == 2).all())
+        self.assertTrue((farm.watered[16:, :8] == 0).all())
+        self.assertTrue((farm.days_grown[16:, :8] == 0).all())
+        self.assertTrue((farm.days_grown[16:, 8:] == 1).all())
+        self.assertTrue((farm.watered[16:, 8:] == 1).all())
+
+    def test_needs_a_matching_array_farm(self):
+        with self.assertRaises(TypeError):
+            SpatialEvents(8).run_day(ArrayFarm(9))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import unittest
+import harvest_haven as hh
+from harvest_haven_batch import HeadlessGame
+from harvest_haven_term import STATUS_LINES, TerminalRenderer, run_command, status_lines
+
+
+class TestTerminalRenderer(unittest.TestCase):
+    def setUp(self):
+        self.game = HeadlessGame(0, size=50)
+        self.out = io.StringIO()
+        self.renderer = TerminalRenderer(self.game.farm, self.out, lines=24, columns=80)
+
+    def draw(self, message=''):
+        return self.renderer.draw(status_lines(self.game, self.renderer, message))
+
+    def test_first_frame_paints_only_the_viewport(self):
+        self.draw()
+        rows, cols = self.renderer.view_size()
+        self.assertEqual(len(self.renderer.cells), rows * cols)
+        self.assertEqual(self.out.getvalue().count(hh.CATALOG.emoji[0][0]), rows * cols)
+
+    def test_redraw_writes_only_changed_cells(self):
+        full = self.draw()
+        # Nothing changed: just park the cursor on the prompt
+        self.assertEqual(self.renderer.frame(status_lines(self.game, self.renderer)), '\x1b[23;1H\x1b[K')
+        self.game.farm.plant(1, 2, 'Wheat')
+        frame = self.renderer.frame(status_lines(self.game, self.renderer))
+        self.assertIn(f'\x1b[{STATUS_LINES + 2};7H🌱', frame)
+        self.assertLess(len(frame.encode('utf-8')), full // 10)
+
+    def test_changes_outside_the_viewport_write_nothing(self):
+        self.draw()
+        self.game.farm.plant(45, 45, 'Wheat')
+        self.assertNotIn('🌱', self.renderer.frame(status_lines(self.game, self.renderer)))
+        self.renderer.scroll(100, 100)
+        self.assertEqual(self.renderer.viewport()[1], 50)
+        self.assertIn('🌱', self.renderer.frame(status_lines(self.game, self.renderer)))
+
+    def test_status_lines_redraw_when_they_change(self):
+        self.draw()
+        self.assertNotIn('Inventory', self.renderer.frame(status_lines(self.game, self.renderer)))
+        run_command(self.game, self.renderer, 'b Water', 'unused.json')
+        self.assertIn('Inventory', self.renderer.frame(status_lines(self.game, self.renderer)))
+
+    def test_commands_play_the_game(self):
+        self.assertEqual(run_command(self.game, self.renderer, 'p 0 0 Wheat', 'unused.json'),
+                         ('Done at (0,0)', True))
+        self.assertEqual(self.game.farm.grid[0][0].type, 'Wheat')
+        run_command(self.game, self.renderer, 'n', 'unused.json')
+        self.assertEqual(self.game.day, 2)
+        self.assertEqual(self.game.player.energy, 10)
+        self.assertFalse(run_command(self.game, self.renderer, 'q', 'unused.json')[1])
+
+if __name__ == '__main__':
+    unittest.main()
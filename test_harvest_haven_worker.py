@@ -0,0 +1,74 @@
+import threading
+import time
+import unittest
+import harvest_haven as hh
+from harvest_haven_worker import Worker
+
+
+class FakeRoot:
+    # Stands in for root.after: callbacks run when pump() is called, on the
+    # test's (UI) thread
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def pump(self, timeout=5):
+        deadline = time.monotonic() + timeout
+        while self.pending and time.monotonic() < deadline:
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.001)
+
+
+class TestWorker(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.worker = Worker(self.root.after)
+
+    def tearDown(self):
+        self.worker.close(timeout=5)
+
+    def test_result_comes_back_on_the_ui_thread(self):
+        done = []
+        ui_thread = threading.current_thread()
+        self.assertTrue(self.worker.submit(threading.current_thread,
+                                           lambda thread: done.append((thread, threading.current_thread()))))
+        self.root.pump()
+        [(job_thread, callback_thread)] = done
+        self.assertIsNot(job_thread, ui_thread)
+        self.assertIs(callback_thread, ui_thread)
+        self.assertFalse(self.worker.busy)
+
+    def test_rejects_jobs_while_busy(self):
+        release = threading.Event()
+        self.assertTrue(self.worker.submit(release.wait))
+        self.assertTrue(self.worker.busy)
+        self.assertFalse(self.worker.submit(lambda: None))
+        release.set()
+        self.root.pump()
+        self.assertTrue(self.worker.submit(lambda: None))
+        self.root.pump()
+
+    def test_errors_go_to_on_error(self):
+        errors = []
+        self.worker.submit(lambda: 1 / 0, on_error=errors.append)
+        self.root.pump()
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+        self.worker.submit(lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            self.root.pump()
+
+    def test_day_tick_off_the_ui_thread(self):
+        farm = hh.Farm(20)
+        farm.plant(3, 4, 'Wheat')
+        events = hh.EventEngine(seed=1)
+        records = []
+        self.worker.submit(lambda: events.run_day(farm), records.append)
+        self.root.pump()
+        self.assertEqual(records, events.log)
+
+if __name__ == '__main__':
+    unittest.main()